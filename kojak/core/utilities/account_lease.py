@@ -0,0 +1,437 @@
+"""
+Created on October 17, 2026
+
+This module lends account numbers to test workers so that no two workers
+use the same account at the same time, for example to keep velocity checks
+on the host from declining cards that parallel scenarios share. A lease
+manager draws accounts from an AccountNumberGenerator and records each
+lease, with an expiry time, in a SQLite file, so that the managers in every
+thread and process that open the same file honor each other's leases. An
+account returns to circulation when its lease is released or expires.
+"""
+
+import os
+import sqlite3
+import threading
+import time
+from typing import List, Optional
+
+from kojak.core.exceptions import HardException
+from kojak.core.utilities.account_number import (
+    AccountNumber, AccountNumberGenerator)
+
+###############################################################################
+# CONSTANTS
+###############################################################################
+
+# Specifies the default count of accounts that a checkout draws from the
+# generator before it gives up.
+DEFAULT_MAX_ATTEMPTS: int = 100
+
+# Specifies the default time to live, in seconds, of a lease.
+DEFAULT_TTL: float = 300.0
+
+# Specifies how long, in milliseconds, a connection waits for another
+# connection to finish writing the lease file.
+_BUSY_TIMEOUT: int = 10000
+
+# Creates the lease table; the primary key makes every statement a single
+# index lookup.
+_CREATE_TABLE: str = \
+    'CREATE TABLE IF NOT EXISTS leases (' \
+    'account_number TEXT PRIMARY KEY, token TEXT NOT NULL, ' \
+    'expires REAL NOT NULL) WITHOUT ROWID'
+
+# Leases an account unless it holds a lease that has not expired.
+_CHECKOUT: str = \
+    'INSERT INTO leases (account_number, token, expires) VALUES (?, ?, ?) ' \
+    'ON CONFLICT (account_number) DO UPDATE SET ' \
+    'token = excluded.token, expires = excluded.expires ' \
+    'WHERE leases.expires <= ?'
+
+# Counts the leases that have not expired.
+_COUNT: str = 'SELECT COUNT(*) FROM leases WHERE expires > ?'
+
+# Deletes the leases that have expired.
+_PURGE: str = 'DELETE FROM leases WHERE expires <= ?'
+
+# Releases a lease.
+_RELEASE: str = 'DELETE FROM leases WHERE account_number = ? AND token = ?'
+
+# Extends a lease that has not expired.
+_RENEW: str = \
+    'UPDATE leases SET expires = ? ' \
+    'WHERE account_number = ? AND token = ? AND expires > ?'
+
+
+###############################################################################
+# AccountLease
+###############################################################################
+
+
+class AccountLease:
+    """
+    This class represents a lease on an account that an AccountLeaseManager
+    has checked out. Release the lease when you are done with the account,
+    or use the lease as a context manager.
+
+    :param manager: The manager that granted the lease.
+    :param account: The leased account.
+    :param token: The token that identifies the lease.
+    :param expires: The time, in seconds since the epoch, at which the lease
+        expires.
+    """
+
+    ###########################################################################
+    # METHODS
+    ###########################################################################
+
+    # =========================================================================
+    # CONSTRUCTOR
+    # =========================================================================
+
+    def __init__(
+            self, manager: 'AccountLeaseManager', account: AccountNumber,
+            token: str, expires: float):
+
+        self._manager: AccountLeaseManager = manager
+        self._account: AccountNumber = account
+        self._token: str = token
+        self._expires: float = expires
+
+    # =========================================================================
+    # __enter__
+    # =========================================================================
+
+    def __enter__(self) -> 'AccountLease':
+        return self
+
+    # =========================================================================
+    # __exit__
+    # =========================================================================
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.release()
+
+    # =========================================================================
+    # __str__
+    # =========================================================================
+
+    def __str__(self):
+        """
+        Returns a description of this lease.
+        """
+
+        return "{}: '{}' until {}".format(
+            type(self).__name__, self._account.get_masked_number(),
+            time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(self._expires)))
+
+    # =========================================================================
+    # get_account
+    # =========================================================================
+
+    def get_account(self) -> AccountNumber:
+        """
+        Returns the leased account.
+        """
+
+        return self._account
+
+    # =========================================================================
+    # get_expires
+    # =========================================================================
+
+    def get_expires(self) -> float:
+        """
+        Returns the time, in seconds since the epoch, at which the lease
+        expires.
+        """
+
+        return self._expires
+
+    # =========================================================================
+    # is_expired
+    # =========================================================================
+
+    def is_expired(self) -> bool:
+        """
+        Returns TRUE if the lease has expired.
+        """
+
+        return time.time() >= self._expires
+
+    # =========================================================================
+    # release
+    # =========================================================================
+
+    def release(self) -> bool:
+        """
+        Returns the account to circulation. Returns FALSE if the lease had
+        already been released or had expired and been granted to another
+        worker.
+        """
+
+        return self._manager.release(self)
+
+    # =========================================================================
+    # renew
+    # =========================================================================
+
+    def renew(self, ttl: Optional[float] = None) -> bool:
+        """
+        Extends the lease to the specified time from now. Returns FALSE if
+        the lease has been released or has expired.
+
+        :param ttl: The new time to live, in seconds; if you omit this
+            parameter, the method uses the manager's time to live.
+        """
+
+        return self._manager.renew(self, ttl)
+
+
+###############################################################################
+# AccountLeaseManager
+###############################################################################
+
+
+class AccountLeaseManager:
+    """
+    This class checks accounts out of an AccountNumberGenerator for a limited
+    time. Managers in any thread or process that open the same lease file
+    never lease the same account at the same time. Each checkout, release
+    and renewal is one statement on an indexed table, so it takes constant
+    time.
+
+    :param generator: The generator that supplies the accounts; a checkout
+        skips accounts that are leased and draws again.
+    :param path: The path of the SQLite lease file, which the manager
+        creates if it does not exist.
+    :param ttl: The time to live, in seconds, of a lease.
+    :param max_attempts: The count of accounts that a checkout draws from
+        the generator before it gives up; raise this for a fixed pool with
+        many accounts.
+    """
+
+    ###########################################################################
+    # METHODS
+    ###########################################################################
+
+    # =========================================================================
+    # CONSTRUCTOR
+    # =========================================================================
+
+    def __init__(
+            self, generator: AccountNumberGenerator,
+            path: str,
+            ttl: float = DEFAULT_TTL,
+            max_attempts: int = DEFAULT_MAX_ATTEMPTS):
+
+        assert ttl > 0, 'You must provide a ttl > 0'
+        assert max_attempts > 0, 'You must provide a max_attempts > 0'
+
+        self._generator: AccountNumberGenerator = generator
+        self._path: str = path
+        self._ttl: float = ttl
+        self._max_attempts: int = max_attempts
+
+        self._reset()
+
+    # =========================================================================
+    # __enter__
+    # =========================================================================
+
+    def __enter__(self) -> 'AccountLeaseManager':
+        return self
+
+    # =========================================================================
+    # __exit__
+    # =========================================================================
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    # =========================================================================
+    # __str__
+    # =========================================================================
+
+    def __str__(self):
+        """
+        Returns a description of this lease manager.
+        """
+
+        return "{}: leases from {} in '{}'".format(
+            type(self).__name__, self._generator, self._path)
+
+    # =========================================================================
+    # checkout
+    # =========================================================================
+
+    def checkout(self, ttl: Optional[float] = None) -> AccountLease:
+        """
+        Leases the next account from the generator that no other worker has
+        leased.
+
+        :param ttl: The time to live, in seconds, of the lease; if you omit
+            this parameter, the method uses the manager's time to live.
+        :raises HardException: Every account that the generator supplied
+            in **max_attempts** draws was leased.
+        """
+
+        ttl = self._ttl if ttl is None else ttl
+        assert ttl > 0, 'You must provide a ttl > 0'
+
+        connection: sqlite3.Connection = self._get_connection()
+        token: str = os.urandom(8).hex()
+        for _ in range(self._max_attempts):
+            account: AccountNumber = self._generator.get_new_number()
+            now: float = time.time()
+            expires: float = now + ttl
+            cursor = connection.execute(
+                _CHECKOUT, (account.get_account_number(), token, expires, now))
+            if cursor.rowcount:
+                return AccountLease(self, account, token, expires)
+
+        raise HardException(
+            "No account was free in {} draws from {}".format(
+                self._max_attempts, self._generator))
+
+    # =========================================================================
+    # close
+    # =========================================================================
+
+    def close(self) -> None:
+        """
+        Closes every thread's connection to the lease file. Leases that the
+        manager granted remain until they are released or expire. In a
+        forked child, the method leaves the parent's connections open.
+        """
+
+        if self._pid == os.getpid():
+            with self._lock:
+                for connection in self._connections:
+                    connection.close()
+        self._reset()
+
+    # =========================================================================
+    # get_lease_count
+    # =========================================================================
+
+    def get_lease_count(self) -> int:
+        """
+        Returns the count of leases, granted by any manager that shares the
+        lease file, that have not expired.
+        """
+
+        return self._get_connection().execute(
+            _COUNT, (time.time(),)).fetchone()[0]
+
+    # =========================================================================
+    # purge
+    # =========================================================================
+
+    def purge(self) -> int:
+        """
+        Deletes the expired leases from the lease file, which otherwise keeps
+        a row for every account ever leased, and returns the count deleted.
+        """
+
+        return self._get_connection().execute(
+            _PURGE, (time.time(),)).rowcount
+
+    # =========================================================================
+    # release
+    # =========================================================================
+
+    def release(self, lease: AccountLease) -> bool:
+        """
+        Returns a leased account to circulation. Returns FALSE if the lease
+        had already been released or had expired and been granted to
+        another worker.
+
+        :param lease: The lease to release.
+        """
+
+        return bool(self._get_connection().execute(
+            _RELEASE,
+            (lease._account.get_account_number(), lease._token)).rowcount)
+
+    # =========================================================================
+    # renew
+    # =========================================================================
+
+    def renew(self, lease: AccountLease, ttl: Optional[float] = None) -> bool:
+        """
+        Extends a lease to the specified time from now. Returns FALSE if the
+        lease has been released or has expired.
+
+        :param lease: The lease to renew.
+        :param ttl: The new time to live, in seconds; if you omit this
+            parameter, the method uses the manager's time to live.
+        """
+
+        ttl = self._ttl if ttl is None else ttl
+        assert ttl > 0, 'You must provide a ttl > 0'
+
+        now: float = time.time()
+        expires: float = now + ttl
+        renewed: bool = bool(self._get_connection().execute(
+            _RENEW,
+            (expires, lease._account.get_account_number(), lease._token,
+             now)).rowcount)
+        if renewed:
+            lease._expires = expires
+        return renewed
+
+    # =========================================================================
+    # _get_connection
+    # =========================================================================
+
+    def _get_connection(self) -> sqlite3.Connection:
+        """
+        Returns the calling thread's connection to the lease file, opening it
+        if necessary, and creates the lease table on the first connection in
+        each process.
+        """
+
+        # A forked child inherits the parent's connections, which it must
+        # neither use nor close, so it starts over with its own.
+        if self._pid != os.getpid():
+            self._reset()
+
+        connection: Optional[sqlite3.Connection] = getattr(
+            self._local, 'connection', None)
+        if connection is None:
+            # Autocommit mode makes each statement its own transaction. The
+            # write-ahead log lets readers run while a writer commits, and
+            # leases do not need to survive a power failure, so commits
+            # skip the fsync.
+            connection = sqlite3.connect(
+                self._path, timeout=_BUSY_TIMEOUT / 1000,
+                isolation_level=None, check_same_thread=False)
+            connection.execute('PRAGMA journal_mode=WAL')
+            connection.execute('PRAGMA synchronous=OFF')
+            if not self._table_created:
+                connection.execute(_CREATE_TABLE)
+                self._table_created = True
+            self._local.connection = connection
+            with self._lock:
+                self._connections.append(connection)
+        return connection
+
+    # =========================================================================
+    # _reset
+    # =========================================================================
+
+    def _reset(self) -> None:
+        """
+        Forgets every connection so that the calling process opens its own
+        on first use.
+        """
+
+        # SQLite connections must not be shared between threads, so each
+        # thread gets its own connection on first use.
+        self._pid: int = os.getpid()
+        self._local: threading.local = threading.local()
+        self._connections: List[sqlite3.Connection] = []
+        self._lock: threading.Lock = threading.Lock()
+        self._table_created: bool = False
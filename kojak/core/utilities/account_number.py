@@ -5,12 +5,39 @@ Created on February 12, 2017
 """
 
 from abc import ABC, abstractmethod
-from typing import cast, Optional, Tuple
+from array import array
+from collections.abc import MutableSet
+import copy
+import itertools
+import os
+from typing import (
+    cast, Callable, Dict, Iterable, Iterator, List, Optional, Sequence, Set,
+    Tuple, Union)
 import random
+from sys import intern
+from threading import get_ident
+import weakref
 
+from kojak.core.exceptions import HardException
 from kojak.core.test_logger import TestLogger
+from kojak.core.utilities.alias_table import AliasTable
+from kojak.core.utilities.check_digit import (
+    CheckDigitEngine, DAMM, LUHN, MOD97_10, VERHOEFF)
 from kojak.core.utilities.string_library import plural
-from kojak.core.utilities.luhn_algorithm import set_checksum
+from kojak.core.utilities.feistel_permutation import FeistelPermutation
+from kojak.core.utilities.luhn_algorithm import (
+    add_checksum, get_check_digit_batch, set_checksum, LuhnAccumulator)
+
+###############################################################################
+# CONSTANTS
+###############################################################################
+
+# Logs the warnings of every account number.
+_LOGGER: TestLogger = TestLogger()
+
+# Holds the random number generators that no caller seeded, which a forked
+# process reseeds so that it does not repeat its parent's account numbers.
+_UNSEEDED_RANDOMS: 'weakref.WeakSet[random.Random]' = weakref.WeakSet()
 
 
 ###############################################################################
@@ -44,6 +71,10 @@ class AccountNumber:
         card number values that appear in your test log files.
     :param routing_number: An optional routing number to set.
     :param use_bad_cvv: If set to True, ``get_cvv()`` returns a bad CVV.
+
+    To create an account number whose CVVs you may never read, such as one of
+    millions of generated account numbers, call ``create_lazy()``, which
+    leaves the CVVs to be derived the first time you need them.
     """
 
     ###########################################################################
@@ -53,6 +84,17 @@ class AccountNumber:
     # Defines the default length of the Card Verification Value, in digits.
     DEFAULT_CVV_LENGTH: int = 3
 
+    ###########################################################################
+    # SLOTS
+    ###########################################################################
+
+    # Test suites keep millions of account numbers in memory, so instances
+    # hold their attributes in slots rather than in a per-instance __dict__.
+    __slots__ = (
+        '_account_number', '_bank_display_name', '_bank_name', '_cvv',
+        '_cvv_bad', '_cvv_length', '_masker', '_routing_number',
+        '_use_bad_cvv')
+
     ###########################################################################
     # METHODS
     ###########################################################################
@@ -73,12 +115,14 @@ class AccountNumber:
             use_bad_cvv: bool = False):
 
         # Holds the name of the bank associated with this account number;
-        # this name is appropriate for logging in log files.
-        self._bank_display_name: str = bank_display_name or ''
+        # this name is appropriate for logging in log files.  The bank names
+        # and the routing number are interned because many account numbers
+        # share them.
+        self._bank_display_name: str = intern(bank_display_name or '')
 
         # Holds the name of the bank associated with this account number; this
         # name is appropriate for identifying the bank in service requests.
-        self._bank_name: str = bank_name or ''
+        self._bank_name: str = intern(bank_name or '')
 
         # Holds the account number.
         self._account_number: str = account_number or ''
@@ -106,7 +150,7 @@ class AccountNumber:
 
         # Holds the routing number; this applies to bank accounts rather than
         # card accounts.
-        self._routing_number: str = routing_number or ''
+        self._routing_number: str = intern(routing_number or '')
 
         # Determines whether method ``get_cvv()`` should return good or bad
         # card verification values.
@@ -130,6 +174,7 @@ class AccountNumber:
     # =========================================================================
 
     def __str__(self):
+        self._resolve_cvv()
         return (
             "{}: account_number='{}' "
             "bank_display_name='{}' bank_name='{}' "
@@ -147,6 +192,7 @@ class AccountNumber:
     # =========================================================================
 
     def __repr__(self):
+        self._resolve_cvv()
         return (
             "{}('{}', '{}', '{}', '{}', '{}', {}, {}, '{}', {})".format(
                 type(self).__name__, self._account_number,
@@ -159,13 +205,21 @@ class AccountNumber:
     # =========================================================================
 
     def __eq__(self, other):
+        if self is other:
+            return True
         if not isinstance(other, AccountNumber):
             return NotImplemented
 
+        # Most unequal account numbers differ in the account number, so
+        # compare it before deriving the CVVs of lazy account numbers.
         other = cast(AccountNumber, other)
+        if self._account_number != other._account_number:
+            return False
+
+        self._resolve_cvv()
+        other._resolve_cvv()
         return \
-            self._account_number == other._account_number \
-            and self._bank_display_name == other._bank_display_name \
+            self._bank_display_name == other._bank_display_name \
             and self._bank_name == other._bank_name \
             and self._cvv == other._cvv \
             and self._cvv_bad == other._cvv_bad \
@@ -173,6 +227,16 @@ class AccountNumber:
             and self._masker == other._masker \
             and self._routing_number == other._routing_number
 
+    # =========================================================================
+    # __hash__
+    # =========================================================================
+
+    def __hash__(self):
+        # Equal account numbers have equal account number strings, so the
+        # string alone is a consistent hash. Do not change the account number
+        # of an AccountNumber in a set or a dictionary.
+        return hash(self._account_number)
+
     # =========================================================================
     # copy
     # =========================================================================
@@ -182,6 +246,7 @@ class AccountNumber:
         Creates a copy of this AccountNumber.
         """
 
+        self._resolve_cvv()
         return AccountNumber(
             account_number=self._account_number,
             bank_display_name=self._bank_display_name,
@@ -194,6 +259,75 @@ class AccountNumber:
             use_bad_cvv=self._use_bad_cvv
         )
 
+    # =========================================================================
+    # create_lazy
+    # =========================================================================
+
+    @classmethod
+    def create_lazy(
+            cls, account_number: str,
+            bank_display_name: Optional[str] = None,
+            bank_name: Optional[str] = None,
+            cvv_length: int = -1,
+            masker: Optional['AccountNumberMasker'] = None,
+            routing_number: Optional[str] = None) -> 'AccountNumber':
+        """
+        Creates a new account number of this class whose CVV is the last
+        **cvv_length** digits of the account number, like the constructor
+        without a CVV, but defers deriving the CVV and the bad CVV until
+        the first call that needs them, such as ``get_cvv()``. Most
+        generated account numbers never have their CVVs read, so this is
+        much faster than the constructor.
+
+        :param account_number: The account number to set.
+        :param bank_display_name: An optional bank name to appear in your
+            test log files.
+        :param bank_name: An optional bank name that you might include in
+            service requests.
+        :param cvv_length: An optional value specifying the length of the
+            card verification value.
+        :param masker: An optional Masker that knows how to match the masked
+            card number values that appear in your test log files.
+        :param routing_number: An optional routing number to set.
+        """
+
+        return cls._create_lazy(
+            account_number, bank_display_name, bank_name, cvv_length, masker,
+            routing_number)
+
+    # =========================================================================
+    # _create_lazy
+    # =========================================================================
+
+    @classmethod
+    def _create_lazy(
+            cls, account_number: str,
+            bank_display_name: Optional[str] = None,
+            bank_name: Optional[str] = None,
+            cvv_length: int = -1,
+            masker: Optional['AccountNumberMasker'] = None,
+            routing_number: Optional[str] = None) -> 'AccountNumber':
+        """
+        Does the work of ``create_lazy()`` without applying the check digits
+        of a subclass.
+        """
+
+        account_number = account_number or ''
+        if cvv_length < 0:
+            cvv_length = min(cls.DEFAULT_CVV_LENGTH, len(account_number))
+
+        account = cls.__new__(cls)
+        account._account_number = account_number
+        account._bank_display_name = intern(bank_display_name or '')
+        account._bank_name = intern(bank_name or '')
+        account._cvv = None
+        account._cvv_bad = None
+        account._cvv_length = min(cvv_length, len(account_number))
+        account._masker = masker
+        account._routing_number = intern(routing_number or '')
+        account._use_bad_cvv = False
+        return account
+
     # =========================================================================
     # get_account_number
     # =========================================================================
@@ -243,6 +377,7 @@ class AccountNumber:
         account number.
         """
 
+        self._resolve_cvv()
         return self._cvv_bad if self._use_bad_cvv else self._cvv
 
     # =========================================================================
@@ -255,6 +390,7 @@ class AccountNumber:
         account number.
         """
 
+        self._resolve_cvv()
         return self._cvv_bad
 
     # =========================================================================
@@ -354,6 +490,24 @@ class AccountNumber:
         else:
             return cvv
 
+    # =========================================================================
+    # _resolve_cvv
+    # =========================================================================
+
+    def _resolve_cvv(self) -> None:
+        """
+        Derives the CVV and the bad CVV of an account number made by
+        ``create_lazy()``, if they have not been derived yet.
+        """
+
+        if self._cvv is not None:
+            return
+
+        length: int = self._cvv_length
+        self.set_cvv(
+            self._account_number[len(self._account_number) - length:]
+            if length > 0 else '')
+
     # =========================================================================
     # set_account_number
     # =========================================================================
@@ -398,9 +552,9 @@ class AccountNumber:
                 # cvv_bad = cvv + 1
                 cvv_bad = self._normalize_cvv(str(int(cvv) + 1), cvv_length)
             except ValueError:
-                TestLogger().warn(
+                _LOGGER.warn(
                     "Exception encountered trying to create the bad CVV "
-                    "for '%s'".format(cvv))
+                    "for '{}'".format(cvv))
 
         self._cvv = cvv
         self._cvv_bad = cvv_bad
@@ -416,7 +570,8 @@ class AccountNumber:
         :param routing_number: The routing number to set.
         """
 
-        self._routing_number = routing_number
+        self._routing_number = \
+            intern(routing_number) if routing_number else routing_number
 
     # =========================================================================
     # use_bad_cvv
@@ -435,21 +590,24 @@ class AccountNumber:
 
 
 ###############################################################################
-# AccountNumberLuhn
+# AccountNumberCheckDigit
 ###############################################################################
 
 
-class AccountNumberLuhn(AccountNumber):
+class AccountNumberCheckDigit(AccountNumber):
     """
     This class represents a credit-card or bank account number and associated
     numbers, such as card verification value and routing number, where the
-    account number must pass the LUHN check.
+    account number must pass the check of a check-digit algorithm.
 
-    Creates a new AccountNumberLuhn with the given values.  The method assigns
-    the value of <b>cvv</b> plus one as the bad CVV.
+    Subclasses select the algorithm by setting ``CHECK_DIGIT_ENGINE`` to one
+    of the engines in the ``check_digit`` module; the base class uses LUHN.
+
+    Creates a new AccountNumberCheckDigit with the given values.  The method
+    assigns the value of <b>cvv</b> plus one as the bad CVV.
 
     :param account_number: The account number to set. You must supply all
-        digits including a stand-in for the LUHN checksum; the constructor
+        digits including a stand-in for the check digits; the constructor
         will recalculate the checksum.
     :param bank_display_name: An optional bank name to appear in your test
         log files.
@@ -470,6 +628,15 @@ class AccountNumberLuhn(AccountNumber):
     :param use_bad_cvv: If set to True, ``get_cvv()`` returns a bad CVV.
     """
 
+    ###########################################################################
+    # CONSTANTS
+    ###########################################################################
+
+    # The check-digit algorithm that account numbers of this class pass.
+    CHECK_DIGIT_ENGINE: CheckDigitEngine = LUHN
+
+    __slots__ = ()
+
     ###########################################################################
     # METHODS
     ###########################################################################
@@ -489,8 +656,143 @@ class AccountNumberLuhn(AccountNumber):
             routing_number: Optional[str] = None,
             use_bad_cvv: bool = False):
         super().__init__(
-            set_checksum(account_number), bank_display_name, bank_name,
-            cvv, cvv_bad, cvv_length, masker, routing_number, use_bad_cvv)
+            self.CHECK_DIGIT_ENGINE.set_checksum(account_number),
+            bank_display_name, bank_name, cvv, cvv_bad, cvv_length, masker,
+            routing_number, use_bad_cvv)
+
+    # =========================================================================
+    # create_lazy
+    # =========================================================================
+
+    @classmethod
+    def create_lazy(
+            cls, account_number: str,
+            bank_display_name: Optional[str] = None,
+            bank_name: Optional[str] = None,
+            cvv_length: int = -1,
+            masker: Optional['AccountNumberMasker'] = None,
+            routing_number: Optional[str] = None) -> 'AccountNumber':
+        """
+        Creates a new account number of this class, applying its check
+        digits as the constructor does, whose CVVs are derived on first
+        use; see ``AccountNumber.create_lazy()``.
+        """
+
+        return cls._create_lazy(
+            cls.CHECK_DIGIT_ENGINE.set_checksum(account_number),
+            bank_display_name, bank_name, cvv_length, masker, routing_number)
+
+    # =========================================================================
+    # _create_with_checksum
+    # =========================================================================
+
+    @classmethod
+    def _create_with_checksum(
+            cls, account_number: str, **kwargs) -> 'AccountNumberCheckDigit':
+        """
+        Creates a new account number of this class from an account number
+        whose check digits are already correct, skipping the recalculation
+        that the constructor performs.
+
+        :param account_number: The account number, including correct check
+            digits.
+        :param kwargs: The remaining constructor arguments.
+        """
+
+        account = cls.__new__(cls)
+        AccountNumber.__init__(account, account_number, **kwargs)
+        return account
+
+
+###############################################################################
+# AccountNumberLuhn
+###############################################################################
+
+
+class AccountNumberLuhn(AccountNumberCheckDigit):
+    """
+    This class represents a credit-card or bank account number and associated
+    numbers, such as card verification value and routing number, where the
+    account number must pass the LUHN check.
+
+    Creates a new AccountNumberLuhn with the given values.  The method assigns
+    the value of <b>cvv</b> plus one as the bad CVV.
+
+    :param account_number: The account number to set. You must supply all
+        digits including a stand-in for the LUHN checksum; the constructor
+        will recalculate the checksum.
+    :param bank_display_name: An optional bank name to appear in your test
+        log files.
+    :param bank_name: An optional bank name that you might include
+        in service requests.
+    :param cvv: An optional card verification value; if you omit this
+        parameter, the cvv is set to the last three digits of the
+        account number.
+    :param cvv_bad: The CVV to use when ``use_bad_cvv=True``; if you omit
+        this parameter, the bad cvv is set to the value of cvv+1, wrapped
+        to zero if necessary.
+    :param cvv_length: An optional value specifying the length of the card
+        verification value. If you also specify cvv then cvv_length
+        is ignored.
+    :param masker: An optional Masker that knows how to match the masked
+        card number values that appear in your test log files.
+    :param routing_number: An optional routing number to set.
+    :param use_bad_cvv: If set to True, ``get_cvv()`` returns a bad CVV.
+    """
+
+    __slots__ = ()
+
+    CHECK_DIGIT_ENGINE: CheckDigitEngine = LUHN
+
+
+###############################################################################
+# AccountNumberVerhoeff
+###############################################################################
+
+
+class AccountNumberVerhoeff(AccountNumberCheckDigit):
+    """
+    This class represents an account number that must pass the Verhoeff
+    check. The constructor takes the same parameters as AccountNumberLuhn.
+    """
+
+    __slots__ = ()
+
+    CHECK_DIGIT_ENGINE: CheckDigitEngine = VERHOEFF
+
+
+###############################################################################
+# AccountNumberDamm
+###############################################################################
+
+
+class AccountNumberDamm(AccountNumberCheckDigit):
+    """
+    This class represents an account number that must pass the Damm check.
+    The constructor takes the same parameters as AccountNumberLuhn.
+    """
+
+    __slots__ = ()
+
+    CHECK_DIGIT_ENGINE: CheckDigitEngine = DAMM
+
+
+###############################################################################
+# AccountNumberMod97
+###############################################################################
+
+
+class AccountNumberMod97(AccountNumberCheckDigit):
+    """
+    This class represents an account number that must pass the ISO 7064
+    mod 97-10 check, whose two check digits end the account number. The
+    constructor takes the same parameters as AccountNumberLuhn, where the
+    account number includes stand-ins for both check digits.
+    """
+
+    __slots__ = ()
+
+    CHECK_DIGIT_ENGINE: CheckDigitEngine = MOD97_10
 
 
 ###############################################################################
@@ -507,6 +809,8 @@ class AccountNumberMasker:
     log files so that your log files can be verified.
     """
 
+    __slots__ = ('_first_m', '_last_n', '_mask_character')
+
     ###########################################################################
     # METHODS
     ###########################################################################
@@ -570,6 +874,27 @@ class AccountNumberMasker:
             and self._last_n == other._last_n \
             and self._mask_character == other._mask_character
 
+    # =========================================================================
+    # __hash__
+    # =========================================================================
+
+    def __hash__(self):
+        return hash((self._first_m, self._last_n, self._mask_character))
+
+    # =========================================================================
+    # get_clear_digits
+    # =========================================================================
+
+    def get_clear_digits(self) -> Tuple[int, int]:
+        """
+        Returns the counts of leading and trailing digits that
+        ``mask_number()`` leaves in clear text. AccountNumberIndex keys
+        account numbers by these digits, so a subclass that overrides
+        ``mask_number()`` must override this method to match.
+        """
+
+        return self._first_m, self._last_n
+
     # =========================================================================
     # mask_number
     # =========================================================================
@@ -597,14 +922,25 @@ class AccountNumberMasker:
 
 
 ###############################################################################
-# AccountNumberGenerator
+# AccountNumberBatch
 ###############################################################################
 
 
-class AccountNumberGenerator(ABC):
+class AccountNumberBatch:
     """
-    This base class generates a random AccountNumber using rules
-    that a subclass provides.
+    This class holds many account numbers column by column, which takes a
+    fraction of the memory of a list of AccountNumber objects. The account
+    numbers, CVVs, and bad CVVs are stored in fixed-width byte arrays; the
+    bank names, maskers, routing numbers, and classes, which many account
+    numbers share, are stored once in small tables and referenced by index.
+
+    Indexing a batch returns a new AccountNumber, of the class of the stored
+    account number, made from the columns on demand; changing it does not
+    change the batch, but you may store it back with ``batch[i] = x``.
+    Slicing a batch returns a new batch.
+
+    :param account_numbers: An optional iterable of AccountNumbers to add to
+        the batch.
     """
 
     ###########################################################################
@@ -612,125 +948,1039 @@ class AccountNumberGenerator(ABC):
     ###########################################################################
 
     # =========================================================================
-    # get_new_number
+    # CONSTRUCTOR
     # =========================================================================
 
-    @abstractmethod
-    def get_new_number(self) -> AccountNumber:
-        """
-        Returns an account number based on the rules of the subclass.
-        """
-
-        raise NotImplementedError()
+    def __init__(self, account_numbers: Iterable[AccountNumber] = ()):
 
+        self._account_numbers: _FixedWidthColumn = _FixedWidthColumn()
+        self._cvvs: _FixedWidthColumn = _FixedWidthColumn()
+        self._cvvs_bad: _FixedWidthColumn = _FixedWidthColumn()
+        self._cvv_lengths: array = array('H')
+        self._use_bad_cvvs: bytearray = bytearray()
+        self._bank_display_names: _TableColumn = _TableColumn()
+        self._bank_names: _TableColumn = _TableColumn()
+        self._routing_numbers: _TableColumn = _TableColumn()
 
-###############################################################################
-# AccountNumberGeneratorFixed
-###############################################################################
+        # Maskers of different classes can compare equal yet mask
+        # differently, so the table keys them by class as well as by value.
+        self._maskers: _TableColumn = _TableColumn(lambda _: (type(_), _))
+        self._classes: _TableColumn = _TableColumn()
 
+        self.extend(account_numbers)
 
-class AccountNumberGeneratorFixed(AccountNumberGenerator):
-    """
-    This class returns an AccountNumber, round robin, from a fixed list
-    of account numbers.
+    # =========================================================================
+    # __getitem__
+    # =========================================================================
 
-    :param numbers: The list of account numbers to draw from.
-    """
+    def __getitem__(self, index: Union[int, slice]):
+        if isinstance(index, slice):
+            return self._take(range(len(self))[index])
 
-    ###########################################################################
-    # METHODS
-    ###########################################################################
+        index = range(len(self))[index]
+        cls = self._classes.get(index)
+        account = cls.__new__(cls)
+        account._account_number = self._account_numbers.get(index)
+        account._bank_display_name = self._bank_display_names.get(index)
+        account._bank_name = self._bank_names.get(index)
+        account._cvv = self._cvvs.get(index)
+        account._cvv_bad = self._cvvs_bad.get(index)
+        account._cvv_length = self._cvv_lengths[index]
+        account._masker = self._maskers.get(index)
+        account._routing_number = self._routing_numbers.get(index)
+        account._use_bad_cvv = bool(self._use_bad_cvvs[index])
+        return account
 
     # =========================================================================
-    # CONSTRUCTOR
+    # __iter__
     # =========================================================================
 
-    def __init__(self, numbers: Tuple[AccountNumber, ...]):
+    def __iter__(self) -> Iterator[AccountNumber]:
+        return map(self.__getitem__, range(len(self)))
 
-        assert numbers, 'You must provide at least one account number'
+    # =========================================================================
+    # __len__
+    # =========================================================================
 
-        self._numbers = numbers
+    def __len__(self):
+        return len(self._use_bad_cvvs)
 
-        # Each time the class returns a number, the class selects the next
-        # number from the list of numbers using round-robin selection. This
-        # variable keeps track of the next number to select.
-        self._next_number: int = 0
+    # =========================================================================
+    # __setitem__
+    # =========================================================================
+
+    def __setitem__(self, index: int, account_number: AccountNumber):
+        index = range(len(self))[index]
+        account_number._resolve_cvv()
+        self._account_numbers.set(index, account_number._account_number)
+        self._cvvs.set(index, account_number._cvv)
+        self._cvvs_bad.set(index, account_number._cvv_bad)
+        self._cvv_lengths[index] = account_number._cvv_length
+        self._use_bad_cvvs[index] = account_number._use_bad_cvv
+        self._bank_display_names.set(
+            index, account_number._bank_display_name)
+        self._bank_names.set(index, account_number._bank_name)
+        self._routing_numbers.set(index, account_number._routing_number)
+        self._maskers.set(index, account_number._masker)
+        self._classes.set(index, type(account_number))
 
     # =========================================================================
     # __str__
     # =========================================================================
 
     def __str__(self):
+        return "{}: {}".format(
+            type(self).__name__,
+            plural(len(self), '0', 'account number', 'account numbers'))
+
+    # =========================================================================
+    # append
+    # =========================================================================
+
+    def append(self, account_number: AccountNumber) -> None:
         """
-        Returns a description of this account number generator.
+        Adds an account number to the end of the batch.
+
+        :param account_number: The AccountNumber to add.
         """
 
-        entries = plural(len(self._numbers), '', 'number', 'numbers')
-        return "{}: {} starting with '{}'".format(
-            type(self).__name__, entries,
-            self._numbers[0].get_account_number())
+        account_number._resolve_cvv()
+        count: int = len(self)
+        try:
+            self._account_numbers.append(account_number._account_number)
+            self._cvvs.append(account_number._cvv)
+            self._cvvs_bad.append(account_number._cvv_bad)
+            self._cvv_lengths.append(account_number._cvv_length)
+            self._bank_display_names.append(account_number._bank_display_name)
+            self._bank_names.append(account_number._bank_name)
+            self._routing_numbers.append(account_number._routing_number)
+            self._maskers.append(account_number._masker)
+            self._classes.append(type(account_number))
+            self._use_bad_cvvs.append(account_number._use_bad_cvv)
+        except BaseException:
+            self._truncate(count)
+            raise
 
     # =========================================================================
-    # get_new_number
+    # extend
     # =========================================================================
 
-    def get_new_number(self) -> Optional[AccountNumber]:
+    def extend(self, account_numbers: Iterable[AccountNumber]) -> None:
         """
-        Returns the next number in the round-robin sequence.
-        Will return None if the pool happens to be empty.
+        Adds account numbers to the end of the batch.
+
+        :param account_numbers: An iterable of AccountNumbers to add.
         """
 
-        if self._numbers:
-            number = self._numbers[self._next_number]
-            self._next_number += 1
-            if self._next_number >= len(self._numbers):
-                self._next_number = 0
-            return number
+        for account_number in account_numbers:
+            self.append(account_number)
 
-        return None
+    # =========================================================================
+    # get_account_numbers
+    # =========================================================================
 
+    def get_account_numbers(self) -> List[str]:
+        """
+        Returns the account number column.
+        """
 
-###############################################################################
-# AccountNumberGeneratorRandom
-###############################################################################
+        return self._account_numbers.get_all()
 
+    # =========================================================================
+    # get_bank_display_names
+    # =========================================================================
 
-class AccountNumberGeneratorRandom(AccountNumberGenerator):
-    """
-    This class generates a random AccountNumber.
+    def get_bank_display_names(self) -> List[str]:
+        """
+        Returns the bank display name column.
+        """
 
-    :param length: The final length of the account number.
-    :param bank_display_name: Specifies the name of the bank associated
-        with this account number; this name is appropriate for logging
-        in log files.
-    :param bank_name: Specifies name of the bank associated with this
-        account number; this name is appropriate for identifying the bank
-        in service requests.
-    :param cvv_length: The length of the CVV.
-    :param masker: Specifies the AccountNumberMasker that knows how to mask
-        the account number. For PCI compliance you must mask account
-        numbers that appear in log files and this masker knows how
-        to mimic what appears in your test log files.
-    :param routing_number: Specifies the routing number.
-    :param prefixes: A tuple of prefixes that start account numbers.
-    """
+        return self._bank_display_names.get_all()
 
-    ###########################################################################
-    # METHODS
-    ###########################################################################
+    # =========================================================================
+    # get_bank_names
+    # =========================================================================
+
+    def get_bank_names(self) -> List[str]:
+        """
+        Returns the bank name column.
+        """
+
+        return self._bank_names.get_all()
 
     # =========================================================================
-    # CONSTRUCTOR
+    # get_cvvs
     # =========================================================================
 
-    def __init__(
-            self, length: int,
-            bank_display_name: Optional[str],
-            bank_name: Optional[str],
-            cvv_length: int,
+    def get_cvvs(self) -> List[str]:
+        """
+        Returns the column of what ``get_cvv()`` returns for each account
+        number: the bad CVV where ``use_bad_cvv`` is set, the CVV elsewhere.
+        """
+
+        return [
+            cvv_bad if use_bad_cvv else cvv for cvv, cvv_bad, use_bad_cvv
+            in zip(self._cvvs.get_all(), self._cvvs_bad.get_all(),
+                   self._use_bad_cvvs)]
+
+    # =========================================================================
+    # get_cvvs_bad
+    # =========================================================================
+
+    def get_cvvs_bad(self) -> List[str]:
+        """
+        Returns the bad CVV column.
+        """
+
+        return self._cvvs_bad.get_all()
+
+    # =========================================================================
+    # get_masked_numbers
+    # =========================================================================
+
+    def get_masked_numbers(self) -> List[str]:
+        """
+        Returns the column of what ``get_masked_number()`` returns for each
+        account number.
+        """
+
+        return [
+            account_number if masker is None
+            else masker.mask_number(account_number)
+            for account_number, masker
+            in zip(self._account_numbers.get_all(), self._maskers.get_all())]
+
+    # =========================================================================
+    # get_routing_numbers
+    # =========================================================================
+
+    def get_routing_numbers(self) -> List[str]:
+        """
+        Returns the routing number column.
+        """
+
+        return self._routing_numbers.get_all()
+
+    # =========================================================================
+    # to_list
+    # =========================================================================
+
+    def to_list(self) -> List[AccountNumber]:
+        """
+        Returns a list of new AccountNumbers made from the batch.
+        """
+
+        return list(self)
+
+    # =========================================================================
+    # _extend_with_strings
+    # =========================================================================
+
+    def _extend_with_strings(
+            self, cls: type, account_numbers: List[str],
+            bank_display_name: Optional[str], bank_name: Optional[str],
+            cvv_length: int, masker: Optional['AccountNumberMasker'],
+            routing_number: Optional[str]) -> None:
+        """
+        Adds account numbers of the specified class, made from account number
+        strings and constructor arguments, without making the AccountNumber
+        objects. The CVVs are the trailing digits of the account numbers, as
+        the constructor computes them.
+
+        :param cls: AccountNumber or one of its subclasses.
+        :param account_numbers: The account number strings, with correct
+            check digits, if any.
+        :param bank_display_name: The constructor argument.
+        :param bank_name: The constructor argument.
+        :param cvv_length: The constructor argument.
+        :param masker: The constructor argument.
+        :param routing_number: The constructor argument.
+        """
+
+        joined: str = ''.join(account_numbers)
+        if not account_numbers or not (joined.isascii() and joined.isdigit()):
+            for account_number in account_numbers:
+                account = cls.__new__(cls)
+                AccountNumber.__init__(
+                    account, account_number, bank_display_name, bank_name,
+                    None, None, cvv_length, masker, routing_number)
+                self.append(account)
+            return
+
+        # Let the constructor decide the CVV length of the first account
+        # number of each length, then take the CVVs of the others to match.
+        cvv_lengths: Dict[int, int] = {}
+        for account_number in account_numbers:
+            length: int = len(account_number)
+            if length not in cvv_lengths:
+                cvv_lengths[length] = AccountNumber(
+                    account_number, cvv_length=cvv_length).get_cvv_length()
+
+        if len(cvv_lengths) == 1:
+            start: int = length - cvv_lengths[length]
+            cvvs: List[str] = [_[start:] for _ in account_numbers]
+        else:
+            cvvs = [_[len(_) - cvv_lengths[len(_)]:] for _ in account_numbers]
+
+        # Compute the bad CVV once for each distinct CVV.
+        cvvs_bad: Dict[str, str] = {
+            _: str((int(_) + 1) % 10 ** len(_)).zfill(len(_)) if _ else ''
+            for _ in set(cvvs)}
+
+        count: int = len(account_numbers)
+        old_count: int = len(self)
+        try:
+            self._account_numbers.extend(account_numbers)
+            self._cvvs.extend(cvvs)
+            self._cvvs_bad.extend(list(map(cvvs_bad.__getitem__, cvvs)))
+            self._cvv_lengths.extend(map(len, cvvs))
+            self._bank_display_names.extend_repeated(
+                intern(bank_display_name or ''), count)
+            self._bank_names.extend_repeated(intern(bank_name or ''), count)
+            self._routing_numbers.extend_repeated(
+                intern(routing_number or ''), count)
+            self._maskers.extend_repeated(masker, count)
+            self._classes.extend_repeated(cls, count)
+            self._use_bad_cvvs.extend(bytes(count))
+        except BaseException:
+            self._truncate(old_count)
+            raise
+
+    # =========================================================================
+    # _take
+    # =========================================================================
+
+    def _take(self, indexes: range) -> 'AccountNumberBatch':
+        """
+        Returns a new batch of the account numbers at the specified indexes.
+
+        :param indexes: The indexes to take.
+        """
+
+        batch = AccountNumberBatch()
+        batch._account_numbers = self._account_numbers.take(indexes)
+        batch._cvvs = self._cvvs.take(indexes)
+        batch._cvvs_bad = self._cvvs_bad.take(indexes)
+        batch._cvv_lengths = array('H', map(
+            self._cvv_lengths.__getitem__, indexes))
+        batch._use_bad_cvvs = bytearray(map(
+            self._use_bad_cvvs.__getitem__, indexes))
+        batch._bank_display_names = self._bank_display_names.take(indexes)
+        batch._bank_names = self._bank_names.take(indexes)
+        batch._routing_numbers = self._routing_numbers.take(indexes)
+        batch._maskers = self._maskers.take(indexes)
+        batch._classes = self._classes.take(indexes)
+        return batch
+
+    # =========================================================================
+    # _truncate
+    # =========================================================================
+
+    def _truncate(self, count: int) -> None:
+        """
+        Drops every row after the specified count from every column, undoing
+        an append or extend that failed part of the way through.
+
+        :param count: The count of rows to keep.
+        """
+
+        self._account_numbers.truncate(count)
+        self._cvvs.truncate(count)
+        self._cvvs_bad.truncate(count)
+        del self._cvv_lengths[count:]
+        del self._use_bad_cvvs[count:]
+        self._bank_display_names.truncate(count)
+        self._bank_names.truncate(count)
+        self._routing_numbers.truncate(count)
+        self._maskers.truncate(count)
+        self._classes.truncate(count)
+
+
+class _FixedWidthColumn:
+    """
+    This class holds a column of short ASCII strings in one byte array, each
+    string padded to the width of the longest string.
+    """
+
+    def __init__(self):
+        self._data: bytearray = bytearray()
+        self._lengths: array = array('H')
+        self._width: int = 0
+
+    def append(self, value: str) -> None:
+        data: bytes = value.encode('ascii')
+        if len(data) > self._width:
+            self._widen(len(data))
+        self._data += data.ljust(self._width, b'\0')
+        self._lengths.append(len(data))
+
+    def extend(self, values: List[str]) -> None:
+        lengths: Set[int] = set(map(len, values))
+        width: int = max(lengths, default=0)
+        if width > self._width:
+            self._widen(width)
+        if lengths <= {self._width}:
+            self._data += ''.join(values).encode('ascii')
+            self._lengths.extend(array('H', [width]) * len(values))
+        else:
+            for value in values:
+                self.append(value)
+
+    def get(self, index: int) -> str:
+        start: int = index * self._width
+        return self._data[start:start + self._lengths[index]].decode('ascii')
+
+    def get_all(self) -> List[str]:
+        return list(map(self.get, range(len(self._lengths))))
+
+    def set(self, index: int, value: str) -> None:
+        data: bytes = value.encode('ascii')
+        if len(data) > self._width:
+            self._widen(len(data))
+        start: int = index * self._width
+        self._data[start:start + self._width] = data.ljust(self._width, b'\0')
+        self._lengths[index] = len(data)
+
+    def take(self, indexes: range) -> '_FixedWidthColumn':
+        column = _FixedWidthColumn()
+        width: int = self._width
+        column._width = width
+        if indexes.step == 1:
+            column._data = self._data[indexes.start * width:
+                                      indexes.stop * width]
+        else:
+            column._data = bytearray().join(
+                self._data[_ * width:(_ + 1) * width] for _ in indexes)
+        column._lengths = array('H', map(self._lengths.__getitem__, indexes))
+        return column
+
+    def truncate(self, count: int) -> None:
+        del self._data[count * self._width:]
+        del self._lengths[count:]
+
+    def _widen(self, width: int) -> None:
+        old: int = self._width
+        self._data = bytearray().join(
+            self._data[_:_ + old].ljust(width, b'\0')
+            for _ in range(0, len(self._data), old)) if old else \
+            bytearray(width * len(self._lengths))
+        self._width = width
+
+
+class _TableColumn:
+    """
+    This class holds a column of values that many rows share by storing each
+    distinct value once in a table and each row as an index into the table.
+
+    :param key: A function that returns the table key of a value; values
+        with equal keys share one table entry.
+    """
+
+    def __init__(self, key: Callable[[object], object] = lambda _: _):
+        self._key: Callable[[object], object] = key
+        self._values: List[object] = []
+        self._table: Dict[object, int] = {}
+        self._indexes: array = array('H')
+
+    # Each method gets the table index before it reads self._indexes, since
+    # getting the index may replace the array with a wider one.
+
+    def append(self, value: object) -> None:
+        table_index: int = self._get_table_index(value)
+        self._indexes.append(table_index)
+
+    def extend_repeated(self, value: object, count: int) -> None:
+        table_index: int = self._get_table_index(value)
+        self._indexes.extend(
+            array(self._indexes.typecode, [table_index]) * count)
+
+    def get(self, index: int):
+        return self._values[self._indexes[index]]
+
+    def get_all(self) -> list:
+        return list(map(self._values.__getitem__, self._indexes))
+
+    def set(self, index: int, value: object) -> None:
+        table_index: int = self._get_table_index(value)
+        self._indexes[index] = table_index
+
+    def truncate(self, count: int) -> None:
+        del self._indexes[count:]
+
+    def take(self, indexes: range) -> '_TableColumn':
+        column = _TableColumn(self._key)
+        column._values = self._values.copy()
+        column._table = self._table.copy()
+        column._indexes = array(
+            self._indexes.typecode, map(self._indexes.__getitem__, indexes))
+        return column
+
+    def _get_table_index(self, value: object) -> int:
+        key = self._key(value)
+        table_index: Optional[int] = self._table.get(key)
+        if table_index is None:
+            table_index = self._table[key] = len(self._values)
+            self._values.append(value)
+
+            # Switch to wider indexes once the table outgrows short ones.
+            if table_index == 0x10000:
+                self._indexes = array('L', self._indexes)
+        return table_index
+
+
+###############################################################################
+# AccountNumberIndex
+###############################################################################
+
+
+class AccountNumberIndex:
+    """
+    This class finds the account numbers that a masked account number, such
+    as one in a log file, may stand for. It keys each account number by the
+    digits that a masker leaves clear and by its length, so a lookup takes
+    constant time however many account numbers the index holds. The key
+    ignores the mask characters, so '4588********9190' and '4588XXXXXXXX9190'
+    find the same account numbers.
+
+    Add account numbers as generators create them, for example with
+    ``index.extend(generator.get_new_numbers(1000))``.
+
+    :param masker: The masker whose clear digits, as its
+        ``get_clear_digits()`` reports them, key the index; this must
+        leave as many digits clear as the masker that produced the masked
+        account numbers you look up. If you omit this parameter, the index
+        uses the default AccountNumberMasker.
+    :param account_numbers: The account numbers to add.
+    """
+
+    ###########################################################################
+    # METHODS
+    ###########################################################################
+
+    # =========================================================================
+    # CONSTRUCTOR
+    # =========================================================================
+
+    def __init__(
+            self, masker: Optional[AccountNumberMasker] = None,
+            account_numbers: Iterable[AccountNumber] = ()):
+
+        self._masker: AccountNumberMasker = masker or AccountNumberMasker()
+        masker_class: type = type(self._masker)
+        assert masker_class.mask_number is AccountNumberMasker.mask_number \
+            or masker_class.get_clear_digits \
+            is not AccountNumberMasker.get_clear_digits, \
+            'You must provide a masker that overrides get_clear_digits() ' \
+            'if it overrides mask_number()'
+
+        # Holds the counts of leading and trailing digits that key the index.
+        self._first_m: int
+        self._last_n: int
+        self._first_m, self._last_n = self._masker.get_clear_digits()
+        self._count: int = 0
+
+        # Holds the account numbers by key; most keys have one.
+        self._account_numbers: Dict[
+            Tuple[str, str, int], List[AccountNumber]] = {}
+
+        self.extend(account_numbers)
+
+    # =========================================================================
+    # __len__
+    # =========================================================================
+
+    def __len__(self):
+        return self._count
+
+    # =========================================================================
+    # __str__
+    # =========================================================================
+
+    def __str__(self):
+        return "{}: {} under {} keys".format(
+            type(self).__name__,
+            plural(self._count, '0', 'account number', 'account numbers'),
+            len(self._account_numbers))
+
+    # =========================================================================
+    # add
+    # =========================================================================
+
+    def add(self, account_number: AccountNumber) -> None:
+        """
+        Adds an account number to the index.
+
+        :param account_number: The account number to add.
+        """
+
+        key = self._get_key(account_number.get_account_number())
+        self._account_numbers.setdefault(key, []).append(account_number)
+        self._count += 1
+
+    # =========================================================================
+    # extend
+    # =========================================================================
+
+    def extend(self, account_numbers: Iterable[AccountNumber]) -> None:
+        """
+        Adds account numbers to the index.
+
+        :param account_numbers: The account numbers to add, such as a list
+            or an AccountNumberBatch.
+        """
+
+        for account_number in account_numbers:
+            self.add(account_number)
+
+    # =========================================================================
+    # find
+    # =========================================================================
+
+    def find(self, masked_number: str) -> List[AccountNumber]:
+        """
+        Returns the account numbers that a masked account number may stand
+        for, in the order added, or an empty list if there are none.
+
+        :param masked_number: The masked account number.
+        """
+
+        return list(self._account_numbers.get(
+            self._get_key(masked_number), ()))
+
+    # =========================================================================
+    # get_masker
+    # =========================================================================
+
+    def get_masker(self) -> AccountNumberMasker:
+        """
+        Returns the masker whose clear digits key the index.
+        """
+
+        return self._masker
+
+    # =========================================================================
+    # remove
+    # =========================================================================
+
+    def remove(self, account_number: AccountNumber) -> bool:
+        """
+        Removes an account number, equal to the one specified, from the
+        index. Returns FALSE if the index does not hold one.
+
+        :param account_number: The account number to remove.
+        """
+
+        key = self._get_key(account_number.get_account_number())
+        candidates: Optional[List[AccountNumber]] = \
+            self._account_numbers.get(key)
+        if not candidates or account_number not in candidates:
+            return False
+
+        candidates.remove(account_number)
+        if not candidates:
+            del self._account_numbers[key]
+        self._count -= 1
+        return True
+
+    # =========================================================================
+    # _get_key
+    # =========================================================================
+
+    def _get_key(self, number: str) -> Tuple[str, str, int]:
+        """
+        Returns the key of an account number or masked account number: the
+        leading and trailing digits that the masker leaves clear, and the
+        length.
+
+        :param number: The account number or masked account number.
+        """
+
+        first_m: int = self._first_m
+        last_n: int = self._last_n
+        if len(number) <= first_m + last_n:
+            return number, '', len(number)
+        return number[:first_m], number[len(number) - last_n:], len(number)
+
+
+###############################################################################
+# AccountNumberSet
+###############################################################################
+
+
+class AccountNumberSet(MutableSet):
+    """
+    This class holds a set of account numbers, at most one per account
+    number string, and finds them in constant time by account number, by
+    last N digits, or by masked form. It supports the operations of a
+    Python set, such as ``in``, ``|`` and ``-``. The account number string
+    is the key: the set holds an account number if it holds one with the
+    same account number string, whatever the other fields.
+
+    :param account_numbers: The account numbers to add.
+    :param last_n: The count of trailing digits that ``find_by_last_n()``
+        looks up; the default is 4.
+    :param masker: The masker whose clear digits key
+        ``find_by_masked_number()``; see AccountNumberIndex.
+    """
+
+    ###########################################################################
+    # METHODS
+    ###########################################################################
+
+    # =========================================================================
+    # CONSTRUCTOR
+    # =========================================================================
+
+    def __init__(
+            self, account_numbers: Iterable[AccountNumber] = (),
+            last_n: int = 4,
+            masker: Optional[AccountNumberMasker] = None):
+
+        assert last_n > 0, 'You must provide a last_n > 0'
+
+        self._last_n: int = last_n
+
+        # Holds the account numbers by account number string, in the order
+        # added.
+        self._by_number: Dict[str, AccountNumber] = {}
+
+        # Holds the account numbers by their last N digits.
+        self._by_last_n: Dict[str, List[AccountNumber]] = {}
+
+        # Holds the account numbers by masked form.
+        self._by_masked_number: AccountNumberIndex = AccountNumberIndex(masker)
+
+        for account_number in account_numbers:
+            self.add(account_number)
+
+    # =========================================================================
+    # __contains__
+    # =========================================================================
+
+    def __contains__(self, account_number):
+        if not isinstance(account_number, AccountNumber):
+            return False
+        return account_number.get_account_number() in self._by_number
+
+    # =========================================================================
+    # __iter__
+    # =========================================================================
+
+    def __iter__(self) -> Iterator[AccountNumber]:
+        return iter(self._by_number.values())
+
+    # =========================================================================
+    # __len__
+    # =========================================================================
+
+    def __len__(self):
+        return len(self._by_number)
+
+    # =========================================================================
+    # __str__
+    # =========================================================================
+
+    def __str__(self):
+        return "{}: {}".format(
+            type(self).__name__,
+            plural(len(self), '0', 'account number', 'account numbers'))
+
+    # =========================================================================
+    # _from_iterable
+    # =========================================================================
+
+    def _from_iterable(self, account_numbers: Iterable[AccountNumber]):
+        """
+        Creates the results of the set operations, such as ``|``, with the
+        last_n and masker of this set.
+
+        :param account_numbers: The account numbers of the result.
+        """
+
+        return type(self)(
+            account_numbers, self._last_n, self._by_masked_number.get_masker())
+
+    # =========================================================================
+    # add
+    # =========================================================================
+
+    def add(self, account_number: AccountNumber) -> None:
+        """
+        Adds an account number to the set, unless the set already holds one
+        with the same account number string.
+
+        :param account_number: The account number to add.
+        """
+
+        number: str = account_number.get_account_number()
+        if number in self._by_number:
+            return
+
+        self._by_number[number] = account_number
+        self._by_last_n.setdefault(
+            account_number.get_last_n(self._last_n), []).append(account_number)
+        self._by_masked_number.add(account_number)
+
+    # =========================================================================
+    # discard
+    # =========================================================================
+
+    def discard(self, account_number: AccountNumber) -> None:
+        """
+        Removes the account number with the same account number string from
+        the set, if the set holds one.
+
+        :param account_number: The account number to remove.
+        """
+
+        if account_number not in self:
+            return
+
+        account_number = self._by_number.pop(
+            account_number.get_account_number())
+        last_n: str = account_number.get_last_n(self._last_n)
+        candidates: List[AccountNumber] = self._by_last_n[last_n]
+        candidates.remove(account_number)
+        if not candidates:
+            del self._by_last_n[last_n]
+        self._by_masked_number.remove(account_number)
+
+    # =========================================================================
+    # find_by_last_n
+    # =========================================================================
+
+    def find_by_last_n(self, last_n: str) -> List[AccountNumber]:
+        """
+        Returns the account numbers that end with the specified digits, in
+        the order added.
+
+        :param last_n: The last N digits, where N is the set's last_n.
+        """
+
+        return list(self._by_last_n.get(last_n, ()))
+
+    # =========================================================================
+    # find_by_masked_number
+    # =========================================================================
+
+    def find_by_masked_number(self, masked_number: str) -> List[AccountNumber]:
+        """
+        Returns the account numbers that a masked account number may stand
+        for, in the order added.
+
+        :param masked_number: The masked account number.
+        """
+
+        return self._by_masked_number.find(masked_number)
+
+    # =========================================================================
+    # get
+    # =========================================================================
+
+    def get(self, account_number: str) -> Optional[AccountNumber]:
+        """
+        Returns the account number in the set with the specified account
+        number string, or None.
+
+        :param account_number: The account number string.
+        """
+
+        return self._by_number.get(account_number)
+
+
+###############################################################################
+# AccountNumberGenerator
+###############################################################################
+
+
+class AccountNumberGenerator(ABC):
+    """
+    This base class generates a random AccountNumber using rules
+    that a subclass provides.
+    """
+
+    ###########################################################################
+    # METHODS
+    ###########################################################################
+
+    # =========================================================================
+    # get_new_number
+    # =========================================================================
+
+    @abstractmethod
+    def get_new_number(self) -> AccountNumber:
+        """
+        Returns an account number based on the rules of the subclass.
+        """
+
+        raise NotImplementedError()
+
+    # =========================================================================
+    # get_new_numbers
+    # =========================================================================
+
+    def get_new_numbers(
+            self, count: int, batch: bool = False
+    ) -> Union[List[AccountNumber], AccountNumberBatch]:
+        """
+        Returns the specified count of account numbers based on the rules of
+        the subclass. This implementation calls ``get_new_number()`` for each
+        account number; subclasses may generate the whole batch at once.
+
+        :param count: The count of account numbers to return.
+        :param batch: Set this to TRUE to return an AccountNumberBatch rather
+            than a list of account numbers.
+        """
+
+        account_numbers = map(lambda _: self.get_new_number(), range(count))
+        return AccountNumberBatch(account_numbers) if batch \
+            else list(account_numbers)
+
+    # =========================================================================
+    # _create_random
+    # =========================================================================
+
+    @staticmethod
+    def _create_random(seed: Optional[int]) -> random.Random:
+        """
+        Returns a private random number generator for a generator. If the
+        seed is None, the random number generator seeds itself from the
+        operating system and reseeds itself in each forked process.
+
+        :param seed: The seed, or None.
+        """
+
+        generator: random.Random = random.Random(seed)
+        if seed is None:
+            _UNSEEDED_RANDOMS.add(generator)
+        return generator
+
+
+###############################################################################
+# AccountNumberGeneratorFixed
+###############################################################################
+
+
+class AccountNumberGeneratorFixed(AccountNumberGenerator):
+    """
+    This class returns an AccountNumber, round robin, from a fixed list
+    of account numbers.
+
+    :param numbers: The list of account numbers to draw from.
+    """
+
+    ###########################################################################
+    # METHODS
+    ###########################################################################
+
+    # =========================================================================
+    # CONSTRUCTOR
+    # =========================================================================
+
+    def __init__(self, numbers: Tuple[AccountNumber, ...]):
+
+        assert numbers, 'You must provide at least one account number'
+
+        self._numbers = numbers
+
+        # Each time the class returns a number, the class selects the next
+        # number from the list of numbers using round-robin selection. This
+        # counter, taken modulo the count of numbers, keeps track of the next
+        # number to select; next() on an itertools.count is atomic, so
+        # threads can share the generator without a lock.
+        self._counter: Iterator[int] = itertools.count()
+
+    # =========================================================================
+    # __str__
+    # =========================================================================
+
+    def __str__(self):
+        """
+        Returns a description of this account number generator.
+        """
+
+        entries = plural(len(self._numbers), '', 'number', 'numbers')
+        return "{}: {} starting with '{}'".format(
+            type(self).__name__, entries,
+            self._numbers[0].get_account_number())
+
+    # =========================================================================
+    # get_new_number
+    # =========================================================================
+
+    def get_new_number(self) -> Optional[AccountNumber]:
+        """
+        Returns the next number in the round-robin sequence.
+        Will return None if the pool happens to be empty.
+        """
+
+        if self._numbers:
+            return self._numbers[next(self._counter) % len(self._numbers)]
+
+        return None
+
+
+###############################################################################
+# AccountNumberGeneratorRandom
+###############################################################################
+
+
+class AccountNumberGeneratorRandom(AccountNumberGenerator):
+    """
+    This class generates a random AccountNumber.
+
+    :param length: The final length of the account number.
+    :param bank_display_name: Specifies the name of the bank associated
+        with this account number; this name is appropriate for logging
+        in log files.
+    :param bank_name: Specifies name of the bank associated with this
+        account number; this name is appropriate for identifying the bank
+        in service requests.
+    :param cvv_length: The length of the CVV.
+    :param masker: Specifies the AccountNumberMasker that knows how to mask
+        the account number. For PCI compliance you must mask account
+        numbers that appear in log files and this masker knows how
+        to mimic what appears in your test log files.
+    :param routing_number: Specifies the routing number.
+    :param prefixes: A tuple of prefixes that start account numbers.
+    :param unique: Set this to TRUE to never return the same account number
+        twice. Rather than draw random digits, the generator then walks a
+        keyed pseudo-random permutation of the digits that follow each
+        prefix, remembering only a counter; see ``get_counter()``. No
+        prefix may then start another, since their account numbers would
+        overlap.
+    :param seed: The seed of the generator's private random number
+        generator, which draws the random digits and, in unique mode, the
+        keys of the permutations; the same seed yields the same account
+        numbers. If you omit this parameter, the generator seeds it from the
+        operating system, and reseeds it in each process forked from this
+        one, so that forked workers draw different account numbers.
+    :param weights: The relative frequencies of the prefixes, one per
+        prefix. If you provide weights, the generator picks each account
+        number's prefix at random with these frequencies rather than round
+        robin; see ``set_weights()``. A generator in unique mode cannot
+        weight its prefixes.
+    """
+
+    ###########################################################################
+    # METHODS
+    ###########################################################################
+
+    # =========================================================================
+    # CONSTRUCTOR
+    # =========================================================================
+
+    def __init__(
+            self, length: int,
+            bank_display_name: Optional[str],
+            bank_name: Optional[str],
+            cvv_length: int,
             masker: Optional[AccountNumberMasker],
             routing_number: Optional[str],
             prefixes: Tuple[str, ...],
+            unique: bool = False,
+            seed: Optional[int] = None,
+            weights: Optional[Sequence[float]] = None,
     ):
 
         assert length > 0, 'You must provide a length > 0'
@@ -746,8 +1996,48 @@ class AccountNumberGeneratorRandom(AccountNumberGenerator):
 
         # Each time the class returns a number, the class selects the next
         # prefix from the list of prefixes using round-robin selection. This
-        # variable keeps track of the next prefix to select.
-        self._next_prefix: int = 0
+        # counter, taken modulo the count of prefixes, keeps track of the
+        # next prefix to select; threads can share it without a lock.
+        self._counter: _Counter = _Counter()
+
+        # Holds the generator's private source of random numbers.
+        self._random: random.Random = self._create_random(seed)
+
+        # In unique mode, the account number with counter value C takes the
+        # (C // len(prefixes))-th suffix, in permuted order, of the prefix
+        # that round-robin selection picks. The sequence ends at the first
+        # counter value whose prefix has no suffixes left; a generator made
+        # by spawn() also stops at the end of its range of counters.
+        self._unique: bool = unique
+        self._counter_end: int = 0
+        self._counter_limit: Optional[int] = None
+        self._permutations: Tuple[FeistelPermutation, ...] = ()
+        if unique:
+            # Once sorted, a stem that starts another also starts every stem
+            # in between, so comparing neighbours finds every overlap.
+            stems: List[Tuple[str, str]] = sorted(
+                (self._get_stem(_), _) for _ in prefixes)
+            for (stem, prefix), (other_stem, other_prefix) in zip(
+                    stems, stems[1:]):
+                assert not other_stem.startswith(stem), \
+                    "You must provide prefixes that do not overlap in " \
+                    "unique mode: '{}' and '{}'".format(prefix, other_prefix)
+            self._permutations = tuple(
+                FeistelPermutation(
+                    10 ** self._get_suffix_length(_),
+                    self._random.getrandbits(64))
+                for _ in prefixes)
+            # Prefix i first runs out at counter value len(prefixes) * N + i,
+            # where N is its count of suffixes.
+            self._counter_end = min(
+                len(prefixes) * len(permutation) + index
+                for index, permutation in enumerate(self._permutations))
+
+        # Holds the alias table that picks weighted prefixes, or None to pick
+        # prefixes round robin.
+        self._alias_table: Optional[AliasTable] = None
+        if weights is not None:
+            self.set_weights(weights)
 
     # =========================================================================
     # __str__
@@ -759,6 +2049,12 @@ class AccountNumberGeneratorRandom(AccountNumberGenerator):
         """
 
         entries = plural(len(self._prefixes), '', 'prefix', 'prefixes')
+        if self._alias_table is not None:
+            return "{}: {} weighted {}".format(
+                type(self).__name__, entries, ', '.join(
+                    "'{}' {:.1%}".format(prefix, weight)
+                    for prefix, weight in zip(
+                        self._prefixes, self._alias_table.get_weights())))
         return "{}: {} starting with '{}'".format(
             type(self).__name__, entries, self._prefixes[0])
 
@@ -771,7 +2067,7 @@ class AccountNumberGeneratorRandom(AccountNumberGenerator):
         Returns a random account number.
         """
 
-        return AccountNumber(
+        return AccountNumber.create_lazy(
             account_number=self._get_next_number(),
             bank_display_name=self._bank_display_name,
             bank_name=self._bank_name,
@@ -779,6 +2075,293 @@ class AccountNumberGeneratorRandom(AccountNumberGenerator):
             masker=self._masker,
             routing_number=self._routing_number)
 
+    # =========================================================================
+    # get_counter
+    # =========================================================================
+
+    def get_counter(self) -> int:
+        """
+        Returns the count of account numbers that the generator has been
+        asked for so far. To resume a unique sequence, construct a generator
+        with the same arguments and seed and pass this value to
+        ``set_counter()``. The count is exact unless other threads are
+        getting account numbers from the generator at the same time, in
+        which case it may leave out some of theirs.
+        """
+
+        return self._counter.peek()
+
+    # =========================================================================
+    # get_new_numbers
+    # =========================================================================
+
+    def get_new_numbers(
+            self, count: int, batch: bool = False
+    ) -> Union[List[AccountNumber], AccountNumberBatch]:
+        """
+        Returns the specified count of random account numbers. The method
+        draws the random digits for many account numbers at a time, so it is
+        much faster than calling ``get_new_number()`` repeatedly, but it
+        draws a different sequence of account numbers from the same seed.
+
+        :param count: The count of account numbers to return.
+        :param batch: Set this to TRUE to return an AccountNumberBatch rather
+            than a list of account numbers.
+        """
+
+        return self._create_numbers(
+            AccountNumber, self._get_next_numbers(count), batch)
+
+    # =========================================================================
+    # get_weights
+    # =========================================================================
+
+    def get_weights(self) -> Optional[Tuple[float, ...]]:
+        """
+        Returns the frequencies of the prefixes, normalized to sum to 1, or
+        None if the generator picks prefixes round robin.
+        """
+
+        return None if self._alias_table is None \
+            else self._alias_table.get_weights()
+
+    # =========================================================================
+    # set_counter
+    # =========================================================================
+
+    def set_counter(self, counter: int) -> None:
+        """
+        Sets the count of unique account numbers returned so far, so that
+        the generator resumes its unique sequence at that point.
+
+        :param counter: The counter value to set.
+        """
+
+        assert self._unique, 'The generator is not in unique mode'
+        assert counter >= 0, 'You must provide a counter >= 0'
+
+        self._counter = _Counter(counter)
+
+    # =========================================================================
+    # set_weights
+    # =========================================================================
+
+    def set_weights(self, weights: Optional[Sequence[float]]) -> None:
+        """
+        Sets the relative frequencies of the prefixes. The generator builds
+        an alias table (Walker's alias method), so picking a prefix takes
+        constant time however many prefixes there are. You can change the
+        weights while other threads draw account numbers; each draw uses
+        either the old table or the new one.
+
+        :param weights: The relative frequencies, one per prefix, or None to
+            pick prefixes round robin again.
+        """
+
+        if weights is None:
+            self._alias_table = None
+            return
+
+        assert not self._unique, \
+            'You cannot weight the prefixes of a unique generator'
+        assert len(weights) == len(self._prefixes), \
+            'You must provide one weight per prefix'
+
+        self._alias_table = AliasTable(weights)
+
+    # =========================================================================
+    # spawn
+    # =========================================================================
+
+    def spawn(self, count: int) -> List['AccountNumberGeneratorRandom']:
+        """
+        Returns the specified count of independent child generators, which
+        you can run in separate threads or processes without coordination.
+        Each child owns a private random number generator seeded from this
+        generator's random sequence, so a seeded generator spawns the same
+        children every time.
+
+        In unique mode, the children split the counters that this generator
+        has not used into consecutive ranges, one per child, so no two
+        children return the same account number; this generator then has no
+        counters left.
+
+        :param count: The count of child generators to return.
+        """
+
+        assert count > 0, 'You must provide a count > 0'
+
+        start: int = self.get_counter()
+        end: int = self._get_counter_end() if self._unique else start
+        remaining: int = max(end - start, 0)
+
+        children: List[AccountNumberGeneratorRandom] = []
+        for index in range(count):
+            child = copy.copy(self)
+            child._random = self._create_random(self._random.getrandbits(128))
+            if self._random in _UNSEEDED_RANDOMS:
+                _UNSEEDED_RANDOMS.add(child._random)
+            child._counter = _Counter(start)
+            if self._unique:
+                child.set_counter(start + remaining * index // count)
+                child._counter_limit = start + remaining * (index + 1) // count
+            children.append(child)
+
+        if self._unique:
+            self.set_counter(max(end, start))
+            self._counter_limit = max(end, start)
+        return children
+
+    # =========================================================================
+    # _complete_numbers
+    # =========================================================================
+
+    def _complete_numbers(self, prefix: str, count: int) -> List[str]:
+        """
+        Returns the specified count of account numbers that start with a
+        prefix and end with random digits.
+
+        :param prefix: The prefix that starts the account numbers.
+        :param count: The count of account numbers to return.
+        """
+
+        return [prefix + _ for _ in self._get_random_digits(
+            count, self._length - len(prefix))]
+
+    # =========================================================================
+    # _create_numbers
+    # =========================================================================
+
+    def _create_numbers(
+            self, cls: type, account_numbers: Iterable[str], batch: bool
+    ) -> Union[List[AccountNumber], AccountNumberBatch]:
+        """
+        Creates account numbers of the specified class from account number
+        strings whose check digits, if any, are already correct.
+
+        :param cls: AccountNumber or one of its subclasses.
+        :param account_numbers: The account number strings.
+        :param batch: Set this to TRUE to return an AccountNumberBatch rather
+            than a list of account numbers.
+        """
+
+        if batch:
+            accounts = AccountNumberBatch()
+            accounts._extend_with_strings(
+                cls, list(account_numbers), self._bank_display_name,
+                self._bank_name, self._cvv_length, self._masker,
+                self._routing_number)
+            return accounts
+
+        create = cls._create_lazy
+        args = (
+            self._bank_display_name, self._bank_name, self._cvv_length,
+            self._masker, self._routing_number)
+        return [create(_, *args) for _ in account_numbers]
+
+    # =========================================================================
+    # _get_next_numbers
+    # =========================================================================
+
+    def _get_next_numbers(self, count: int) -> List[str]:
+        """
+        Returns the next account numbers in the sequence, completing the
+        account numbers of each prefix in one batch.
+
+        :param count: The count of account numbers to return.
+        """
+
+        if self._unique:
+            return [self._get_next_number() for _ in range(count)]
+        if count <= 0:
+            return []
+
+        alias_table: Optional[AliasTable] = self._alias_table
+        if alias_table is not None:
+            return self._get_weighted_numbers(alias_table, count)
+
+        # The round-robin selection gives the prefix at offset i every
+        # len(self._prefixes)-th account number, starting with the i-th.
+        start: int = self._counter.take(count)
+        prefix_count: int = len(self._prefixes)
+        account_numbers: List[str] = [''] * count
+        for offset in range(min(count, prefix_count)):
+            prefix = self._prefixes[(start + offset) % prefix_count]
+            account_numbers[offset::prefix_count] = self._complete_numbers(
+                prefix, len(range(offset, count, prefix_count)))
+        return account_numbers
+
+    # =========================================================================
+    # _get_weighted_numbers
+    # =========================================================================
+
+    def _get_weighted_numbers(
+            self, alias_table: AliasTable, count: int) -> List[str]:
+        """
+        Returns account numbers whose prefixes the alias table picks,
+        completing the account numbers of each prefix in one batch.
+
+        :param alias_table: The alias table that picks the prefixes.
+        :param count: The count of account numbers to return.
+        """
+
+        positions: Dict[int, List[int]] = {}
+        for position, index in enumerate(
+                alias_table.sample_many(self._random, count)):
+            positions.setdefault(index, []).append(position)
+
+        account_numbers: List[str] = [''] * count
+        for index, group in positions.items():
+            for position, account_number in zip(
+                    group, self._complete_numbers(
+                        self._prefixes[index], len(group))):
+                account_numbers[position] = account_number
+        return account_numbers
+
+    # =========================================================================
+    # _get_counter_end
+    # =========================================================================
+
+    def _get_counter_end(self) -> int:
+        """
+        Returns the counter value at which the unique sequence ends: the end
+        of the generator's range of counters, or the first counter whose
+        prefix has no suffixes left.
+        """
+
+        if self._counter_limit is not None:
+            return min(self._counter_end, self._counter_limit)
+        return self._counter_end
+
+    # =========================================================================
+    # _get_random_digits
+    # =========================================================================
+
+    def _get_random_digits(self, count: int, length: int) -> List[str]:
+        """
+        Returns the specified count of strings of random digits. Rather than
+        draw one digit at a time, the method draws one random integer for as
+        many strings as fit in about 400 digits and slices up its decimal
+        string; longer integers are slower because converting an integer to
+        a string takes time quadratic in its length.
+
+        :param count: The count of strings to return.
+        :param length: The count of digits in each string.
+        """
+
+        if length <= 0:
+            return [''] * count
+
+        per_draw: int = max(400 // length, 1)
+        strings: List[str] = []
+        for start in range(0, count, per_draw):
+            width: int = length * min(per_draw, count - start)
+            digits: str = str(
+                self._random.randrange(10 ** width)).zfill(width)
+            strings += [
+                digits[_:_ + length] for _ in range(0, width, length)]
+        return strings
+
     # =========================================================================
     # _get_next_number
     # =========================================================================
@@ -788,15 +2371,95 @@ class AccountNumberGeneratorRandom(AccountNumberGenerator):
         Returns the next account number in the sequence.
         """
 
-        account_number = self._prefixes[self._next_prefix]
-        self._next_prefix += 1
-        if self._next_prefix >= len(self._prefixes):
-            self._next_prefix = 0
+        if self._unique:
+            return self._get_next_unique_number()
+
+        account_number = self._get_next_prefix()
         # Append random digits until we are at the required length.
         while len(account_number) < self._length:
-            account_number += str(random.randint(0, 9))
+            account_number += str(self._random.randint(0, 9))
         return account_number
 
+    # =========================================================================
+    # _get_next_prefix
+    # =========================================================================
+
+    def _get_next_prefix(self) -> str:
+        """
+        Returns the prefix of the next account number: the next prefix round
+        robin, or a prefix that the alias table picks.
+        """
+
+        alias_table: Optional[AliasTable] = self._alias_table
+        if alias_table is not None:
+            return self._prefixes[alias_table.sample(self._random)]
+        return self._prefixes[self._counter.take() % len(self._prefixes)]
+
+    # =========================================================================
+    # _get_next_unique_number
+    # =========================================================================
+
+    def _get_next_unique_number(self) -> str:
+        """
+        Returns the next account number in the unique sequence: the prefix
+        followed by the permuted suffix.
+
+        :raises HardException: The generator has returned every account
+            number that starts with the next prefix, or has used every
+            counter in the range that ``spawn()`` gave it.
+        """
+
+        counter: int = self._counter.take()
+        if self._counter_limit is not None and counter >= self._counter_limit:
+            raise HardException(
+                "The generator has used every counter in its range, which "
+                "ends at {}".format(self._counter_limit))
+
+        prefix_count: int = len(self._prefixes)
+        if counter >= self._counter_end:
+            prefix_index: int = self._counter_end % prefix_count
+            raise HardException(
+                "All {} account numbers that start with '{}' have been "
+                "generated".format(
+                    len(self._permutations[prefix_index]),
+                    self._prefixes[prefix_index]))
+
+        permutation: FeistelPermutation = \
+            self._permutations[counter % prefix_count]
+        prefix: str = self._prefixes[counter % prefix_count]
+        suffix_index: int = counter // prefix_count
+        suffix_length: int = self._get_suffix_length(prefix)
+        return prefix + str(permutation[suffix_index]).zfill(suffix_length) \
+            if suffix_length else prefix
+
+    # =========================================================================
+    # _get_stem
+    # =========================================================================
+
+    def _get_stem(self, prefix: str) -> str:
+        """
+        Returns the leading digits that every account number the generator
+        makes from the specified prefix starts with.
+
+        :param prefix: The prefix.
+        """
+
+        return prefix
+
+    # =========================================================================
+    # _get_suffix_length
+    # =========================================================================
+
+    def _get_suffix_length(self, prefix: str) -> int:
+        """
+        Returns the count of digits that the generator chooses after the
+        specified prefix.
+
+        :param prefix: The prefix.
+        """
+
+        return max(self._length - len(prefix), 0)
+
 
 ###############################################################################
 # AccountNumberGeneratorRandomLuhn
@@ -821,6 +2484,23 @@ class AccountNumberGeneratorRandomLuhn(AccountNumberGeneratorRandom):
         to mimic what appears in your test log files.
     :param routing_number: Specifies the routing number.
     :param prefixes: A tuple of prefixes that start account numbers.
+    :param unique: Set this to TRUE to never return the same account number
+        twice. Rather than draw random digits, the generator then walks a
+        keyed pseudo-random permutation of the digits that follow each
+        prefix, remembering only a counter; see ``get_counter()``. No
+        prefix may then start another, since their account numbers would
+        overlap.
+    :param seed: The seed of the generator's private random number
+        generator, which draws the random digits and, in unique mode, the
+        keys of the permutations; the same seed yields the same account
+        numbers. If you omit this parameter, the generator seeds it from the
+        operating system, and reseeds it in each process forked from this
+        one, so that forked workers draw different account numbers.
+    :param weights: The relative frequencies of the prefixes, one per
+        prefix. If you provide weights, the generator picks each account
+        number's prefix at random with these frequencies rather than round
+        robin; see ``set_weights()``. A generator in unique mode cannot
+        weight its prefixes.
     """
 
     ###########################################################################
@@ -839,10 +2519,18 @@ class AccountNumberGeneratorRandomLuhn(AccountNumberGeneratorRandom):
             masker: Optional[AccountNumberMasker],
             routing_number: Optional[str],
             prefixes: Tuple[str, ...],
+            unique: bool = False,
+            seed: Optional[int] = None,
+            weights: Optional[Sequence[float]] = None,
     ):
         super().__init__(
             length, bank_display_name, bank_name, cvv_length, masker,
-            routing_number, prefixes)
+            routing_number, prefixes, unique, seed, weights)
+
+        # Holds the running LUHN checksum of each prefix that leaves room for
+        # random digits; each account number starts from a copy.
+        self._accumulators: Dict[str, LuhnAccumulator] = {
+            _: LuhnAccumulator(_) for _ in prefixes if len(_) < length}
 
     # =========================================================================
     # get_new_number
@@ -853,10 +2541,182 @@ class AccountNumberGeneratorRandomLuhn(AccountNumberGeneratorRandom):
         Returns a random Luhn account number.
         """
 
-        return AccountNumberLuhn(
+        return AccountNumberLuhn._create_lazy(
             account_number=self._get_next_number(),
             bank_display_name=self._bank_display_name,
             bank_name=self._bank_name,
             cvv_length=self._cvv_length,
             masker=self._masker,
             routing_number=self._routing_number)
+
+    # =========================================================================
+    # get_new_numbers
+    # =========================================================================
+
+    def get_new_numbers(
+            self, count: int, batch: bool = False
+    ) -> Union[List[AccountNumber], AccountNumberBatch]:
+        """
+        Returns the specified count of random Luhn account numbers, computing
+        the LUHN checksum digits of each prefix's account numbers in one
+        batch.
+
+        :param count: The count of account numbers to return.
+        :param batch: Set this to TRUE to return an AccountNumberBatch rather
+            than a list of account numbers.
+        """
+
+        return self._create_numbers(
+            AccountNumberLuhn, self._get_next_numbers(count), batch)
+
+    # =========================================================================
+    # _complete_numbers
+    # =========================================================================
+
+    def _complete_numbers(self, prefix: str, count: int) -> List[str]:
+        """
+        Returns the specified count of account numbers that start with a
+        prefix and end with random digits and the LUHN checksum digit.
+
+        :param prefix: The prefix that starts the account numbers.
+        :param count: The count of account numbers to return.
+        """
+
+        if len(prefix) >= self._length:
+            return [set_checksum(prefix)] * count
+
+        account_numbers = [prefix + _ for _ in self._get_random_digits(
+            count, self._length - len(prefix) - 1)]
+        return list(map(
+            str.__add__, account_numbers,
+            map(str, get_check_digit_batch(account_numbers))))
+
+    # =========================================================================
+    # _get_next_number
+    # =========================================================================
+
+    def _get_next_number(self) -> str:
+        """
+        Returns the next account number in the sequence, complete with its
+        LUHN checksum digit.
+        """
+
+        if self._unique:
+            return self._get_next_unique_number()
+
+        prefix = self._get_next_prefix()
+
+        # A prefix that fills the account number gets its last digit
+        # replaced by the checksum digit.
+        if len(prefix) >= self._length:
+            return set_checksum(prefix)
+
+        # Append random digits up to the checksum digit, accumulating the
+        # checksum as we go.
+        account_number = prefix
+        accumulator = self._accumulators[prefix].copy()
+        while len(account_number) < self._length - 1:
+            digit = self._random.randint(0, 9)
+            accumulator.append_digit(digit)
+            account_number += str(digit)
+        return account_number + str(accumulator.get_check_digit())
+
+    # =========================================================================
+    # _get_next_unique_number
+    # =========================================================================
+
+    def _get_next_unique_number(self) -> str:
+        """
+        Returns the next account number in the unique sequence: the prefix
+        followed by the permuted suffix and the LUHN checksum digit.
+
+        :raises HardException: The generator has returned every account
+            number that starts with the next prefix.
+        """
+
+        account_number: str = super()._get_next_unique_number()
+        return set_checksum(account_number) \
+            if len(account_number) >= self._length \
+            else add_checksum(account_number)
+
+    # =========================================================================
+    # _get_stem
+    # =========================================================================
+
+    def _get_stem(self, prefix: str) -> str:
+        """
+        Returns the leading digits that every account number the generator
+        makes from the specified prefix starts with; the LUHN checksum digit
+        replaces the last digit of a prefix that fills the length.
+
+        :param prefix: The prefix.
+        """
+
+        return prefix[:-1] if len(prefix) >= self._length else prefix
+
+    # =========================================================================
+    # _get_suffix_length
+    # =========================================================================
+
+    def _get_suffix_length(self, prefix: str) -> int:
+        """
+        Returns the count of digits that the generator chooses after the
+        specified prefix, leaving room for the LUHN checksum digit.
+
+        :param prefix: The prefix.
+        """
+
+        return max(self._length - len(prefix) - 1, 0)
+
+
+class _Counter:
+    """
+    This class hands out consecutive integers to any number of threads
+    without a lock. An itertools.count hands them out, since next() on one is
+    atomic, and each thread records the value after the last one it took, so
+    that the counter knows its next value once no thread is taking values.
+
+    :param start: The first value.
+    """
+
+    def __init__(self, start: int = 0):
+        self._count: Iterator[int] = itertools.count(start)
+        self._start: int = start
+
+        # Holds, by thread, the value after the last value the thread took;
+        # each thread writes only its own entry, so no update is lost.
+        self._ends: Dict[int, int] = {}
+
+    def peek(self) -> int:
+        # The thread that took values last holds the highest end.
+        return max(self._ends.values(), default=self._start)
+
+    def take(self, count: int = 1) -> int:
+        # Under CPython's global interpreter lock, one call to next() on an
+        # islice() advances the count in C without releasing the lock, so no
+        # other thread can take a value from the middle of the range.
+        first: int = next(self._count) if count == 1 \
+            else next(itertools.islice(self._count, count - 1, None)) \
+            - count + 1
+        self._ends[get_ident()] = first + count
+        return first
+
+
+###############################################################################
+# METHODS - PRIVATE
+###############################################################################
+
+
+def _reseed_unseeded_randoms() -> None:
+    """
+    Reseeds, from the operating system, the random number generators that no
+    caller seeded; a forked process calls this method so that it does not
+    repeat its parent's random numbers.
+    """
+
+    for generator in list(_UNSEEDED_RANDOMS):
+        generator.seed()
+
+
+if hasattr(os, 'register_at_fork'):
+    os.register_at_fork(after_in_child=_reseed_unseeded_randoms)
@@ -0,0 +1,152 @@
+"""
+Created on October 17, 2026
+
+This module measures the memory that each AccountNumber and
+AccountNumberMasker instance takes, comparing the slotted classes against
+equivalent classes that keep their attributes in a per-instance __dict__,
+as the classes did before they declared __slots__. Run it from the command
+line with::
+
+    python -m kojak.core.utilities.account_number_benchmark [--count N]
+
+AccountNumberLuhn and the other check-digit subclasses add no attributes, so
+their instances take the same memory as AccountNumber instances.
+"""
+
+import argparse
+import gc
+import sys
+import tracemalloc
+from types import MemberDescriptorType
+from typing import Callable, Dict, List, Optional, Sequence
+
+from kojak.core.utilities.account_number import (
+    AccountNumber, AccountNumberMasker)
+
+###############################################################################
+# CONSTANTS
+###############################################################################
+
+# Specifies the default count of instances to measure.
+DEFAULT_COUNT: int = 100000
+
+
+###############################################################################
+# METHODS
+###############################################################################
+
+
+# =============================================================================
+# main
+# =============================================================================
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Measures the per-instance memory of the account number classes and
+    prints the results.
+
+    :param argv: The command-line arguments, less the program name; if you
+        omit this parameter, the method uses ``sys.argv``.
+    """
+
+    parser = argparse.ArgumentParser(
+        prog='python -m kojak.core.utilities.account_number_benchmark',
+        description='Measures the memory of account number instances.')
+    parser.add_argument(
+        '--count', type=int, default=DEFAULT_COUNT,
+        help='the count of instances to measure (default: %(default)s)')
+    args = parser.parse_args(argv)
+
+    for name, sizes in run_benchmarks(args.count).items():
+        print("{:20} {:8.1f} bytes with __dict__ {:8.1f} bytes with "
+              "__slots__ ({:.0%} smaller)".format(
+                  name, sizes['dict'], sizes['slots'],
+                  1 - sizes['slots'] / sizes['dict']))
+    return 0
+
+
+# =============================================================================
+# measure_instance_size
+# =============================================================================
+
+def measure_instance_size(factory: Callable[[int], object], count: int) -> float:
+    """
+    Returns the average count of bytes that each of **count** objects made by
+    a factory allocates, excluding the list that holds them.
+
+    :param factory: A function that makes the i-th object.
+    :param count: The count of objects to make.
+    """
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        before: int = tracemalloc.get_traced_memory()[0]
+        instances: List[object] = [factory(_) for _ in range(count)]
+        after: int = tracemalloc.get_traced_memory()[0]
+    finally:
+        tracemalloc.stop()
+    return (after - before - sys.getsizeof(instances)) / count
+
+
+# =============================================================================
+# run_benchmarks
+# =============================================================================
+
+def run_benchmarks(count: int = DEFAULT_COUNT) -> Dict[str, Dict[str, float]]:
+    """
+    Measures the per-instance memory of AccountNumber and AccountNumberMasker
+    and returns a dictionary, by class name, of dictionaries that give the
+    bytes per instance with a __dict__ ('dict') and with __slots__
+    ('slots').
+
+    :param count: The count of instances to measure.
+    """
+
+    # Make the account number strings up front so that both measurements
+    # share them.
+    account_numbers: List[str] = [
+        '4{:015d}'.format(_) for _ in range(count)]
+    masker = AccountNumberMasker()
+
+    def make_account_number_factory(cls: type) -> Callable[[int], object]:
+        return lambda _: cls(
+            account_numbers[_], 'Bank of Gallifrey', 'BOG', masker=masker,
+            routing_number='021000021')
+
+    def make_masker_factory(cls: type) -> Callable[[int], object]:
+        return lambda _: cls(6, 4, '#')
+
+    results: Dict[str, Dict[str, float]] = {}
+    for cls, make_factory in (
+            (AccountNumber, make_account_number_factory),
+            (AccountNumberMasker, make_masker_factory)):
+        results[cls.__name__] = {
+            'dict': measure_instance_size(
+                make_factory(_get_unslotted_class(cls)), count),
+            'slots': measure_instance_size(make_factory(cls), count),
+        }
+    return results
+
+
+def _get_unslotted_class(cls: type) -> type:
+    """
+    Returns a copy of a slotted class, which must derive directly from
+    object, whose instances keep their attributes in a __dict__.
+
+    :param cls: The slotted class.
+    """
+
+    namespace: Dict[str, object] = {
+        name: value for name, value in vars(cls).items()
+        if name not in ('__slots__', '__dict__', '__weakref__')
+        and not isinstance(value, MemberDescriptorType)}
+    return type(cls.__name__, (), namespace)
+
+
+###############################################################################
+# MAIN
+###############################################################################
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,207 @@
+"""
+Created on October 17, 2026
+
+This module finds every occurrence of a collection of account numbers, in
+clear or masked form, in log text, in a single pass over the text however
+many account numbers it looks for. It lets a test verify that each of its
+transactions appears in the host's logs.
+
+A regular expression finds the runs of digits and mask characters in the
+text, so that the matcher skips everything else in C. Each run is checked,
+at every position where an account number could start, against a hash table
+of the clear and masked forms of the account numbers, one lookup per
+distinct form length. An occurrence must not be preceded or followed by a
+digit, so '4111111111111111' does not match inside '94111111111111111'.
+"""
+
+import gzip
+import re
+from typing import Dict, Iterable, Iterator, List, Set, TextIO, Tuple
+
+from kojak.core.utilities.account_number import AccountNumber
+from kojak.core.utilities.string_library import plural
+
+###############################################################################
+# CONSTANTS
+###############################################################################
+
+# Holds the characters that may not border an occurrence.
+_DIGITS: str = '0123456789'
+
+
+###############################################################################
+# AccountNumberFinder
+###############################################################################
+
+
+class AccountNumberFinder:
+    """
+    This class finds the occurrences of account numbers in text. It looks for
+    each account number in clear and, if the account number has a masker, in
+    the masked form that the masker produces.
+
+    :param account_numbers: The account numbers to look for.
+    """
+
+    ###########################################################################
+    # METHODS
+    ###########################################################################
+
+    # =========================================================================
+    # CONSTRUCTOR
+    # =========================================================================
+
+    def __init__(self, account_numbers: Iterable[AccountNumber]):
+
+        self._account_numbers: List[AccountNumber] = list(account_numbers)
+
+        # Holds, by clear or masked form, the account numbers and whether the
+        # form is masked.
+        self._forms: Dict[str, List[Tuple[AccountNumber, bool]]] = {}
+        mask_characters: Set[str] = set()
+        for account_number in self._account_numbers:
+            clear: str = account_number.get_account_number()
+            masked: str = account_number.get_masked_number()
+            self._forms.setdefault(clear, []).append((account_number, False))
+            if masked != clear:
+                self._forms.setdefault(masked, []).append(
+                    (account_number, True))
+                mask_characters.update(set(masked) - set(_DIGITS))
+
+        # Holds the distinct lengths of the forms, shortest first.
+        self._lengths: Tuple[int, ...] = tuple(
+            sorted(set(map(len, self._forms))))
+
+        # Matches a run of digits and mask characters that could hold a form.
+        self._run_pattern: re.Pattern = re.compile(
+            '[0-9{}]{{{},}}'.format(
+                re.escape(''.join(sorted(mask_characters))),
+                self._lengths[0] if self._lengths else 1))
+
+    # =========================================================================
+    # __len__
+    # =========================================================================
+
+    def __len__(self):
+        return len(self._account_numbers)
+
+    # =========================================================================
+    # __str__
+    # =========================================================================
+
+    def __str__(self):
+        return "{}: {} in {}".format(
+            type(self).__name__,
+            plural(len(self._account_numbers), '0', 'account number',
+                   'account numbers'),
+            plural(len(self._forms), '0', 'form', 'forms'))
+
+    # =========================================================================
+    # find
+    # =========================================================================
+
+    def find(self, text: str) -> List[Tuple[int, AccountNumber, bool]]:
+        """
+        Returns a list of (offset, account number, masked) tuples for the
+        occurrences of the account numbers in a text, in order of offset,
+        where masked is TRUE for an occurrence of the masked form.
+
+        :param text: The text to search.
+        """
+
+        occurrences: List[Tuple[int, AccountNumber, bool]] = []
+        forms: Dict[str, List[Tuple[AccountNumber, bool]]] = self._forms
+        lengths: Tuple[int, ...] = self._lengths
+        for match in self._run_pattern.finditer(text):
+            run: str = match.group()
+            base: int = match.start()
+            run_length: int = len(run)
+
+            # An occurrence starts at the start of the run or after a mask
+            # character, and ends at the end of the run or before one.
+            starts: Iterable[int] = (0,) if run.isdigit() else [
+                _ for _ in range(run_length)
+                if _ == 0 or run[_ - 1] not in _DIGITS]
+            for start in starts:
+                for length in lengths:
+                    end: int = start + length
+                    if end > run_length:
+                        break
+                    if end < run_length and run[end] in _DIGITS:
+                        continue
+                    for account_number, masked in forms.get(
+                            run[start:end], ()):
+                        occurrences.append(
+                            (base + start, account_number, masked))
+        return occurrences
+
+    # =========================================================================
+    # find_in_file
+    # =========================================================================
+
+    def find_in_file(
+            self, path: str) -> Iterator[Tuple[int, int, AccountNumber, bool]]:
+        """
+        Returns an iterator over (line number, offset, account number,
+        masked) tuples for the occurrences of the account numbers in a text
+        file; see ``find_in_lines()``. The method reads ".gz" files through
+        ``gzip`` and replaces bytes that are not UTF-8.
+
+        :param path: The path of the file to search.
+        """
+
+        with _open(path) as file:
+            yield from self.find_in_lines(file)
+
+    # =========================================================================
+    # find_in_lines
+    # =========================================================================
+
+    def find_in_lines(
+            self, lines: Iterable[str]
+    ) -> Iterator[Tuple[int, int, AccountNumber, bool]]:
+        """
+        Returns an iterator over (line number, offset, account number,
+        masked) tuples for the occurrences of the account numbers in lines of
+        text, such as an open log file, where the line number counts from 1
+        and the offset is the offset of the occurrence in its line.
+
+        :param lines: The lines to search.
+        """
+
+        for line_number, line in enumerate(lines, 1):
+            for offset, account_number, masked in self.find(line):
+                yield line_number, offset, account_number, masked
+
+    # =========================================================================
+    # find_missing
+    # =========================================================================
+
+    def find_missing(self, lines: Iterable[str]) -> List[AccountNumber]:
+        """
+        Returns the account numbers, in the order given to the constructor,
+        that occur in neither clear nor masked form in lines of text.
+
+        :param lines: The lines to search.
+        """
+
+        found: Set[int] = {id(_[2]) for _ in self.find_in_lines(lines)}
+        return [_ for _ in self._account_numbers if id(_) not in found]
+
+
+###############################################################################
+# METHODS - PRIVATE
+###############################################################################
+
+
+def _open(path: str) -> TextIO:
+    """
+    Opens a text file for reading, through ``gzip`` if its name ends with
+    ".gz".
+
+    :param path: The path of the file.
+    """
+
+    if path.endswith('.gz'):
+        return gzip.open(path, 'rt', errors='replace')
+    return open(path, errors='replace')
@@ -0,0 +1,566 @@
+"""
+Created on October 17, 2026
+
+This module stores pools of pre-provisioned accounts in a compact binary
+file of fixed-size records, which a reader maps into memory rather than
+loads, so that opening a pool of any size takes constant time and reading
+account i takes constant time.
+
+A pool file holds a header followed by the records. The header holds, in
+little-endian order:
+
+    ========  ======  =================================================
+    Bytes     Type    Content
+    ========  ======  =================================================
+    0 - 7     bytes   The magic string ``KJKPOOL1``.
+    8 - 9     uint16  The format version, 1.
+    10 - 11   uint16  The size of the header, which is where the records
+                      start.
+    12 - 19   uint64  The count of records.
+    20        uint8   The width of the account number field.
+    21        uint8   The width of each CVV field.
+    22        uint8   The width of the routing number field.
+    23        uint8   Reserved; 0.
+    24 -      string  The bank display name, then the bank name, each a
+                      uint16 byte count followed by UTF-8 bytes.
+    ========  ======  =================================================
+
+Each record holds the account number, the CVV, the bad CVV and the routing
+number as ASCII, each padded with spaces to the width of its field, then
+'1' if the account uses the bad CVV or '0' if not, then a newline. Every
+account in a pool shares the pool's bank names.
+"""
+
+import itertools
+import mmap
+import os
+import random
+import struct
+from sys import intern
+from typing import BinaryIO, Iterable, Iterator, Optional, Tuple
+
+from kojak.core.exceptions import HardException
+from kojak.core.utilities.account_number import (
+    AccountNumber, AccountNumberGenerator, AccountNumberMasker)
+from kojak.core.utilities.string_library import plural
+
+###############################################################################
+# CONSTANTS
+###############################################################################
+
+# Specifies the default width of the account number field.
+DEFAULT_ACCOUNT_NUMBER_WIDTH: int = 19
+
+# Specifies the default width of each CVV field.
+DEFAULT_CVV_WIDTH: int = 4
+
+# Specifies the default width of the routing number field.
+DEFAULT_ROUTING_NUMBER_WIDTH: int = 9
+
+# Identifies a pool file.
+POOL_MAGIC: bytes = b'KJKPOOL1'
+
+# Specifies the version of the pool file format.
+POOL_VERSION: int = 1
+
+# Describes the fixed part of the header.
+_HEADER: struct.Struct = struct.Struct('<8sHHQBBBB')
+
+# Describes the byte count that precedes each bank name in the header.
+_NAME_LENGTH: struct.Struct = struct.Struct('<H')
+
+
+###############################################################################
+# AccountPool
+###############################################################################
+
+
+class AccountPool:
+    """
+    This class reads the accounts in a pool file, which it maps into memory.
+    Opening a pool reads only the header, and ``pool[i]`` reads only record
+    i, so a pool of any size opens in constant time. Close the pool when you
+    are done with it, or use it as a context manager.
+
+    :param path: The path of the pool file.
+    :param masker: The AccountNumberMasker to give the account numbers.
+    :param cls: The class of the account numbers to return: AccountNumber or
+        one of its subclasses. The pool does not check or recompute check
+        digits.
+    :raises HardException: The file is not a pool file or is truncated.
+    """
+
+    ###########################################################################
+    # METHODS
+    ###########################################################################
+
+    # =========================================================================
+    # CONSTRUCTOR
+    # =========================================================================
+
+    def __init__(
+            self, path: str,
+            masker: Optional[AccountNumberMasker] = None,
+            cls: type = AccountNumber):
+
+        self._path: str = path
+        self._masker: Optional[AccountNumberMasker] = masker
+        self._cls: type = cls
+
+        with open(path, 'rb') as file:
+            if os.fstat(file.fileno()).st_size < _HEADER.size:
+                raise HardException(
+                    "'{}' is not an account pool file".format(path))
+            self._map: mmap.mmap = mmap.mmap(
+                file.fileno(), 0, access=mmap.ACCESS_READ)
+
+        try:
+            self._read_header()
+        except HardException:
+            self._map.close()
+            raise
+        except (struct.error, UnicodeDecodeError, ValueError) as exception:
+            self._map.close()
+            raise HardException(
+                "'{}' is not an account pool file or is truncated".format(
+                    path)) from exception
+
+    # =========================================================================
+    # __enter__
+    # =========================================================================
+
+    def __enter__(self) -> 'AccountPool':
+        return self
+
+    # =========================================================================
+    # __exit__
+    # =========================================================================
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    # =========================================================================
+    # __getitem__
+    # =========================================================================
+
+    def __getitem__(self, index: int) -> AccountNumber:
+        index = range(self._count)[index]
+        start: int = self._records_offset + index * self._record_size
+        record: str = self._map[start:start + self._record_size].decode(
+            'ascii')
+
+        (account_number_end, cvv_end, cvv_bad_end,
+         routing_number_end) = self._field_ends
+        cvv: str = record[account_number_end:cvv_end].rstrip()
+
+        account = self._cls.__new__(self._cls)
+        account._account_number = record[:account_number_end].rstrip()
+        account._bank_display_name = self._bank_display_name
+        account._bank_name = self._bank_name
+        account._cvv = cvv
+        account._cvv_bad = record[cvv_end:cvv_bad_end].rstrip()
+        account._cvv_length = len(cvv)
+        account._masker = self._masker
+        account._routing_number = intern(
+            record[cvv_bad_end:routing_number_end].rstrip())
+        account._use_bad_cvv = record[routing_number_end] == '1'
+        return account
+
+    # =========================================================================
+    # __iter__
+    # =========================================================================
+
+    def __iter__(self) -> Iterator[AccountNumber]:
+        return map(self.__getitem__, range(self._count))
+
+    # =========================================================================
+    # __len__
+    # =========================================================================
+
+    def __len__(self):
+        return self._count
+
+    # =========================================================================
+    # __str__
+    # =========================================================================
+
+    def __str__(self):
+        """
+        Returns a description of this pool.
+        """
+
+        return "{}: {} in '{}'".format(
+            type(self).__name__,
+            plural(self._count, '0', 'account', 'accounts'), self._path)
+
+    # =========================================================================
+    # close
+    # =========================================================================
+
+    def close(self) -> None:
+        """
+        Unmaps the pool file.
+        """
+
+        self._map.close()
+
+    # =========================================================================
+    # get_bank_display_name
+    # =========================================================================
+
+    def get_bank_display_name(self) -> str:
+        """
+        Returns the bank display name that the pool's accounts share.
+        """
+
+        return self._bank_display_name
+
+    # =========================================================================
+    # get_bank_name
+    # =========================================================================
+
+    def get_bank_name(self) -> str:
+        """
+        Returns the bank name that the pool's accounts share.
+        """
+
+        return self._bank_name
+
+    # =========================================================================
+    # _read_header
+    # =========================================================================
+
+    def _read_header(self) -> None:
+        """
+        Reads the header and checks that the file holds every record.
+
+        :raises HardException: The file is not a pool file or is truncated.
+        """
+
+        (magic, version, header_size, count, account_number_width,
+         cvv_width, routing_number_width, _) = _HEADER.unpack_from(self._map)
+        if magic != POOL_MAGIC:
+            raise HardException(
+                "'{}' is not an account pool file".format(self._path))
+        if version != POOL_VERSION:
+            raise HardException(
+                "'{}' has unsupported version {}".format(self._path, version))
+
+        if not _HEADER.size <= header_size <= len(self._map):
+            raise HardException(
+                "'{}' has a header of {} bytes in a file of {}".format(
+                    self._path, header_size, len(self._map)))
+
+        offset: int = _HEADER.size
+        self._bank_display_name, offset = _read_name(
+            self._map, offset, header_size)
+        self._bank_name, offset = _read_name(self._map, offset, header_size)
+
+        self._count: int = count
+        self._records_offset: int = header_size
+        self._record_size: int = _get_record_size(
+            account_number_width, cvv_width, routing_number_width)
+        self._field_ends: Tuple[int, int, int, int] = tuple(
+            itertools.accumulate((
+                account_number_width, cvv_width, cvv_width,
+                routing_number_width)))
+
+        expected: int = header_size + count * self._record_size
+        if len(self._map) != expected:
+            raise HardException(
+                "'{}' holds {} bytes but {} records need {}".format(
+                    self._path, len(self._map), count, expected))
+
+
+###############################################################################
+# AccountPoolWriter
+###############################################################################
+
+
+class AccountPoolWriter:
+    """
+    This class writes accounts to a pool file, one record at a time, so that
+    it writes pools of any size in bounded memory. The writer records the
+    count of accounts in the header when you close it, or when the ``with``
+    block that uses it ends.
+
+    :param path: The path of the pool file to create.
+    :param bank_display_name: The bank display name that the accounts share.
+    :param bank_name: The bank name that the accounts share.
+    :param account_number_width: The width of the account number field.
+    :param cvv_width: The width of each CVV field.
+    :param routing_number_width: The width of the routing number field.
+    """
+
+    ###########################################################################
+    # METHODS
+    ###########################################################################
+
+    # =========================================================================
+    # CONSTRUCTOR
+    # =========================================================================
+
+    def __init__(
+            self, path: str,
+            bank_display_name: Optional[str] = None,
+            bank_name: Optional[str] = None,
+            account_number_width: int = DEFAULT_ACCOUNT_NUMBER_WIDTH,
+            cvv_width: int = DEFAULT_CVV_WIDTH,
+            routing_number_width: int = DEFAULT_ROUTING_NUMBER_WIDTH):
+
+        assert 0 < account_number_width < 256, \
+            'You must provide an account_number_width from 1 to 255'
+        assert 0 <= cvv_width < 256, \
+            'You must provide a cvv_width from 0 to 255'
+        assert 0 <= routing_number_width < 256, \
+            'You must provide a routing_number_width from 0 to 255'
+
+        self._bank_display_name: str = bank_display_name or ''
+        self._bank_name: str = bank_name or ''
+        self._count: int = 0
+        self._widths: Tuple[int, int, int] = (
+            account_number_width, cvv_width, routing_number_width)
+
+        self._file: BinaryIO = open(path, 'wb')
+        self._file.write(self._get_header())
+
+    # =========================================================================
+    # __enter__
+    # =========================================================================
+
+    def __enter__(self) -> 'AccountPoolWriter':
+        return self
+
+    # =========================================================================
+    # __exit__
+    # =========================================================================
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    # =========================================================================
+    # close
+    # =========================================================================
+
+    def close(self) -> None:
+        """
+        Records the count of accounts in the header and closes the file.
+        """
+
+        if not self._file.closed:
+            self._file.seek(0)
+            self._file.write(self._get_header())
+            self._file.close()
+
+    # =========================================================================
+    # get_count
+    # =========================================================================
+
+    def get_count(self) -> int:
+        """
+        Returns the count of accounts written so far.
+        """
+
+        return self._count
+
+    # =========================================================================
+    # write
+    # =========================================================================
+
+    def write(self, account: AccountNumber) -> None:
+        """
+        Writes an account to the pool.
+
+        :param account: The account to write.
+        :raises HardException: The account's bank names differ from the
+            pool's, or one of its values does not fit its field.
+        """
+
+        if (account.get_bank_display_name(), account.get_bank_name()) != \
+                (self._bank_display_name, self._bank_name):
+            raise HardException(
+                "Account '{}' does not belong to bank '{}'".format(
+                    account.get_masked_number(), self._bank_display_name))
+
+        account._resolve_cvv()
+        account_number_width, cvv_width, routing_number_width = self._widths
+        record: str = ''.join((
+            _pad(account, 'account number', account.get_account_number(),
+                 account_number_width),
+            _pad(account, 'CVV', account._cvv, cvv_width),
+            _pad(account, 'bad CVV', account._cvv_bad, cvv_width),
+            _pad(account, 'routing number', account.get_routing_number(),
+                 routing_number_width),
+            '1' if account._use_bad_cvv else '0',
+            '\n'))
+        self._file.write(record.encode('ascii'))
+        self._count += 1
+
+    # =========================================================================
+    # write_all
+    # =========================================================================
+
+    def write_all(self, accounts: Iterable[AccountNumber]) -> int:
+        """
+        Writes accounts to the pool and returns the count written.
+
+        :param accounts: The accounts to write.
+        :raises HardException: An account's bank names differ from the
+            pool's, or one of its values does not fit its field.
+        """
+
+        start: int = self._count
+        for account in accounts:
+            self.write(account)
+        return self._count - start
+
+    # =========================================================================
+    # _get_header
+    # =========================================================================
+
+    def _get_header(self) -> bytes:
+        """
+        Returns the header for the accounts written so far.
+        """
+
+        names: bytes = b''.join(
+            _NAME_LENGTH.pack(len(_)) + _
+            for _ in (self._bank_display_name.encode('utf-8'),
+                      self._bank_name.encode('utf-8')))
+        return _HEADER.pack(
+            POOL_MAGIC, POOL_VERSION, _HEADER.size + len(names), self._count,
+            *self._widths, 0) + names
+
+
+###############################################################################
+# AccountNumberGeneratorPool
+###############################################################################
+
+
+class AccountNumberGeneratorPool(AccountNumberGenerator):
+    """
+    This class returns an AccountNumber from an AccountPool, either round
+    robin, like AccountNumberGeneratorFixed, or at random. It reads each
+    account from the pool file as it returns it, so it never loads the whole
+    pool, and threads can share it without a lock.
+
+    :param pool: The pool to draw from.
+    :param randomize: Set this to TRUE to pick accounts at random rather than
+        round robin.
+    :param seed: The seed of the generator's private random number generator
+        for random picks; if you omit this parameter, the generator seeds it
+        from the operating system, and reseeds it in each process forked
+        from this one.
+    """
+
+    ###########################################################################
+    # METHODS
+    ###########################################################################
+
+    # =========================================================================
+    # CONSTRUCTOR
+    # =========================================================================
+
+    def __init__(
+            self, pool: AccountPool,
+            randomize: bool = False,
+            seed: Optional[int] = None):
+
+        assert len(pool) > 0, \
+            'You must provide a pool with at least one account'
+
+        self._pool: AccountPool = pool
+        self._randomize: bool = randomize
+        self._random: random.Random = self._create_random(seed)
+
+        # Keeps track of the next account to select round robin; next() on an
+        # itertools.count is atomic.
+        self._counter: Iterator[int] = itertools.count()
+
+    # =========================================================================
+    # __str__
+    # =========================================================================
+
+    def __str__(self):
+        """
+        Returns a description of this account number generator.
+        """
+
+        return "{}: {} {}".format(
+            type(self).__name__, 'random picks from' if self._randomize
+            else 'round robin over', self._pool)
+
+    # =========================================================================
+    # get_new_number
+    # =========================================================================
+
+    def get_new_number(self) -> AccountNumber:
+        """
+        Returns the next account in the round-robin sequence, or a random
+        account.
+        """
+
+        count: int = len(self._pool)
+        return self._pool[self._random.randrange(count) if self._randomize
+                          else next(self._counter) % count]
+
+
+###############################################################################
+# METHODS - PRIVATE
+###############################################################################
+
+
+def _get_record_size(
+        account_number_width: int, cvv_width: int,
+        routing_number_width: int) -> int:
+    """
+    Returns the size of a record, including the bad CVV flag and the
+    newline.
+
+    :param account_number_width: The width of the account number field.
+    :param cvv_width: The width of each CVV field.
+    :param routing_number_width: The width of the routing number field.
+    """
+
+    return account_number_width + 2 * cvv_width + routing_number_width + 2
+
+
+def _pad(account: AccountNumber, name: str, value: str, width: int) -> str:
+    """
+    Returns a value padded with spaces to the width of its field.
+
+    :param account: The account that holds the value.
+    :param name: The name of the value, for the exception message.
+    :param value: The value.
+    :param width: The width of the field.
+    :raises HardException: The value does not fit the field or is not ASCII
+        without spaces.
+    """
+
+    if len(value) > width or not value.isascii() or ' ' in value:
+        raise HardException(
+            "The {} of account '{}' does not fit a field of width {}".format(
+                name, account.get_masked_number(), width))
+    return value.ljust(width)
+
+
+def _read_name(
+        buffer: mmap.mmap, offset: int, end: int) -> Tuple[str, int]:
+    """
+    Reads a bank name from the header and returns the name and the offset
+    that follows it.
+
+    :param buffer: The mapped pool file.
+    :param offset: The offset of the name's byte count.
+    :param end: The offset at which the header ends.
+    :raises ValueError: The name runs past the end of the header.
+    """
+
+    if offset + _NAME_LENGTH.size > end:
+        raise ValueError('bank name length past end of header')
+    (length,) = _NAME_LENGTH.unpack_from(buffer, offset)
+    offset += _NAME_LENGTH.size
+    if offset + length > end:
+        raise ValueError('bank name past end of header')
+    name: str = buffer[offset:offset + length].decode('utf-8')
+    return intern(name), offset + length
@@ -0,0 +1,143 @@
+"""
+Created on October 17, 2026
+
+This module provides Walker's alias method for drawing indexes from a
+discrete probability distribution in constant time per draw, however many
+indexes the distribution covers.
+"""
+
+from typing import List, Sequence, Tuple
+
+###############################################################################
+# AliasTable
+###############################################################################
+
+
+class AliasTable:
+    """
+    This class draws index i in the range 0 through len(**weights**)-1 with
+    probability proportional to **weights**\\[i\\]. Building the table takes
+    time linear in the count of weights (Vose's construction); each draw
+    takes one random number and one table lookup.
+
+    The table splits the distribution into equal columns, one per index.
+    Column i keeps index i with probability ``_probabilities[i]`` and gives
+    index ``_aliases[i]`` otherwise.
+
+    :param weights: The non-negative weights, which need not sum to 1; at
+        least one must be positive.
+    """
+
+    ###########################################################################
+    # METHODS
+    ###########################################################################
+
+    # =========================================================================
+    # CONSTRUCTOR
+    # =========================================================================
+
+    def __init__(self, weights: Sequence[float]):
+
+        assert weights, 'You must provide at least one weight'
+        assert all(_ >= 0 for _ in weights), \
+            'You must provide weights >= 0'
+        total: float = sum(weights)
+        assert total > 0, 'You must provide at least one weight > 0'
+
+        size: int = len(weights)
+        self._size: int = size
+        self._weights: Tuple[float, ...] = tuple(_ / total for _ in weights)
+
+        # Scale the weights so that the average column holds 1, then fill
+        # each underfull column with the excess of an overfull one.
+        scaled: List[float] = [_ * size for _ in self._weights]
+        probabilities: List[float] = [1.0] * size
+        aliases: List[int] = list(range(size))
+        small: List[int] = [i for i, _ in enumerate(scaled) if _ < 1]
+        large: List[int] = [i for i, _ in enumerate(scaled) if _ >= 1]
+        while small and large:
+            less: int = small.pop()
+            more: int = large[-1]
+            probabilities[less] = scaled[less]
+            aliases[less] = more
+            scaled[more] -= 1 - scaled[less]
+            if scaled[more] < 1:
+                small.append(large.pop())
+
+        # Columns left over from rounding error keep their own index.
+        self._probabilities: Tuple[float, ...] = tuple(probabilities)
+        self._aliases: Tuple[int, ...] = tuple(aliases)
+
+    # =========================================================================
+    # __len__
+    # =========================================================================
+
+    def __len__(self):
+        return self._size
+
+    # =========================================================================
+    # __str__
+    # =========================================================================
+
+    def __str__(self):
+        return "{}: {}".format(
+            type(self).__name__,
+            ', '.join('{:.1%}'.format(_) for _ in self._weights))
+
+    # =========================================================================
+    # get_weights
+    # =========================================================================
+
+    def get_weights(self) -> Tuple[float, ...]:
+        """
+        Returns the weights, normalized to sum to 1.
+        """
+
+        return self._weights
+
+    # =========================================================================
+    # sample
+    # =========================================================================
+
+    def sample(self, generator) -> int:
+        """
+        Draws an index.
+
+        :param generator: The source of random numbers: a random.Random or
+            the random module.
+        """
+
+        # The integer part of the draw picks the column and the fractional
+        # part picks between the column's index and its alias.
+        value: float = generator.random() * self._size
+        index: int = min(int(value), self._size - 1)
+        return index if value - index < self._probabilities[index] \
+            else self._aliases[index]
+
+    # =========================================================================
+    # sample_many
+    # =========================================================================
+
+    def sample_many(self, generator, count: int) -> List[int]:
+        """
+        Draws the specified count of indexes.
+
+        :param generator: The source of random numbers: a random.Random or
+            the random module.
+        :param count: The count of indexes to draw.
+        """
+
+        size: int = self._size
+        last: int = size - 1
+        probabilities: Tuple[float, ...] = self._probabilities
+        aliases: Tuple[int, ...] = self._aliases
+        draw = generator.random
+
+        indexes: List[int] = []
+        append = indexes.append
+        for _ in range(count):
+            value: float = draw() * size
+            index: int = min(int(value), last)
+            append(index if value - index < probabilities[index]
+                   else aliases[index])
+        return indexes
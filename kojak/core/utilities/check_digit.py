@@ -0,0 +1,691 @@
+"""
+Created on October 17, 2026
+
+This module provides a family of check-digit engines (LUHN, Verhoeff, Damm,
+and ISO 7064 mod 97-10) behind one interface, so that account numbers can
+select the check-digit algorithm that their issuer uses.
+
+Every engine here is a table-driven state machine: starting from state 0, it
+visits the digits of a number string one at a time and looks up the next
+state in its tables.  The batch methods run the state machine for many
+number strings at once by holding the states of all of the number strings as
+byte "lanes" of one bytes object and by stepping all of the lanes through
+each column of digits with ``bytes.translate()`` and big-integer addition.
+"""
+
+from abc import ABC
+from itertools import islice
+from operator import not_
+from typing import Iterable, Iterator, List, Optional, Sequence, Tuple
+
+from kojak.core.utilities import luhn_algorithm
+
+###############################################################################
+# CONSTANTS
+###############################################################################
+
+# Specifies the default count of number strings that the stream methods pass
+# to the batch methods at a time.
+DEFAULT_STREAM_BATCH_SIZE: int = 65536
+
+# Holds the ASCII digits, which are the only characters the engines accept.
+_ASCII_DIGITS: bytes = b'0123456789'
+
+
+###############################################################################
+# CheckDigitEngine
+###############################################################################
+
+
+class CheckDigitEngine(ABC):
+    """
+    This base class computes and verifies check digits with a table-driven
+    state machine that a subclass describes with the tables below. Each step
+    of the state machine replaces the state *s* and the digit *d* at position
+    *i* with ``combine[state[s] + digit[i % len(digit)][d]]``.
+
+    :param name: The name of the algorithm.
+    :param right_to_left: Set this to TRUE if the state machine visits the
+        digits from the right-most digit to the left-most digit.
+    :param state_table: A 256-byte translation table for the state term.
+    :param digit_tables: A tuple of 256-byte translation tables for the digit
+        term, indexed by position; the tables translate ASCII digits.
+    :param combine_table: A 256-byte translation table that maps the sum of
+        the state and the digit terms to the next state.
+    :param valid_state: The final state of a number string that passes the
+        check.
+    :param check_strings: A tuple of check-digit strings indexed by the final
+        state of the number string without its check digits.
+    :param check_offset: The position of the first digit that the state
+        machine visits when computing a check digit; the position of the
+        first digit is 0 when verifying a number string.
+    :param check_trailer: The digits that stand in for the check digits when
+        computing a check digit.
+    """
+
+    ###########################################################################
+    # METHODS
+    ###########################################################################
+
+    # =========================================================================
+    # CONSTRUCTOR
+    # =========================================================================
+
+    def __init__(
+            self, name: str, right_to_left: bool, state_table: bytes,
+            digit_tables: Tuple[bytes, ...], combine_table: bytes,
+            valid_state: int, check_strings: Tuple[str, ...],
+            check_offset: int = 0, check_trailer: str = ''):
+
+        self._name: str = name
+        self._right_to_left: bool = right_to_left
+        self._state_table: bytes = state_table
+        self._digit_tables: Tuple[bytes, ...] = digit_tables
+        self._combine_table: bytes = combine_table
+        self._valid_state: int = valid_state
+        self._check_strings: Tuple[str, ...] = check_strings
+        self._check_offset: int = check_offset
+        self._check_trailer: str = check_trailer
+
+        # Holds the count of check digits that the algorithm appends.
+        self._check_length: int = len(check_strings[0])
+
+    # =========================================================================
+    # __str__
+    # =========================================================================
+
+    def __str__(self):
+        return "{}: name='{}' check_length={}".format(
+            type(self).__name__, self._name, self._check_length)
+
+    # =========================================================================
+    # add_checksum
+    # =========================================================================
+
+    def add_checksum(self, number_string: Optional[str] = None) -> str:
+        """
+        Returns the completed number string with the check digits appended.
+
+        :param number_string: The number string, less the check digits.
+        :raises ValueError: The number string contains a non-digit character.
+        """
+
+        number_string = number_string or ''
+        return number_string + self.get_check_digit(number_string)
+
+    # =========================================================================
+    # add_checksum_batch
+    # =========================================================================
+
+    def add_checksum_batch(
+            self, number_strings: Iterable[Optional[str]]) -> List[str]:
+        """
+        Returns the completed number strings with the check digits appended.
+
+        :param number_strings: An iterable of number strings, less the check
+            digits.
+        :raises ValueError: A number string contains a non-digit character.
+        """
+
+        number_strings = [_ or '' for _ in number_strings]
+        return list(map(
+            str.__add__, number_strings,
+            self.get_check_digit_batch(number_strings)))
+
+    # =========================================================================
+    # add_checksum_stream
+    # =========================================================================
+
+    def add_checksum_stream(
+            self, number_strings: Iterable[Optional[str]],
+            batch_size: int = DEFAULT_STREAM_BATCH_SIZE) -> Iterator[str]:
+        """
+        Generates the completed number strings with the check digits appended,
+        passing the number strings to ``add_checksum_batch()`` a batch at a
+        time so that the stream may be arbitrarily long.
+
+        :param number_strings: An iterable of number strings, less the check
+            digits.
+        :param batch_size: The count of number strings in each batch.
+        :raises ValueError: A number string contains a non-digit character.
+        """
+
+        for batch in _get_batches(number_strings, batch_size):
+            yield from self.add_checksum_batch(batch)
+
+    # =========================================================================
+    # get_check_digit
+    # =========================================================================
+
+    def get_check_digit(self, number_string: Optional[str]) -> str:
+        """
+        Returns the check digits for the specified number string.
+
+        :param number_string: The number string without the check digits.
+        :raises ValueError: The number string contains a non-digit character.
+        """
+
+        return self._check_strings[self._run(
+            (number_string or '') + self._check_trailer, self._check_offset)]
+
+    # =========================================================================
+    # get_check_digit_batch
+    # =========================================================================
+
+    def get_check_digit_batch(
+            self, number_strings: Iterable[Optional[str]]) -> List[str]:
+        """
+        Returns the check digits for each of the specified number strings.
+
+        :param number_strings: An iterable of number strings without the
+            check digits.
+        :raises ValueError: A number string contains a non-digit character.
+        """
+
+        states: bytes = self._run_batch(
+            number_strings, self._check_offset, self._check_trailer)
+        return list(map(self._check_strings.__getitem__, states))
+
+    # =========================================================================
+    # get_check_length
+    # =========================================================================
+
+    def get_check_length(self) -> int:
+        """
+        Returns the count of check digits that the algorithm appends.
+        """
+
+        return self._check_length
+
+    # =========================================================================
+    # get_name
+    # =========================================================================
+
+    def get_name(self) -> str:
+        """
+        Returns the name of the algorithm.
+        """
+
+        return self._name
+
+    # =========================================================================
+    # set_checksum
+    # =========================================================================
+
+    def set_checksum(self, number_string: Optional[str]) -> str:
+        """
+        Returns the number string with the check digits computed.
+
+        :param number_string: The number string, including stand-ins for the
+            check digits.
+        :raises ValueError: The number string contains a non-digit character.
+        """
+
+        return self.add_checksum(
+            number_string[:-self._check_length] if number_string else None)
+
+    # =========================================================================
+    # verify_checksum
+    # =========================================================================
+
+    def verify_checksum(self, number_string: Optional[str]) -> bool:
+        """
+        Returns TRUE if the check digits are correct for the specified number
+        string.
+
+        :param number_string: The number string, including the check digits.
+        :raises ValueError: The number string contains a non-digit character.
+        """
+
+        return self._run(number_string or '', 0) == self._valid_state
+
+    # =========================================================================
+    # verify_checksum_batch
+    # =========================================================================
+
+    def verify_checksum_batch(
+            self, number_strings: Iterable[Optional[str]]) -> List[bool]:
+        """
+        Returns TRUE for each of the specified number strings whose check
+        digits are correct.
+
+        :param number_strings: An iterable of number strings, including the
+            check digits.
+        :raises ValueError: A number string contains a non-digit character.
+        """
+
+        states: bytes = self._run_batch(number_strings, 0, '')
+        return list(map(self._valid_state.__eq__, states))
+
+    # =========================================================================
+    # verify_checksum_stream
+    # =========================================================================
+
+    def verify_checksum_stream(
+            self, number_strings: Iterable[Optional[str]],
+            batch_size: int = DEFAULT_STREAM_BATCH_SIZE) -> Iterator[bool]:
+        """
+        Generates TRUE for each of the specified number strings whose check
+        digits are correct, passing the number strings to
+        ``verify_checksum_batch()`` a batch at a time so that the stream may
+        be arbitrarily long.
+
+        :param number_strings: An iterable of number strings, including the
+            check digits.
+        :param batch_size: The count of number strings in each batch.
+        :raises ValueError: A number string contains a non-digit character.
+        """
+
+        for batch in _get_batches(number_strings, batch_size):
+            yield from self.verify_checksum_batch(batch)
+
+    # =========================================================================
+    # _run
+    # =========================================================================
+
+    def _run(self, number_string: str, offset: int) -> int:
+        """
+        Runs the state machine over a number string and returns the final
+        state.
+
+        :param number_string: The number string.
+        :param offset: The position of the first digit that the state machine
+            visits.
+        :raises ValueError: The number string contains a non-digit character.
+        """
+
+        digits: bytes = _encode_digits(number_string)
+        if self._right_to_left:
+            digits = digits[::-1]
+
+        state_table: bytes = self._state_table
+        digit_tables: Tuple[bytes, ...] = self._digit_tables
+        combine_table: bytes = self._combine_table
+        period: int = len(digit_tables)
+
+        state: int = 0
+        for i, digit in enumerate(digits, offset):
+            state = combine_table[
+                state_table[state] + digit_tables[i % period][digit]]
+        return state
+
+    # =========================================================================
+    # _run_batch
+    # =========================================================================
+
+    def _run_batch(
+            self, number_strings: Iterable[Optional[str]], offset: int,
+            trailer: str) -> bytes:
+        """
+        Runs the state machine over each of the number strings and returns the
+        final states as a bytes object with one byte per number string.
+
+        :param number_strings: The number strings.
+        :param offset: The position of the first digit that the state machine
+            visits.
+        :param trailer: The digits to append to each number string.
+        :raises ValueError: A number string contains a non-digit character.
+        """
+
+        number_strings = list(number_strings)
+        if None in number_strings:
+            number_strings = [_ or '' for _ in number_strings]
+
+        # Skip the sort-and-scatter steps in the common case where all of
+        # the number strings have the same length.
+        lengths: List[int] = list(map(len, number_strings))
+        if len(set(lengths)) <= 1:
+            return self._run_lanes(number_strings, offset, trailer)
+
+        # Sort the number strings by length so that each run of equal-length
+        # number strings lines up column by column.
+        order: List[int] = sorted(range(len(lengths)), key=lengths.__getitem__)
+        sorted_strings: List[str] = list(map(number_strings.__getitem__, order))
+        states = bytearray()
+        start: int = 0
+        while start < len(order):
+            end: int = start + lengths.count(lengths[order[start]])
+            states += self._run_lanes(
+                sorted_strings[start:end], offset, trailer)
+            start = end
+
+        # Scatter the states back into the original order.
+        inverse: List[int] = sorted(range(len(order)), key=order.__getitem__)
+        return bytes(map(states.__getitem__, inverse))
+
+    # =========================================================================
+    # _run_lanes
+    # =========================================================================
+
+    def _run_lanes(
+            self, number_strings: Sequence[str], offset: int,
+            trailer: str) -> bytes:
+        """
+        Runs the state machine over number strings of equal length, one byte
+        lane per number string, and returns the final states as a bytes
+        object with one byte per number string.
+
+        :param number_strings: The number strings, all of the same length.
+        :param offset: The position of the first digit that the state machine
+            visits.
+        :param trailer: The digits to append to each number string.
+        :raises ValueError: A number string contains a non-digit character.
+        """
+
+        count: int = len(number_strings)
+        length: int = len(number_strings[0]) if count else 0
+        digits: bytes = _encode_digits(''.join(number_strings))
+
+        # Slice the digits into columns in the order that the state machine
+        # visits them.
+        columns: List[bytes] = [digits[_::length] for _ in range(length)] + \
+            [_.encode('ascii') * count for _ in trailer]
+        if self._right_to_left:
+            columns.reverse()
+
+        state_table: bytes = self._state_table
+        digit_tables: Tuple[bytes, ...] = self._digit_tables
+        combine_table: bytes = self._combine_table
+        period: int = len(digit_tables)
+
+        # The state and digit terms of every lane fit in one byte, so adding
+        # the columns as big integers adds every lane without carries.
+        states: bytes = bytes(count)
+        for i, column in enumerate(columns, offset):
+            lanes: int = \
+                int.from_bytes(states.translate(state_table), 'big') \
+                + int.from_bytes(
+                    column.translate(digit_tables[i % period]), 'big')
+            states = lanes.to_bytes(count, 'big').translate(combine_table)
+        return states
+
+
+###############################################################################
+# LuhnCheckDigitEngine
+###############################################################################
+
+
+class LuhnCheckDigitEngine(CheckDigitEngine):
+    """
+    This class computes and verifies LUHN check digits. The scalar methods
+    hand off to the ``luhn_algorithm`` module.
+    """
+
+    ###########################################################################
+    # METHODS
+    ###########################################################################
+
+    # =========================================================================
+    # CONSTRUCTOR
+    # =========================================================================
+
+    def __init__(self):
+        super().__init__(
+            name='LUHN',
+            right_to_left=True,
+            state_table=_get_table(range(10)),
+            digit_tables=(
+                _get_digit_table(range(10)),
+                _get_digit_table(luhn_algorithm._LUHN_MULTIPLY_BY_TWO)),
+            combine_table=_get_table(_ % 10 for _ in range(19)),
+            valid_state=0,
+            check_strings=tuple(str((10 - _) % 10) for _ in range(10)),
+            check_offset=1)
+
+    # =========================================================================
+    # add_checksum
+    # =========================================================================
+
+    def add_checksum(self, number_string: Optional[str] = None) -> str:
+        return luhn_algorithm.add_checksum(number_string)
+
+    # =========================================================================
+    # get_check_digit
+    # =========================================================================
+
+    def get_check_digit(self, number_string: Optional[str]) -> str:
+        return str(luhn_algorithm.get_check_digit(number_string))
+
+    # =========================================================================
+    # set_checksum
+    # =========================================================================
+
+    def set_checksum(self, number_string: Optional[str]) -> str:
+        return luhn_algorithm.set_checksum(number_string)
+
+    # =========================================================================
+    # verify_checksum
+    # =========================================================================
+
+    def verify_checksum(self, number_string: Optional[str]) -> bool:
+        return luhn_algorithm.verify_checksum(number_string)
+
+
+###############################################################################
+# VerhoeffCheckDigitEngine
+###############################################################################
+
+
+class VerhoeffCheckDigitEngine(CheckDigitEngine):
+    """
+    This class computes and verifies Verhoeff check digits, which catch every
+    single-digit error and every adjacent transposition.
+    """
+
+    ###########################################################################
+    # CONSTANTS - PRIVATE
+    ###########################################################################
+
+    # The multiplication table of the dihedral group D5.
+    _MULTIPLY = (
+        (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+        (1, 2, 3, 4, 0, 6, 7, 8, 9, 5),
+        (2, 3, 4, 0, 1, 7, 8, 9, 5, 6),
+        (3, 4, 0, 1, 2, 8, 9, 5, 6, 7),
+        (4, 0, 1, 2, 3, 9, 5, 6, 7, 8),
+        (5, 9, 8, 7, 6, 0, 4, 3, 2, 1),
+        (6, 5, 9, 8, 7, 1, 0, 4, 3, 2),
+        (7, 6, 5, 9, 8, 2, 1, 0, 4, 3),
+        (8, 7, 6, 5, 9, 3, 2, 1, 0, 4),
+        (9, 8, 7, 6, 5, 4, 3, 2, 1, 0),
+    )
+
+    # The permutation applied to a digit, indexed by its position modulo 8.
+    _PERMUTE = (
+        (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+        (1, 5, 7, 6, 2, 8, 3, 0, 9, 4),
+        (5, 8, 0, 3, 7, 9, 6, 1, 4, 2),
+        (8, 9, 1, 6, 0, 4, 3, 5, 2, 7),
+        (9, 4, 5, 3, 1, 2, 6, 8, 7, 0),
+        (4, 2, 8, 6, 5, 7, 3, 9, 0, 1),
+        (2, 7, 9, 3, 8, 0, 6, 4, 1, 5),
+        (7, 0, 4, 6, 9, 1, 3, 2, 5, 8),
+    )
+
+    # The inverse of each element of D5.
+    _INVERSE = (0, 4, 3, 2, 1, 5, 6, 7, 8, 9)
+
+    ###########################################################################
+    # METHODS
+    ###########################################################################
+
+    # =========================================================================
+    # CONSTRUCTOR
+    # =========================================================================
+
+    def __init__(self):
+        super().__init__(
+            name='Verhoeff',
+            right_to_left=True,
+            state_table=_get_table(10 * _ for _ in range(10)),
+            digit_tables=tuple(_get_digit_table(_) for _ in self._PERMUTE),
+            combine_table=_get_table(
+                _ for row in self._MULTIPLY for _ in row),
+            valid_state=0,
+            check_strings=tuple(str(_) for _ in self._INVERSE),
+            check_offset=1)
+
+
+###############################################################################
+# DammCheckDigitEngine
+###############################################################################
+
+
+class DammCheckDigitEngine(CheckDigitEngine):
+    """
+    This class computes and verifies Damm check digits, which catch every
+    single-digit error and every adjacent transposition.
+    """
+
+    ###########################################################################
+    # CONSTANTS - PRIVATE
+    ###########################################################################
+
+    # A totally anti-symmetric quasigroup of order 10.
+    _QUASIGROUP = (
+        (0, 3, 1, 7, 5, 9, 8, 6, 4, 2),
+        (7, 0, 9, 2, 1, 5, 4, 8, 6, 3),
+        (4, 2, 0, 6, 8, 7, 1, 3, 5, 9),
+        (1, 7, 5, 0, 9, 8, 3, 4, 2, 6),
+        (6, 1, 2, 3, 0, 4, 5, 9, 7, 8),
+        (3, 6, 7, 4, 2, 0, 9, 5, 8, 1),
+        (5, 8, 6, 9, 7, 2, 0, 1, 3, 4),
+        (8, 9, 4, 5, 3, 6, 2, 0, 1, 7),
+        (9, 4, 3, 8, 6, 1, 7, 2, 0, 5),
+        (2, 5, 8, 1, 4, 3, 6, 7, 9, 0),
+    )
+
+    ###########################################################################
+    # METHODS
+    ###########################################################################
+
+    # =========================================================================
+    # CONSTRUCTOR
+    # =========================================================================
+
+    def __init__(self):
+        super().__init__(
+            name='Damm',
+            right_to_left=False,
+            state_table=_get_table(10 * _ for _ in range(10)),
+            digit_tables=(_get_digit_table(range(10)),),
+            combine_table=_get_table(
+                _ for row in self._QUASIGROUP for _ in row),
+            valid_state=0,
+            check_strings=tuple(str(_) for _ in range(10)))
+
+
+###############################################################################
+# Mod97CheckDigitEngine
+###############################################################################
+
+
+class Mod97CheckDigitEngine(CheckDigitEngine):
+    """
+    This class computes and verifies the two ISO 7064 mod 97-10 check digits
+    of a numeric string, as used in IBANs. A number string passes the check
+    if, as an integer, it is 1 modulo 97. The scalar methods take the modulus
+    of the whole integer at once.
+    """
+
+    ###########################################################################
+    # METHODS
+    ###########################################################################
+
+    # =========================================================================
+    # CONSTRUCTOR
+    # =========================================================================
+
+    def __init__(self):
+        super().__init__(
+            name='ISO 7064 mod 97-10',
+            right_to_left=False,
+            state_table=_get_table(10 * _ % 97 for _ in range(97)),
+            digit_tables=(_get_digit_table(range(10)),),
+            combine_table=_get_table(_ % 97 for _ in range(106)),
+            valid_state=1,
+            check_strings=tuple('{:02d}'.format(98 - _) for _ in range(97)),
+            check_trailer='00')
+
+    # =========================================================================
+    # _run
+    # =========================================================================
+
+    def _run(self, number_string: str, offset: int) -> int:
+        digits: bytes = _encode_digits(number_string)
+        return int(digits) % 97 if digits else 0
+
+
+###############################################################################
+# METHODS - PRIVATE
+###############################################################################
+
+
+def _encode_digits(number_string: str) -> bytes:
+    """
+    Returns the specified number string as ASCII digits.
+
+    :param number_string: The number string.
+    :raises ValueError: The number string contains a non-digit character.
+    """
+
+    try:
+        digits: bytes = number_string.encode('ascii')
+    except UnicodeEncodeError:
+        digits = b'?'
+    if digits.translate(None, _ASCII_DIGITS):
+        raise ValueError(
+            "Non-digit character in number string '{}'".format(number_string))
+    return digits
+
+
+def _get_batches(
+        iterable: Iterable[Optional[str]],
+        batch_size: int) -> Iterator[List[Optional[str]]]:
+    """
+    Generates lists of up to **batch_size** consecutive items of an iterable.
+
+    :param iterable: The iterable to split.
+    :param batch_size: The maximum count of items in each list.
+    """
+
+    iterator: Iterator[Optional[str]] = iter(iterable)
+    batch: List[Optional[str]] = list(islice(iterator, batch_size))
+    while batch:
+        yield batch
+        batch = list(islice(iterator, batch_size))
+
+
+def _get_digit_table(values: Iterable[int]) -> bytes:
+    """
+    Returns a 256-byte translation table that maps the ASCII digits '0'
+    through '9' to the specified values, in order.
+
+    :param values: The ten values.
+    """
+
+    return bytes.maketrans(_ASCII_DIGITS, bytes(values))
+
+
+def _get_table(values: Iterable[int]) -> bytes:
+    """
+    Returns a 256-byte translation table that maps 0, 1, 2, ... to the
+    specified values, in order, and maps the remaining bytes to zero.
+
+    :param values: The values.
+    """
+
+    table = bytearray(256)
+    for i, value in enumerate(values):
+        table[i] = value
+    return bytes(table)
+
+
+###############################################################################
+# ENGINES
+###############################################################################
+
+LUHN: CheckDigitEngine = LuhnCheckDigitEngine()
+VERHOEFF: CheckDigitEngine = VerhoeffCheckDigitEngine()
+DAMM: CheckDigitEngine = DammCheckDigitEngine()
+MOD97_10: CheckDigitEngine = Mod97CheckDigitEngine()
@@ -7,12 +7,21 @@ checksum algorithm.
 @author: John Jackson
 """
 
-from typing import Optional
+from collections import OrderedDict
+from itertools import repeat
+from operator import not_
+from threading import Lock
+from typing import (
+    Container, Dict, Iterable, Iterator, List, Optional, Tuple, Union)
 
 ###############################################################################
 # CONSTANTS
 ###############################################################################
 
+# Specifies the default count of prefixes that the prefix cache holds before
+# it evicts the least recently used prefix.
+DEFAULT_PREFIX_CACHE_SIZE: int = 1024
+
 # Use these tables to "luhn-divide" and "luhn-multiply" a digit by two.
 # When the Luhn algorithm multiplies a digit by two, the result is the product
 # itself for single-digit products (2*3=6 => 6) and the sum of the digits
@@ -29,6 +38,362 @@ _LUHN_DIVIDE_BY_TWO = (0, 5, 1, 6, 2, 7, 3, 8, 4, 9)
 
 _LUHN_MULTIPLY_BY_TWO = (0, 2, 4, 6, 8, 1, 3, 5, 7, 9)
 
+# The scalar methods consume digits four at a time.  Index into these tables
+# with a two-digit value (00-99) to get back the sum that the pair of digits
+# contributes to the checksum; "DOUBLE_DOWN" applies when the right-most digit
+# of the pair is a double-down digit, "PLAIN" when the left-most digit is.
+
+_LUHN_PAIR_DOUBLE_DOWN = tuple(
+    left + _LUHN_MULTIPLY_BY_TWO[right]
+    for left in range(10) for right in range(10))
+
+_LUHN_PAIR_PLAIN = tuple(
+    _LUHN_MULTIPLY_BY_TWO[left] + right
+    for left in range(10) for right in range(10))
+
+# Index into these tables with a four-digit value (0000-9999) to get back the
+# sum that the four digits contribute to the checksum.  Since a group of four
+# digits has an even length, every group of a number string shares the same
+# table.
+
+_LUHN_QUAD_DOUBLE_DOWN = tuple(
+    _LUHN_PAIR_DOUBLE_DOWN[left] + _LUHN_PAIR_DOUBLE_DOWN[right]
+    for left in range(100) for right in range(100))
+
+_LUHN_QUAD_PLAIN = tuple(
+    _LUHN_PAIR_PLAIN[left] + _LUHN_PAIR_PLAIN[right]
+    for left in range(100) for right in range(100))
+
+# The scalar methods convert a number string to an integer in chunks of at
+# most this many digits to keep the integer arithmetic cheap; the value must
+# be even so that every chunk keeps the parity of the digits.
+
+_LUHN_DIGITS_PER_CHUNK = 32
+
+# Index into these tables with an ASCII byte value (0-255) to get back the
+# value that the byte contributes to the checksum in a plain position and in a
+# double-down position.  Non-digit bytes map to a value so large that the sum
+# of any realistic number of digits can never reach it.
+
+_LUHN_ASCII_INVALID = 1 << 48
+
+_LUHN_ASCII_PLAIN = tuple(
+    _ - 0x30 if 0x30 <= _ <= 0x39 else _LUHN_ASCII_INVALID
+    for _ in range(256))
+
+_LUHN_ASCII_DOUBLE_DOWN = tuple(
+    _LUHN_MULTIPLY_BY_TWO[_ - 0x30] if 0x30 <= _ <= 0x39
+    else _LUHN_ASCII_INVALID
+    for _ in range(256))
+
+# Index into this string with a single-digit value (0-9) to get back the
+# digit character.
+
+_DIGITS = '0123456789'
+
+# The batch methods compute many checksums at once by treating each
+# ASCII-encoded column of digits as one big integer with a byte "lane" per
+# number string; adding the column integers adds every lane in parallel.
+# Translate an ASCII digit column with these tables to get the digit values
+# for the plain and the "luhn-multiplied" positions.
+
+_LUHN_BATCH_PLAIN = bytes.maketrans(b'0123456789', bytes(range(10)))
+
+_LUHN_BATCH_DOUBLE = bytes.maketrans(
+    b'0123456789', bytes(_LUHN_MULTIPLY_BY_TWO))
+
+# Translate a column of lane sums with this table to reduce each lane to its
+# "ones" digit, which is the lane's LUHN checksum.
+
+_LUHN_BATCH_MOD_10 = bytes(_ % 10 for _ in range(256))
+
+# Translate a column of reduced checksums with this table to get the check
+# digit that each checksum calls for.
+
+_LUHN_BATCH_CHECK_DIGIT = bytes((10 - _) % 10 for _ in range(256))
+
+# A byte lane overflows past 255, so the batch methods reduce the lanes
+# modulo 10 after adding at most this many columns (9 + 27*9 = 252).
+
+_LUHN_BATCH_COLUMNS_PER_REDUCTION = 27
+
+
+###############################################################################
+# TYPES
+###############################################################################
+
+# The checksum methods accept a number string either as text or as a buffer
+# of ASCII digits, such as a slice of a receive buffer.
+
+NumberString = Union[str, bytes, bytearray, memoryview]
+
+
+###############################################################################
+# PREFIX CACHE
+###############################################################################
+
+# Holds a LuhnAccumulator for each registered prefix, from the least to the
+# most recently used, so that computing a check-digit for a number string
+# that starts with a registered prefix only has to touch the rest of the
+# number string.
+_prefix_cache: 'OrderedDict[str, LuhnAccumulator]' = OrderedDict()
+
+# Holds the count of cached prefixes of each length.
+_prefix_cache_lengths: Dict[int, int] = {}
+
+# Holds the lengths of the cached prefixes, longest first, which tells us
+# which leading slices of a number string to look up in the cache.
+_prefix_cache_probes: Tuple[int, ...] = ()
+
+# Holds the count of prefixes that the cache holds before it evicts the least
+# recently used prefix.
+_prefix_cache_size: int = DEFAULT_PREFIX_CACHE_SIZE
+
+# Guards the prefix cache against concurrent updates.
+_prefix_cache_lock: Lock = Lock()
+
+
+###############################################################################
+# LuhnAccumulator
+###############################################################################
+
+
+class LuhnAccumulator:
+    """
+    This class keeps the running LUHN checksums of a number string as you
+    build it, so that you never have to rescan the number string. Appending
+    or prepending digits costs only the digits added and getting the
+    check-digit costs nothing more.
+
+    The accumulator keeps two sums: one where the right-most digit would be a
+    double-down digit, which gives the check-digit of the number string, and
+    one where it would not, which verifies a number string that already ends
+    in its check-digit.  Appending a digit swaps the roles of the two sums.
+
+    :param number_string: An optional number string to start with.
+    """
+
+    ###########################################################################
+    # METHODS
+    ###########################################################################
+
+    # =========================================================================
+    # CONSTRUCTOR
+    # =========================================================================
+
+    def __init__(self, number_string: Optional[str] = None):
+
+        # Holds the count of digits accumulated so far.
+        self._length: int = 0
+
+        # Holds the checksum of the digits if the right-most digit were a
+        # double-down digit.
+        self._double_down_checksum: int = 0
+
+        # Holds the checksum of the digits if the right-most digit were not
+        # a double-down digit.
+        self._plain_checksum: int = 0
+
+        if number_string:
+            self.append(number_string)
+
+    # =========================================================================
+    # __len__
+    # =========================================================================
+
+    def __len__(self):
+        return self._length
+
+    # =========================================================================
+    # __str__
+    # =========================================================================
+
+    def __str__(self):
+        return "{}: length={} check_digit={} valid={}".format(
+            type(self).__name__, self._length, self.get_check_digit(),
+            self.is_valid())
+
+    # =========================================================================
+    # add_prefix
+    # =========================================================================
+
+    def add_prefix(self, prefix: Optional[str]) -> Optional[int]:
+        """
+        Prepends the specified prefix plus an adjustment digit while
+        preserving the LUHN checksum of the accumulated digits, just as
+        ``add_prefix()`` does for a LUHN number string.  Returns the
+        adjustment digit, which goes between the prefix and the accumulated
+        digits; returns None if the prefix is null or empty, in which case
+        the method does nothing.
+
+        :param prefix: The prefix string.
+        """
+
+        if not prefix:
+            return None
+
+        # Choose the adjustment digit that cancels the prefix's contribution
+        # to the checksum of the completed LUHN string. The adjustment digit
+        # is a double-down digit if it falls in an odd position.
+        prefix_checksum: int = _get_checksum(prefix, self._length % 2 == 0)
+        adjustment: int = (10 - prefix_checksum) % 10
+        if self._length % 2 == 1:
+            adjustment = _LUHN_DIVIDE_BY_TWO[adjustment]
+
+        self.prepend_digit(adjustment)
+        self.prepend(prefix)
+        return adjustment
+
+    # =========================================================================
+    # append
+    # =========================================================================
+
+    def append(self, number_string: str) -> None:
+        """
+        Appends the digits of the specified number string.
+
+        :param number_string: The digits to append.
+        :raises ValueError: The number string contains a non-digit character.
+        """
+
+        double_down_checksum: int = _get_checksum(number_string, True)
+        plain_checksum: int = _get_checksum(number_string, False)
+
+        # An odd count of new digits flips the position of every old digit.
+        if len(number_string) % 2 == 1:
+            self._double_down_checksum, self._plain_checksum = \
+                self._plain_checksum, self._double_down_checksum
+        self._double_down_checksum = \
+            (self._double_down_checksum + double_down_checksum) % 10
+        self._plain_checksum = (self._plain_checksum + plain_checksum) % 10
+        self._length += len(number_string)
+
+    # =========================================================================
+    # append_digit
+    # =========================================================================
+
+    def append_digit(self, digit: int) -> None:
+        """
+        Appends a single digit.
+
+        :param digit: The digit (0-9) to append.
+        """
+
+        self._double_down_checksum, self._plain_checksum = \
+            (self._plain_checksum + _LUHN_MULTIPLY_BY_TWO[digit]) % 10, \
+            (self._double_down_checksum + digit) % 10
+        self._length += 1
+
+    # =========================================================================
+    # copy
+    # =========================================================================
+
+    def copy(self) -> 'LuhnAccumulator':
+        """
+        Creates a copy of this LuhnAccumulator.
+        """
+
+        accumulator = LuhnAccumulator()
+        accumulator._length = self._length
+        accumulator._double_down_checksum = self._double_down_checksum
+        accumulator._plain_checksum = self._plain_checksum
+        return accumulator
+
+    # =========================================================================
+    # get_check_digit
+    # =========================================================================
+
+    def get_check_digit(self) -> int:
+        """
+        Returns the LUHN check-digit for the accumulated digits.
+        """
+
+        checksum: int = self._double_down_checksum
+        return 10-checksum if checksum > 0 else checksum
+
+    # =========================================================================
+    # get_checksum
+    # =========================================================================
+
+    def get_checksum(self) -> int:
+        """
+        Returns the LUHN checksum of the accumulated digits, as
+        ``get_checksum()`` would for the number string.
+        """
+
+        return self._double_down_checksum
+
+    # =========================================================================
+    # get_plain_checksum
+    # =========================================================================
+
+    def get_plain_checksum(self) -> int:
+        """
+        Returns the LUHN checksum of the accumulated digits if the right-most
+        digit were not a double-down digit, that is, what the digits add to
+        the checksum of a number string that continues with an odd count of
+        digits.
+        """
+
+        return self._plain_checksum
+
+    # =========================================================================
+    # is_valid
+    # =========================================================================
+
+    def is_valid(self) -> bool:
+        """
+        Returns TRUE if the accumulated digits end with a correct LUHN
+        checksum digit, as ``verify_checksum()`` would for the number string.
+        """
+
+        return self._plain_checksum == 0
+
+    # =========================================================================
+    # prepend
+    # =========================================================================
+
+    def prepend(self, number_string: str) -> None:
+        """
+        Prepends the digits of the specified number string.
+
+        :param number_string: The digits to prepend.
+        :raises ValueError: The number string contains a non-digit character.
+        """
+
+        # The right-most new digit lands just left of the accumulated digits.
+        odd_position: bool = self._length % 2 == 1
+        self._double_down_checksum = (
+            self._double_down_checksum
+            + _get_checksum(number_string, not odd_position)) % 10
+        self._plain_checksum = (
+            self._plain_checksum
+            + _get_checksum(number_string, odd_position)) % 10
+        self._length += len(number_string)
+
+    # =========================================================================
+    # prepend_digit
+    # =========================================================================
+
+    def prepend_digit(self, digit: int) -> None:
+        """
+        Prepends a single digit.
+
+        :param digit: The digit (0-9) to prepend.
+        """
+
+        if self._length % 2 == 1:
+            self._double_down_checksum = \
+                (self._double_down_checksum + digit) % 10
+            self._plain_checksum = \
+                (self._plain_checksum + _LUHN_MULTIPLY_BY_TWO[digit]) % 10
+        else:
+            self._double_down_checksum = (
+                self._double_down_checksum
+                + _LUHN_MULTIPLY_BY_TWO[digit]) % 10
+            self._plain_checksum = (self._plain_checksum + digit) % 10
+        self._length += 1
+
 
 ###############################################################################
 # METHODS
@@ -46,8 +411,15 @@ def add_checksum(number_string: Optional[str] = None) -> str:
     :param number_string: The number string, less the checksum digit.
     """
 
-    return '0' if number_string is None \
-        else number_string + str(get_check_digit(number_string))
+    if number_string is None:
+        return '0'
+
+    if _prefix_cache:
+        check_digit: Optional[int] = _get_cached_check_digit(number_string)
+        if check_digit is not None:
+            return number_string + _DIGITS[check_digit]
+
+    return number_string + _DIGITS[get_check_digit(number_string)]
 
 
 # =============================================================================
@@ -106,21 +478,79 @@ def add_prefix(
         prefix_digit = _LUHN_DIVIDE_BY_TWO[prefix_digit]
 
     # Return the final result.
-    return prefix + str(prefix_digit) + return_value
+    return prefix + _DIGITS[prefix_digit] + return_value
+
+
+# =============================================================================
+# add_prefix_batch
+# =============================================================================
+
+def add_prefix_batch(
+        prefix: Optional[str],
+        luhn_number_strings: Iterable[Optional[str]]) -> Iterator[str]:
+    """
+    Generates the result of ``add_prefix()`` for each of the specified LUHN
+    number strings, in order. The adjustment digit depends only on the
+    prefix and on whether the LUHN number string has an odd or an even
+    length, so the method computes it just twice, up front, and then merely
+    concatenates strings as you consume the results.
+
+    :param prefix: The prefix string.
+    :param luhn_number_strings: A list, tuple, array, generator, or other
+        iterable of LUHN number strings.
+    :raises ValueError: The prefix contains a non-digit character.
+    """
+
+    numbers: Iterator[str] = (_ or '' for _ in luhn_number_strings)
+    if not prefix:
+        return numbers
+
+    # Index into this tuple with the parity of a LUHN number string's length
+    # to get back the prefix plus its adjustment digit; see add_prefix().
+    heads: Tuple[str, str] = (
+        prefix + _DIGITS[_get_check_digit(prefix, True)],
+        prefix + _DIGITS[_LUHN_DIVIDE_BY_TWO[_get_check_digit(prefix, False)]])
+
+    return (heads[len(_) % 2] + _ for _ in numbers)
+
+
+# =============================================================================
+# clear_prefix_cache
+# =============================================================================
+
+def clear_prefix_cache() -> None:
+    """
+    Removes every prefix from the prefix cache.
+    """
+
+    global _prefix_cache_probes
+    with _prefix_cache_lock:
+        _prefix_cache.clear()
+        _prefix_cache_lengths.clear()
+        _prefix_cache_probes = ()
 
 
 # =============================================================================
 # get_check_digit
 # =============================================================================
 
-def get_check_digit(number_string: Optional[str]) -> int:
+def get_check_digit(
+        number_string: Optional[NumberString],
+        offset: int = 0,
+        length: Optional[int] = None) -> int:
     """
     Returns the LUHN check-digit for the specified number string.
 
-    :param number_string: The number string without the check-sum digit.
+    :param number_string: The number string without the check-sum digit;
+        a bytes, bytearray, or memoryview holds the digits in ASCII.
+    :param offset: The offset of the first digit in **number_string**.
+    :param length: The count of digits to use, starting at **offset**; if
+        you omit this parameter, the digits run to the end of
+        **number_string**.
     """
 
-    return _get_check_digit(number_string, True)
+    checksum: int = _get_checksum_window(number_string, True, offset, length)
+    return 10-checksum if checksum > 0 else checksum
 
 
 def _get_check_digit(number_string: str, double_down: bool) -> int:
@@ -136,18 +566,137 @@ def _get_check_digit(number_string: str, double_down: bool) -> int:
     return 10-checksum if checksum > 0 else checksum
 
 
+def _get_cached_check_digit(number_string: str) -> Optional[int]:
+    """
+    Returns the LUHN check-digit for the specified number string using the
+    cached checksums of its longest registered prefix, or None if the number
+    string does not start with a registered prefix.
+
+    :param number_string: The number string without the check-sum digit.
+    """
+
+    # Single dictionary operations are atomic, so the lookup needs no lock;
+    # a concurrent eviction merely makes the prefix less recently used.
+    accumulator: Optional[LuhnAccumulator] = None
+    for length in _prefix_cache_probes:
+        if length < len(number_string):
+            prefix: str = number_string[:length]
+            accumulator = _prefix_cache.get(prefix)
+            if accumulator is not None:
+                try:
+                    _prefix_cache.move_to_end(prefix)
+                except KeyError:
+                    pass
+                break
+    if accumulator is None:
+        return None
+
+    # The prefix's right-most digit keeps its double-down role if the rest
+    # of the number string has an even length.
+    suffix: str = number_string[len(prefix):]
+    prefix_checksum: int = accumulator.get_checksum() \
+        if len(suffix) % 2 == 0 else accumulator.get_plain_checksum()
+    return -(prefix_checksum + _get_checksum(suffix, True)) % 10
+
+
+# =============================================================================
+# get_check_digit_batch
+# =============================================================================
+
+def get_check_digit_batch(number_strings: Iterable[Optional[str]]) -> List[int]:
+    """
+    Returns the LUHN check-digit for each of the specified number strings.
+    The number strings may have different lengths; the method left-pads the
+    shorter ones with zeroes, which leave a LUHN checksum unchanged, and
+    computes all of the check-digits at once, which is much faster than
+    calling ``get_check_digit`` for each number string.
+
+    :param number_strings: A list, tuple, array, or other iterable of number
+        strings without the check-sum digit.
+    :return: A list of check-digits in the order of **number_strings**.
+    :raises ValueError: A number string contains a non-digit character.
+    """
+
+    return list(
+        _get_checksum_batch(number_strings, True).translate(
+            _LUHN_BATCH_CHECK_DIGIT))
+
+
+def _get_checksum_batch(
+        number_strings: Iterable[Optional[str]], double_down: bool) -> bytes:
+    """
+    Returns the LUHN checksums of the specified number strings as a bytes
+    object with one byte per number string.
+
+    :param number_strings: The number strings to checksum.
+    :param double_down: Set this to TRUE if the right-most digit would be a
+        double-down digit of the completed LUHN string.
+    """
+
+    number_strings = list(number_strings)
+    if None in number_strings:
+        number_strings = [_ or '' for _ in number_strings]
+
+    count: int = len(number_strings)
+    lengths: List[int] = list(map(len, number_strings))
+    length: int = max(lengths, default=0)
+    if length == 0:
+        return bytes(count)
+
+    # Leading zeroes add nothing to a LUHN checksum, so we pad the shorter
+    # number strings with zeroes to line all of them up column by column.
+    padded: List[str] = number_strings if min(lengths) == length \
+        else list(map(str.rjust, number_strings, repeat(length), repeat('0')))
+
+    # Leave the oddballs, including non-digit characters that must raise a
+    # ValueError, to the scalar method.
+    try:
+        digits: bytes = ''.join(padded).encode('ascii')
+    except UnicodeEncodeError:
+        digits = b''
+    if not digits or digits.translate(None, b'0123456789'):
+        return bytes(_get_checksum(_, double_down) for _ in number_strings)
+
+    plain: bytes = digits.translate(_LUHN_BATCH_PLAIN)
+    double: bytes = digits.translate(_LUHN_BATCH_DOUBLE)
+
+    # Walk the columns from right to left, adding each column to the lanes
+    # and reducing the lanes before they can overflow.
+    lanes: int = 0
+    is_double_down_digit: bool = double_down
+    for i, column in enumerate(range(length - 1, -1, -1)):
+        if i and i % _LUHN_BATCH_COLUMNS_PER_REDUCTION == 0:
+            lanes = int.from_bytes(
+                lanes.to_bytes(count, 'big').translate(_LUHN_BATCH_MOD_10),
+                'big')
+        source: bytes = double if is_double_down_digit else plain
+        lanes += int.from_bytes(source[column::length], 'big')
+        is_double_down_digit = not is_double_down_digit
+
+    # The LUHN checksum is just the "ones" digit of each lane.
+    return lanes.to_bytes(count, 'big').translate(_LUHN_BATCH_MOD_10)
+
+
 # =============================================================================
 # get_checksum
 # =============================================================================
 
-def get_checksum(number_string: Optional[str]) -> int:
+def get_checksum(
+        number_string: Optional[NumberString],
+        offset: int = 0,
+        length: Optional[int] = None) -> int:
     """
     Returns the LUHN checksum of the specified number string.
 
-    :param number_string: The number string without the check-sum digit.
+    :param number_string: The number string without the check-sum digit;
+        a bytes, bytearray, or memoryview holds the digits in ASCII.
+    :param offset: The offset of the first digit in **number_string**.
+    :param length: The count of digits to use, starting at **offset**; if
+        you omit this parameter, the digits run to the end of
+        **number_string**.
     """
 
-    return _get_checksum(number_string, True)
+    return _get_checksum_window(number_string, True, offset, length)
 
 
 def _get_checksum(number_string: str, double_down: bool) -> int:
@@ -163,6 +712,40 @@ def _get_checksum(number_string: str, double_down: bool) -> int:
     if not number_string:
         return 0
 
+    # Leave the oddballs, including non-digit characters that must raise a
+    # ValueError, to the digit-by-digit method.
+    if not (number_string.isascii() and number_string.isdigit()):
+        return _get_checksum_by_digit(number_string, double_down)
+
+    # Peel four digits at a time off the right of each chunk and look up
+    # their contribution to the checksum.  Leading zeroes vanish when we
+    # convert a chunk to an integer, but they contribute nothing anyway.
+    table = _LUHN_QUAD_DOUBLE_DOWN if double_down else _LUHN_QUAD_PLAIN
+    checksum: int = 0
+    end: int = len(number_string)
+    while end > 0:
+        start: int = end-_LUHN_DIGITS_PER_CHUNK \
+            if end > _LUHN_DIGITS_PER_CHUNK else 0
+        n: int = int(number_string[start:end])
+        while n:
+            checksum += table[n % 10000]
+            n //= 10000
+        end = start
+
+    # The LUHN checksum is just the "ones" digit of the result.
+    return checksum % 10
+
+
+def _get_checksum_by_digit(number_string: str, double_down: bool) -> int:
+    """
+    Returns the LUHN checksum of the specified number string, one digit at a
+    time.
+
+    :param number_string: The number string without the check-sum digit.
+    :param double_down: Set this to TRUE if the right-most digit would be a
+        double-down digit of the completed LUHN string.
+    """
+
     checksum: int = 0
     is_double_down_digit: bool = double_down
     for digit in reversed(number_string):
@@ -174,6 +757,319 @@ def _get_checksum(number_string: str, double_down: bool) -> int:
     return checksum % 10
 
 
+def _get_checksum_by_byte(
+        number_buffer: Union[bytes, bytearray, memoryview],
+        double_down: bool, offset: int, length: Optional[int]) -> int:
+    """
+    Returns the LUHN checksum of the ASCII digits in the specified window of
+    a buffer without copying the digits.
+
+    :param number_buffer: The buffer holding the number string.
+    :param double_down: Set this to TRUE if the right-most digit would be a
+        double-down digit of the completed LUHN string.
+    :param offset: The offset of the first digit in **number_buffer**.
+    :param length: The count of digits to use, or None to use the digits up
+        to the end of **number_buffer**.
+    :raises ValueError: The window contains a non-digit byte.
+    """
+
+    view: memoryview = number_buffer \
+        if isinstance(number_buffer, memoryview) \
+        else memoryview(number_buffer)
+    if view.format != 'B':
+        view = view.cast('B')
+    end: Optional[int] = None if length is None else offset + length
+    digits: memoryview = view[offset:end]
+
+    # Counting from the right-most digit, every other digit is a double-down
+    # digit if the right-most digit is a double-down digit.
+    first_double_down: int = (len(digits) + double_down) % 2
+    doubles: memoryview = digits[first_double_down::2]
+    plains: memoryview = digits[1 - first_double_down::2]
+    checksum: int = \
+        sum(map(_LUHN_ASCII_DOUBLE_DOWN.__getitem__, doubles)) \
+        + sum(map(_LUHN_ASCII_PLAIN.__getitem__, plains))
+
+    if checksum >= _LUHN_ASCII_INVALID:
+        raise ValueError(
+            'Non-digit character in number string {!r}'.format(
+                bytes(number_buffer)[offset:end]))
+
+    # The LUHN checksum is just the "ones" digit of the result.
+    return checksum % 10
+
+
+def _get_checksum_window(
+        number_string: Optional[NumberString], double_down: bool,
+        offset: int, length: Optional[int]) -> int:
+    """
+    Returns the LUHN checksum of the specified window of a number string.
+
+    :param number_string: The number string as text or as a buffer of ASCII
+        digits.
+    :param double_down: Set this to TRUE if the right-most digit would be a
+        double-down digit of the completed LUHN string.
+    :param offset: The offset of the first digit in **number_string**.
+    :param length: The count of digits to use, or None to use the digits up
+        to the end of **number_string**.
+    """
+
+    if number_string is None:
+        return 0
+
+    if isinstance(number_string, str):
+        if offset or length is not None:
+            number_string = number_string[
+                offset:None if length is None else offset + length]
+        return _get_checksum(number_string, double_down)
+
+    return _get_checksum_by_byte(number_string, double_down, offset, length)
+
+
+# =============================================================================
+# get_correction_candidates
+# =============================================================================
+
+def get_correction_candidates(
+        number_string: str,
+        known_numbers: Optional[Container[str]] = None) -> List[str]:
+    """
+    Returns the LUHN number strings that differ from the specified number
+    string by a single-digit substitution or by a transposition of two
+    adjacent digits, which are the typing errors that most often break the
+    LUHN check. For example, "4588883200009191" yields "4588883200009190"
+    among others. The method computes how each change would shift the
+    checksum rather than checking each candidate in full.
+
+    The list holds the substitutions, from left to right, followed by the
+    transpositions, from left to right.
+
+    :param number_string: The number string, including its checksum digit;
+        it normally fails the LUHN check.
+    :param known_numbers: An optional set, dict, or other container of known
+        number strings; if you specify it, the method returns only the
+        candidates in the container.
+    :raises ValueError: The number string contains a non-digit character.
+    """
+
+    checksum: int = _get_checksum(number_string, False)
+    digits: List[int] = [int(_) for _ in number_string]
+    length: int = len(digits)
+    candidates: List[str] = []
+
+    # A substitution must change the digit's contribution to the checksum by
+    # -checksum (mod 10); every position has exactly one digit that does.
+    for i, digit in enumerate(digits):
+        if (length - i) % 2 == 0:
+            target = _LUHN_DIVIDE_BY_TWO[
+                (_LUHN_MULTIPLY_BY_TWO[digit] - checksum) % 10]
+        else:
+            target = (digit - checksum) % 10
+        if target != digit:
+            candidates.append(
+                number_string[:i] + _DIGITS[target] + number_string[i+1:])
+
+    # A transposition moves the left digit into the right digit's position
+    # and vice versa, so exactly one of each pair changes its weighting.
+    for i in range(length - 1):
+        left, right = digits[i], digits[i+1]
+        if left == right:
+            continue
+        if (length - i) % 2 == 0:
+            delta = _LUHN_MULTIPLY_BY_TWO[right] + left \
+                - _LUHN_MULTIPLY_BY_TWO[left] - right
+        else:
+            delta = right + _LUHN_MULTIPLY_BY_TWO[left] \
+                - left - _LUHN_MULTIPLY_BY_TWO[right]
+        if (checksum + delta) % 10 == 0:
+            candidates.append(
+                number_string[:i] + _DIGITS[right] + _DIGITS[left]
+                + number_string[i+2:])
+
+    if known_numbers is not None:
+        candidates = [_ for _ in candidates if _ in known_numbers]
+    return candidates
+
+
+# =============================================================================
+# get_next_valid_number
+# =============================================================================
+
+def get_next_valid_number(number_string: str) -> Optional[str]:
+    """
+    Returns the smallest LUHN number string that is greater than the
+    specified number string and has the same length, or None if there is no
+    such number string. For example, the method returns "0026" for "0020".
+    The method computes the result directly rather than by trial and error.
+
+    :param number_string: The number string to start from; it need not pass
+        the LUHN check.
+    :raises ValueError: The number string contains a non-digit character.
+    """
+
+    # Every base (the number string less its last digit) has exactly one
+    # check-digit, so try the base first and then the next base up.
+    base: str = number_string[:-1]
+    check_digit: int = get_check_digit(base)
+    if number_string and check_digit > int(number_string[-1]):
+        return base + _DIGITS[check_digit]
+
+    if not base:
+        return None
+    next_base: int = int(base) + 1
+    if next_base >= 10 ** len(base):
+        return None
+    return add_checksum(str(next_base).zfill(len(base)))
+
+
+# =============================================================================
+# get_prefix_accumulator
+# =============================================================================
+
+def get_prefix_accumulator(prefix: str) -> LuhnAccumulator:
+    """
+    Returns a new LuhnAccumulator that holds the specified prefix, copied
+    from the prefix cache; the method registers the prefix if it is not yet
+    in the cache. Use this method to start each number string of a batch
+    that shares a handful of prefixes.
+
+    :param prefix: The prefix string.
+    :raises ValueError: The prefix contains a non-digit character.
+    """
+
+    with _prefix_cache_lock:
+        accumulator: Optional[LuhnAccumulator] = _prefix_cache.get(prefix)
+        if accumulator is not None:
+            _prefix_cache.move_to_end(prefix)
+            return accumulator.copy()
+
+    return register_prefix(prefix).copy()
+
+
+# =============================================================================
+# get_previous_valid_number
+# =============================================================================
+
+def get_previous_valid_number(number_string: str) -> Optional[str]:
+    """
+    Returns the largest LUHN number string that is less than the specified
+    number string and has the same length, or None if there is no such
+    number string. For example, the method returns "0018" for "0020".
+    The method computes the result directly rather than by trial and error.
+
+    :param number_string: The number string to start from; it need not pass
+        the LUHN check.
+    :raises ValueError: The number string contains a non-digit character.
+    """
+
+    # Every base (the number string less its last digit) has exactly one
+    # check-digit, so try the base first and then the next base down.
+    base: str = number_string[:-1]
+    check_digit: int = get_check_digit(base)
+    if number_string and check_digit < int(number_string[-1]):
+        return base + _DIGITS[check_digit]
+
+    if not base or int(base) == 0:
+        return None
+    return add_checksum(str(int(base) - 1).zfill(len(base)))
+
+
+# =============================================================================
+# iterate_valid_numbers
+# =============================================================================
+
+def iterate_valid_numbers(first: str, last: str) -> Iterator[str]:
+    """
+    Generates, in ascending order, every LUHN number string from **first**
+    through **last**, inclusive.  Both number strings must have the same
+    length, which is the length of every generated number string. The
+    method generates the number strings lazily, so you can carve a range of
+    any size out of a BIN range.
+
+    :param first: The lower bound of the range; it need not pass the LUHN
+        check.
+    :param last: The upper bound of the range; it need not pass the LUHN
+        check.
+    :raises ValueError: The bounds have different lengths or contain a
+        non-digit character.
+    """
+
+    if len(first) != len(last):
+        raise ValueError(
+            "The bounds '{}' and '{}' have different lengths".format(
+                first, last))
+
+    # Validate the bounds up front rather than on the first iteration.
+    _get_checksum(first, False)
+    _get_checksum(last, False)
+    return _iterate_valid_numbers(first, last)
+
+
+def _iterate_valid_numbers(first: str, last: str) -> Iterator[str]:
+    """
+    Generates every LUHN number string from **first** through **last**,
+    inclusive, where both bounds are valid digit strings of the same length.
+
+    :param first: The lower bound of the range.
+    :param last: The upper bound of the range.
+    """
+
+    if len(first) < 2:
+        if first <= '0' <= last:
+            yield '0'
+        return
+
+    # The bases (the number strings less their check-digits) run from
+    # first_base to last_base. Bases that differ only in their last digit
+    # form a group that shares the checksum of its leading digits, so we
+    # compute one checksum per group of ten number strings.
+    width: int = len(first) - 2
+    first_base: int = int(first[:-1])
+    last_base: int = int(last[:-1])
+    for group in range(first_base // 10, last_base // 10 + 1):
+        group_string: str = str(group).zfill(width) if width else ''
+        checksum: int = _get_checksum(group_string, False)
+        for base in range(max(group * 10, first_base),
+                          min(group * 10 + 9, last_base) + 1):
+            digit: int = base % 10
+            number: str = group_string + _DIGITS[digit] + _DIGITS[
+                -(checksum + _LUHN_MULTIPLY_BY_TWO[digit]) % 10]
+            if base == first_base and number < first \
+                    or base == last_base and number > last:
+                continue
+            yield number
+
+
+# =============================================================================
+# register_prefix
+# =============================================================================
+
+def register_prefix(prefix: str) -> LuhnAccumulator:
+    """
+    Adds the specified prefix to the prefix cache, evicting the least
+    recently used prefix if the cache is full, and returns the cached
+    LuhnAccumulator for the prefix, which you must not modify. Once you
+    register a prefix, ``add_checksum()`` and ``set_checksum()`` compute the
+    check-digit of a number string that starts with the prefix from the rest
+    of the number string only.
+
+    :param prefix: The prefix string.
+    :raises ValueError: The prefix contains a non-digit character.
+    """
+
+    accumulator = LuhnAccumulator(prefix)
+    with _prefix_cache_lock:
+        if prefix in _prefix_cache:
+            _prefix_cache.move_to_end(prefix)
+            return _prefix_cache[prefix]
+
+        _prefix_cache[prefix] = accumulator
+        _prefix_cache_lengths[len(prefix)] = \
+            _prefix_cache_lengths.get(len(prefix), 0) + 1
+        _trim_prefix_cache()
+    return accumulator
+
+
 # =============================================================================
 # set_checksum
 # =============================================================================
@@ -189,19 +1085,82 @@ def set_checksum(number_string: Optional[str]) -> str:
     return add_checksum(number_string[:-1] if number_string else None)
 
 
+# =============================================================================
+# set_prefix_cache_size
+# =============================================================================
+
+def set_prefix_cache_size(size: int) -> None:
+    """
+    Sets the count of prefixes that the prefix cache holds before it evicts
+    the least recently used prefix, evicting prefixes now if necessary.
+
+    :param size: The maximum count of prefixes to cache.
+    """
+
+    global _prefix_cache_size
+    with _prefix_cache_lock:
+        _prefix_cache_size = max(size, 0)
+        _trim_prefix_cache()
+
+
+def _trim_prefix_cache() -> None:
+    """
+    Evicts the least recently used prefixes until the prefix cache holds no
+    more than its maximum count of prefixes and updates the prefix lengths
+    to look up. The caller must hold the prefix cache lock.
+    """
+
+    global _prefix_cache_probes
+    while len(_prefix_cache) > _prefix_cache_size:
+        prefix, _ = _prefix_cache.popitem(last=False)
+        _prefix_cache_lengths[len(prefix)] -= 1
+        if not _prefix_cache_lengths[len(prefix)]:
+            del _prefix_cache_lengths[len(prefix)]
+    _prefix_cache_probes = tuple(sorted(_prefix_cache_lengths, reverse=True))
+
+
 # =============================================================================
 # verify_checksum
 # =============================================================================
 
-def verify_checksum(number_string: Optional[str]) -> bool:
+def verify_checksum(
+        number_string: Optional[NumberString],
+        offset: int = 0,
+        length: Optional[int] = None) -> bool:
     """
     Returns TRUE if the LUHN checksum digit is correct for the specified
     number string.
 
     :param number_string: The number string, including a stand-in checksum
-        digit.
+        digit; a bytes, bytearray, or memoryview holds the digits in ASCII.
+    :param offset: The offset of the first digit in **number_string**.
+    :param length: The count of digits to use, starting at **offset**; if
+        you omit this parameter, the digits run to the end of
+        **number_string**.
     """
 
     # When we call get_checksum with a number string that includes the
     # check-digit then we should get back a checksum of zero.
-    return _get_checksum(number_string, False) == 0
+    return _get_checksum_window(number_string, False, offset, length) == 0
+
+
+# =============================================================================
+# verify_checksum_batch
+# =============================================================================
+
+def verify_checksum_batch(
+        number_strings: Iterable[Optional[str]]) -> List[bool]:
+    """
+    Returns TRUE for each of the specified number strings whose LUHN checksum
+    digit is correct. The number strings may have different lengths; the
+    method left-pads the shorter ones with zeroes, which leave a LUHN
+    checksum unchanged, and verifies all of them at once, which is much
+    faster than calling ``verify_checksum`` for each number string.
+
+    :param number_strings: A list, tuple, array, or other iterable of number
+        strings, each including a stand-in checksum digit.
+    :return: A list of booleans in the order of **number_strings**.
+    :raises ValueError: A number string contains a non-digit character.
+    """
+
+    return list(map(not_, _get_checksum_batch(number_strings, False)))
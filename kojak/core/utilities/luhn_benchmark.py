@@ -0,0 +1,327 @@
+"""
+Created on October 17, 2026
+
+This module times the ``luhn_algorithm`` functions across number lengths and
+batch sizes, writes the results as JSON, and compares them against a stored
+baseline, so that you can tell whether a change makes the functions slower.
+It uses only the standard library. Run it from the command line with::
+
+    python -m kojak.core.utilities.luhn_benchmark [options]
+
+For example, record a baseline before a change and compare against it after::
+
+    python -m kojak.core.utilities.luhn_benchmark --output baseline.json
+    python -m kojak.core.utilities.luhn_benchmark --baseline baseline.json
+"""
+
+import argparse
+import json
+import platform
+import random
+import sys
+import time
+from typing import Callable, Dict, List, Optional, Sequence, Tuple
+
+from kojak.core.utilities import luhn_algorithm
+
+###############################################################################
+# CONSTANTS
+###############################################################################
+
+# Specifies the default number lengths to time.
+DEFAULT_LENGTHS: Tuple[int, ...] = tuple(range(8, 20))
+
+# Specifies the default counts of number strings to time per loop.
+DEFAULT_BATCH_SIZES: Tuple[int, ...] = (1, 100, 10000)
+
+# Specifies the default count of timings per benchmark; the results keep the
+# fastest timing, which is the one least disturbed by other work.
+DEFAULT_REPEAT: int = 5
+
+# Specifies the default minimum duration, in seconds, of each timing.
+DEFAULT_MIN_TIME: float = 0.05
+
+# Specifies the default slowdown, as a fraction of the baseline, that counts
+# as a regression.
+DEFAULT_THRESHOLD: float = 0.10
+
+# Specifies the prefix that the add_prefix benchmark prepends.
+BENCHMARK_PREFIX: str = '601100'
+
+# Maps the name of each benchmark to a function that applies the benchmarked
+# function to a list of number strings.
+BENCHMARKS: Dict[str, Callable[[List[str]], object]] = {
+    'get_checksum':
+        lambda _: [luhn_algorithm.get_checksum(n) for n in _],
+    'verify_checksum':
+        lambda _: [luhn_algorithm.verify_checksum(n) for n in _],
+    'add_checksum':
+        lambda _: [luhn_algorithm.add_checksum(n) for n in _],
+    'set_checksum':
+        lambda _: [luhn_algorithm.set_checksum(n) for n in _],
+    'add_prefix':
+        lambda _: [luhn_algorithm.add_prefix(BENCHMARK_PREFIX, n) for n in _],
+    'verify_checksum_batch':
+        luhn_algorithm.verify_checksum_batch,
+    'get_check_digit_batch':
+        luhn_algorithm.get_check_digit_batch,
+}
+
+
+###############################################################################
+# METHODS
+###############################################################################
+
+
+# =============================================================================
+# compare_results
+# =============================================================================
+
+def compare_results(
+        results: Dict, baseline: Dict,
+        threshold: float = DEFAULT_THRESHOLD,
+        thresholds: Optional[Dict[str, float]] = None
+) -> List[Tuple[str, int, int, float, float]]:
+    """
+    Compares benchmark results against a baseline and returns a list of
+    (benchmark, length, batch size, baseline ns, current ns) tuples for the
+    benchmarks that slowed down by more than their threshold. Benchmarks that
+    appear in only one of the result sets are skipped.
+
+    :param results: The results of ``run_benchmarks()``.
+    :param baseline: The baseline results of an earlier ``run_benchmarks()``.
+    :param threshold: The slowdown, as a fraction of the baseline time, that
+        counts as a regression; 0.10 means 10% slower.
+    :param thresholds: An optional dictionary of thresholds by benchmark
+        name, which override **threshold**.
+    """
+
+    thresholds = thresholds or {}
+    baseline_times: Dict[Tuple[str, int, int], float] = {
+        (_['benchmark'], _['length'], _['batch_size']): _['ns_per_number']
+        for _ in baseline['results']}
+
+    regressions: List[Tuple[str, int, int, float, float]] = []
+    for result in results['results']:
+        key = (result['benchmark'], result['length'], result['batch_size'])
+        if key not in baseline_times:
+            continue
+        limit: float = 1 + thresholds.get(key[0], threshold)
+        if result['ns_per_number'] > baseline_times[key] * limit:
+            regressions.append(
+                key + (baseline_times[key], result['ns_per_number']))
+    return regressions
+
+
+# =============================================================================
+# main
+# =============================================================================
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Runs the benchmarks named on the command line, prints the results, and
+    optionally writes them to a JSON file and compares them against a JSON
+    baseline. Returns 1 if any benchmark regressed, 0 otherwise.
+
+    :param argv: The command-line arguments, less the program name; if you
+        omit this parameter, the method uses ``sys.argv``.
+    """
+
+    parser = argparse.ArgumentParser(
+        prog='python -m kojak.core.utilities.luhn_benchmark',
+        description='Times the luhn_algorithm functions.')
+    parser.add_argument(
+        '--benchmarks', type=_split, default=list(BENCHMARKS),
+        help='a comma-separated list of benchmarks (default: all of {})'
+             .format(', '.join(BENCHMARKS)))
+    parser.add_argument(
+        '--lengths', type=_split_ints, default=list(DEFAULT_LENGTHS),
+        help='a comma-separated list of number lengths (default: 8-19)')
+    parser.add_argument(
+        '--batch-sizes', type=_split_ints, default=list(DEFAULT_BATCH_SIZES),
+        help='a comma-separated list of batch sizes (default: {})'.format(
+            ','.join(map(str, DEFAULT_BATCH_SIZES))))
+    parser.add_argument(
+        '--repeat', type=int, default=DEFAULT_REPEAT,
+        help='the count of timings per benchmark (default: %(default)s)')
+    parser.add_argument(
+        '--min-time', type=float, default=DEFAULT_MIN_TIME,
+        help='the minimum seconds per timing (default: %(default)s)')
+    parser.add_argument(
+        '--output', metavar='FILE', help='write the results to a JSON file')
+    parser.add_argument(
+        '--baseline', metavar='FILE',
+        help='compare the results against a JSON file of earlier results')
+    parser.add_argument(
+        '--threshold', type=float, default=DEFAULT_THRESHOLD,
+        help='the slowdown that counts as a regression (default: %(default)s)')
+    parser.add_argument(
+        '--benchmark-threshold', metavar='BENCHMARK=THRESHOLD',
+        action='append', default=[],
+        help='the threshold for one benchmark; you may repeat this option')
+    args = parser.parse_args(argv)
+
+    unknown: List[str] = [_ for _ in args.benchmarks if _ not in BENCHMARKS]
+    if unknown:
+        parser.error('unknown benchmark: {}'.format(', '.join(unknown)))
+    thresholds: Dict[str, float] = {}
+    for option in args.benchmark_threshold:
+        name, _, value = option.partition('=')
+        thresholds[name] = float(value)
+
+    results: Dict = run_benchmarks(
+        args.benchmarks, args.lengths, args.batch_sizes, args.repeat,
+        args.min_time)
+    for result in results['results']:
+        print("{:24} length={:<3} batch_size={:<6} {:12.1f} ns/number".format(
+            result['benchmark'], result['length'], result['batch_size'],
+            result['ns_per_number']))
+
+    if args.output:
+        with open(args.output, 'w') as file:
+            json.dump(results, file, indent=2)
+
+    if args.baseline:
+        with open(args.baseline) as file:
+            baseline: Dict = json.load(file)
+        regressions = compare_results(
+            results, baseline, args.threshold, thresholds)
+        for name, length, batch_size, before, after in regressions:
+            print("REGRESSION {} length={} batch_size={}: {:.1f} ns -> "
+                  "{:.1f} ns ({:+.1%})".format(
+                      name, length, batch_size, before, after,
+                      after / before - 1))
+        return 1 if regressions else 0
+
+    return 0
+
+
+# =============================================================================
+# run_benchmarks
+# =============================================================================
+
+def run_benchmarks(
+        benchmarks: Sequence[str] = tuple(BENCHMARKS),
+        lengths: Sequence[int] = DEFAULT_LENGTHS,
+        batch_sizes: Sequence[int] = DEFAULT_BATCH_SIZES,
+        repeat: int = DEFAULT_REPEAT,
+        min_time: float = DEFAULT_MIN_TIME) -> Dict:
+    """
+    Times each benchmark for each combination of number length and batch
+    size and returns a dictionary, suitable for JSON, that describes the
+    environment and holds a list of results. Each result gives the fastest
+    time, in nanoseconds per number string, to apply the benchmark to a batch
+    of random number strings. The number strings are the same on every run.
+
+    :param benchmarks: The names of the benchmarks, from ``BENCHMARKS``.
+    :param lengths: The number lengths to time.
+    :param batch_sizes: The counts of number strings to time per loop.
+    :param repeat: The count of timings per benchmark.
+    :param min_time: The minimum duration, in seconds, of each timing.
+    """
+
+    results: List[Dict] = []
+    for length in lengths:
+        for batch_size in batch_sizes:
+            number_strings: List[str] = _get_number_strings(length, batch_size)
+            for name in benchmarks:
+                ns: float = _time(
+                    BENCHMARKS[name], number_strings, repeat, min_time)
+                results.append({
+                    'benchmark': name,
+                    'length': length,
+                    'batch_size': batch_size,
+                    'ns_per_number': ns / batch_size,
+                })
+
+    return {
+        'python': platform.python_version(),
+        'implementation': platform.python_implementation(),
+        'machine': platform.machine(),
+        'repeat': repeat,
+        'min_time': min_time,
+        'results': results,
+    }
+
+
+def _get_number_strings(length: int, count: int) -> List[str]:
+    """
+    Returns a list of random LUHN number strings; the same arguments always
+    return the same number strings.
+
+    :param length: The length of each number string.
+    :param count: The count of number strings.
+    """
+
+    generator = random.Random(length * 1000003 + count)
+    return [
+        luhn_algorithm.set_checksum(
+            str(generator.randrange(10 ** (length - 1), 10 ** length)))
+        for _ in range(count)]
+
+
+def _split(value: str) -> List[str]:
+    """
+    Splits a comma-separated command-line value.
+
+    :param value: The value to split.
+    """
+
+    return [_.strip() for _ in value.split(',') if _.strip()]
+
+
+def _split_ints(value: str) -> List[int]:
+    """
+    Splits a comma-separated command-line value of integers and ranges, such
+    as "8-12,16".
+
+    :param value: The value to split.
+    """
+
+    values: List[int] = []
+    for item in _split(value):
+        first, _, last = item.partition('-')
+        values.extend(range(int(first), int(last or first) + 1))
+    return values
+
+
+def _time(
+        benchmark: Callable[[List[str]], object], number_strings: List[str],
+        repeat: int, min_time: float) -> float:
+    """
+    Returns the fastest time, in nanoseconds, to apply a benchmark to a list
+    of number strings. Each timing loops over the benchmark enough times to
+    last at least **min_time** seconds.
+
+    :param benchmark: The benchmark function.
+    :param number_strings: The number strings.
+    :param repeat: The count of timings.
+    :param min_time: The minimum duration, in seconds, of each timing.
+    """
+
+    # Find a loop count that lasts long enough for the clock to resolve.
+    loops: int = 1
+    while True:
+        start: int = time.perf_counter_ns()
+        for _ in range(loops):
+            benchmark(number_strings)
+        elapsed: int = time.perf_counter_ns() - start
+        if elapsed >= min_time * 1e9:
+            break
+        loops *= 2
+
+    best: float = elapsed / loops
+    for _ in range(repeat - 1):
+        start = time.perf_counter_ns()
+        for _ in range(loops):
+            benchmark(number_strings)
+        best = min(best, (time.perf_counter_ns() - start) / loops)
+    return best
+
+
+###############################################################################
+# MAIN
+###############################################################################
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,353 @@
+"""
+Created on October 17, 2026
+
+This module validates files of LUHN account numbers, one per line, without
+reading the files into memory. Run it from the command line with::
+
+    python -m kojak.core.utilities.luhn_file_validator [options] FILE...
+"""
+
+import argparse
+import mmap
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Sequence, Tuple
+
+from kojak.core.utilities.luhn_algorithm import verify_checksum
+from kojak.core.utilities.string_library import plural
+
+###############################################################################
+# CONSTANTS
+###############################################################################
+
+# Specifies the default size, in bytes, of the chunks that the process pool
+# validates; the actual chunks end on a line boundary.
+DEFAULT_CHUNK_SIZE: int = 64 * 1024 * 1024
+
+# Specifies the default count of invalid lines that the command line reports
+# in detail; the totals always cover every line.
+DEFAULT_MAX_INVALID: int = 1000
+
+
+###############################################################################
+# LuhnFileReport
+###############################################################################
+
+
+class LuhnFileReport:
+    """
+    This class holds the results of validating a file of LUHN account numbers.
+
+    :param path: The path of the validated file.
+    :param line_count: The count of lines in the file.
+    :param blank_count: The count of blank lines, which are not validated.
+    :param invalid_count: The count of lines that failed the LUHN check or
+        that contain non-digit characters.
+    :param invalid_lines: A list of (line number, byte offset) tuples for the
+        invalid lines; line numbers start at 1 and byte offsets at 0. The list
+        may hold fewer entries than **invalid_count**.
+    """
+
+    ###########################################################################
+    # METHODS
+    ###########################################################################
+
+    # =========================================================================
+    # CONSTRUCTOR
+    # =========================================================================
+
+    def __init__(
+            self, path: str, line_count: int = 0, blank_count: int = 0,
+            invalid_count: int = 0,
+            invalid_lines: Optional[List[Tuple[int, int]]] = None):
+
+        self._path: str = path
+        self._line_count: int = line_count
+        self._blank_count: int = blank_count
+        self._invalid_count: int = invalid_count
+        self._invalid_lines: List[Tuple[int, int]] = invalid_lines or []
+
+    # =========================================================================
+    # __str__
+    # =========================================================================
+
+    def __str__(self):
+        return "{}: {}, {} valid, {} invalid, {} blank".format(
+            self._path, plural(self._line_count, '', 'line', 'lines'),
+            self.get_valid_count(), self._invalid_count, self._blank_count)
+
+    # =========================================================================
+    # get_blank_count
+    # =========================================================================
+
+    def get_blank_count(self) -> int:
+        """
+        Returns the count of blank lines.
+        """
+
+        return self._blank_count
+
+    # =========================================================================
+    # get_invalid_count
+    # =========================================================================
+
+    def get_invalid_count(self) -> int:
+        """
+        Returns the count of invalid lines.
+        """
+
+        return self._invalid_count
+
+    # =========================================================================
+    # get_invalid_lines
+    # =========================================================================
+
+    def get_invalid_lines(self) -> List[Tuple[int, int]]:
+        """
+        Returns a list of (line number, byte offset) tuples for the invalid
+        lines in the order they appear in the file.
+        """
+
+        return self._invalid_lines
+
+    # =========================================================================
+    # get_line_count
+    # =========================================================================
+
+    def get_line_count(self) -> int:
+        """
+        Returns the count of lines in the file.
+        """
+
+        return self._line_count
+
+    # =========================================================================
+    # get_path
+    # =========================================================================
+
+    def get_path(self) -> str:
+        """
+        Returns the path of the validated file.
+        """
+
+        return self._path
+
+    # =========================================================================
+    # get_valid_count
+    # =========================================================================
+
+    def get_valid_count(self) -> int:
+        """
+        Returns the count of lines that passed the LUHN check.
+        """
+
+        return self._line_count - self._blank_count - self._invalid_count
+
+    # =========================================================================
+    # is_valid
+    # =========================================================================
+
+    def is_valid(self) -> bool:
+        """
+        Returns TRUE if every non-blank line passed the LUHN check.
+        """
+
+        return self._invalid_count == 0
+
+
+###############################################################################
+# METHODS
+###############################################################################
+
+
+# =============================================================================
+# main
+# =============================================================================
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Validates the files named on the command line and prints a report for
+    each file. Returns 0 if every file is valid, 1 otherwise.
+
+    :param argv: The command-line arguments, less the program name; if you
+        omit this parameter, the method uses ``sys.argv``.
+    """
+
+    parser = argparse.ArgumentParser(
+        prog='python -m kojak.core.utilities.luhn_file_validator',
+        description='Validates files of LUHN account numbers, one per line.')
+    parser.add_argument('files', metavar='FILE', nargs='+')
+    parser.add_argument(
+        '--processes', type=int, default=1,
+        help='the count of worker processes (default: 1)')
+    parser.add_argument(
+        '--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+        help='the size in bytes of the chunks that each worker validates '
+             '(default: %(default)s)')
+    parser.add_argument(
+        '--max-invalid', type=int, default=DEFAULT_MAX_INVALID,
+        help='the count of invalid lines to report per file '
+             '(default: %(default)s)')
+    args = parser.parse_args(argv)
+
+    all_valid: bool = True
+    for path in args.files:
+        report = validate_file(
+            path, args.processes, args.chunk_size, args.max_invalid)
+        for line_number, offset in report.get_invalid_lines():
+            print("{}:{}: invalid account number at byte offset {}".format(
+                path, line_number, offset))
+        print(report)
+        all_valid = all_valid and report.is_valid()
+
+    return 0 if all_valid else 1
+
+
+# =============================================================================
+# validate_file
+# =============================================================================
+
+def validate_file(
+        path: str, processes: int = 1,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        max_invalid: Optional[int] = None) -> LuhnFileReport:
+    """
+    Validates a file of LUHN account numbers, one per line, and returns a
+    report of the invalid lines. The method memory-maps the file and checks
+    each line in place with ``verify_checksum``. Lines may end with "\\n" or
+    "\\r\\n"; a line that contains a non-digit character is invalid.
+
+    :param path: The path of the file to validate.
+    :param processes: The count of worker processes; if you specify more than
+        one, the method splits the file into chunks and validates the chunks
+        in a process pool.
+    :param chunk_size: The approximate size in bytes of each chunk that a
+        worker process validates.
+    :param max_invalid: The maximum count of invalid lines to list in the
+        report, or None to list every invalid line.
+    """
+
+    size: int = os.path.getsize(path)
+    ranges: List[Tuple[int, int]] = _get_chunk_ranges(
+        path, size, chunk_size if processes > 1 else size)
+
+    if processes > 1 and len(ranges) > 1:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            results = list(executor.map(
+                _validate_range, [path] * len(ranges),
+                [_[0] for _ in ranges], [_[1] for _ in ranges],
+                [max_invalid] * len(ranges)))
+    else:
+        results = [
+            _validate_range(path, start, end, max_invalid)
+            for start, end in ranges]
+
+    # Stitch the chunk results together, turning the line indexes of each
+    # chunk into line numbers for the whole file.
+    line_count: int = 0
+    blank_count: int = 0
+    invalid_count: int = 0
+    invalid_lines: List[Tuple[int, int]] = []
+    for chunk_lines, chunk_blanks, chunk_invalids, chunk_invalid_lines \
+            in results:
+        invalid_lines.extend(
+            (line_count + line_index + 1, offset)
+            for line_index, offset in chunk_invalid_lines)
+        line_count += chunk_lines
+        blank_count += chunk_blanks
+        invalid_count += chunk_invalids
+
+    if max_invalid is not None:
+        del invalid_lines[max_invalid:]
+    return LuhnFileReport(
+        path, line_count, blank_count, invalid_count, invalid_lines)
+
+
+def _get_chunk_ranges(
+        path: str, size: int, chunk_size: int) -> List[Tuple[int, int]]:
+    """
+    Returns a list of (start, end) byte ranges that split a file into chunks
+    of roughly **chunk_size** bytes, each ending just after a line feed or at
+    the end of the file.
+
+    :param path: The path of the file.
+    :param size: The size of the file in bytes.
+    :param chunk_size: The approximate size of each chunk.
+    """
+
+    if size == 0:
+        return []
+
+    ranges: List[Tuple[int, int]] = []
+    with open(path, 'rb') as file, \
+            mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped:
+        start: int = 0
+        while start < size:
+            end: int = mapped.find(b'\n', max(start + chunk_size, 1) - 1)
+            end = size if end < 0 else end + 1
+            ranges.append((start, end))
+            start = end
+    return ranges
+
+
+def _validate_range(
+        path: str, start: int, end: int,
+        max_invalid: Optional[int]
+) -> Tuple[int, int, int, List[Tuple[int, int]]]:
+    """
+    Validates the lines in a byte range of a file and returns a tuple of the
+    line count, the blank-line count, the invalid-line count, and a list of
+    (line index, byte offset) tuples for the invalid lines, where the line
+    index counts from the start of the range.
+
+    :param path: The path of the file.
+    :param start: The offset of the first byte of the range, which must be
+        the start of a line.
+    :param end: The offset just past the last byte of the range.
+    :param max_invalid: The maximum count of invalid lines to list, or None
+        to list every invalid line.
+    """
+
+    line_count: int = 0
+    blank_count: int = 0
+    invalid_count: int = 0
+    invalid_lines: List[Tuple[int, int]] = []
+
+    with open(path, 'rb') as file, \
+            mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as mapped, \
+            memoryview(mapped) as view:
+        offset: int = start
+        while offset < end:
+            line_end: int = mapped.find(b'\n', offset, end)
+            next_offset: int = end if line_end < 0 else line_end + 1
+            if line_end < 0:
+                line_end = end
+            if line_end > offset and view[line_end - 1] == 0x0D:
+                line_end -= 1
+
+            if line_end == offset:
+                blank_count += 1
+            else:
+                try:
+                    valid: bool = verify_checksum(
+                        view, offset, line_end - offset)
+                except ValueError:
+                    valid = False
+                if not valid:
+                    if max_invalid is None or invalid_count < max_invalid:
+                        invalid_lines.append((line_count, offset))
+                    invalid_count += 1
+
+            line_count += 1
+            offset = next_offset
+
+    return line_count, blank_count, invalid_count, invalid_lines
+
+
+###############################################################################
+# MAIN
+###############################################################################
+
+if __name__ == '__main__':
+    sys.exit(main())
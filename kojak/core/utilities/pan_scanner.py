@@ -0,0 +1,359 @@
+"""
+Created on October 17, 2026
+
+This module scans log files for clear primary account numbers (PANs), such
+as a PCI sweep needs. It reads the files in chunks, so that it scans files
+of any size in bounded memory, and it reads ".gz" files through ``gzip``.
+Run it from the command line with::
+
+    python -m kojak.core.utilities.pan_scanner [options] FILE...
+
+A candidate is a run of 12 through 19 digits, which may be grouped by single
+spaces or hyphens, that is not part of a longer run of digits. The scanner
+reports a candidate as a PAN only if it passes the LUHN check.
+"""
+
+import argparse
+import gzip
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from typing import BinaryIO, List, Optional, Pattern, Sequence, Tuple
+
+from kojak.core.utilities.account_number import AccountNumberMasker
+from kojak.core.utilities.luhn_algorithm import verify_checksum
+from kojak.core.utilities.string_library import plural
+
+###############################################################################
+# CONSTANTS
+###############################################################################
+
+# Specifies the default size, in bytes, of the chunks that the scanner reads.
+DEFAULT_CHUNK_SIZE: int = 16 * 1024 * 1024
+
+# Specifies the default count of PANs that the command line reports in detail
+# for each file; the totals always cover every PAN.
+DEFAULT_MAX_FINDINGS: int = 1000
+
+# Matches a candidate PAN: 12 through 19 digits, each but the first preceded
+# by an optional space or hyphen, and not preceded or followed by a digit.
+_CANDIDATE_PATTERN: Pattern[bytes] = re.compile(
+    rb'(?<![0-9])[0-9](?:[ -]?[0-9]){11,18}(?![0-9])')
+
+# Specifies how many bytes the pattern may examine from the position where
+# it tries to match: the longest candidate, 19 digits and 18 separators, and
+# the byte after it.
+_LOOKAHEAD: int = 38
+
+# Holds the separators that may appear in a candidate PAN.
+_SEPARATORS: bytes = b' -'
+
+
+###############################################################################
+# PanScanReport
+###############################################################################
+
+
+class PanScanReport:
+    """
+    This class holds the results of scanning a file for clear PANs.
+
+    :param path: The path of the scanned file.
+    :param byte_count: The count of bytes scanned; for a ".gz" file, this is
+        the count of uncompressed bytes.
+    :param candidate_count: The count of digit runs that might be PANs.
+    :param pan_count: The count of candidates that passed the LUHN check.
+    :param findings: A list of (byte offset, masked PAN) tuples for the PANs,
+        where the byte offset is the offset of the first digit in the
+        uncompressed file. The list may hold fewer entries than
+        **pan_count**.
+    """
+
+    ###########################################################################
+    # METHODS
+    ###########################################################################
+
+    # =========================================================================
+    # CONSTRUCTOR
+    # =========================================================================
+
+    def __init__(
+            self, path: str, byte_count: int = 0, candidate_count: int = 0,
+            pan_count: int = 0,
+            findings: Optional[List[Tuple[int, str]]] = None):
+
+        self._path: str = path
+        self._byte_count: int = byte_count
+        self._candidate_count: int = candidate_count
+        self._pan_count: int = pan_count
+        self._findings: List[Tuple[int, str]] = findings or []
+
+    # =========================================================================
+    # __str__
+    # =========================================================================
+
+    def __str__(self):
+        return "{}: {} scanned, {}, {}".format(
+            self._path, plural(self._byte_count, '0', 'byte', 'bytes'),
+            plural(self._candidate_count, '0', 'candidate', 'candidates'),
+            plural(self._pan_count, '0', 'PAN', 'PANs'))
+
+    # =========================================================================
+    # get_byte_count
+    # =========================================================================
+
+    def get_byte_count(self) -> int:
+        """
+        Returns the count of (uncompressed) bytes scanned.
+        """
+
+        return self._byte_count
+
+    # =========================================================================
+    # get_candidate_count
+    # =========================================================================
+
+    def get_candidate_count(self) -> int:
+        """
+        Returns the count of digit runs that might be PANs.
+        """
+
+        return self._candidate_count
+
+    # =========================================================================
+    # get_findings
+    # =========================================================================
+
+    def get_findings(self) -> List[Tuple[int, str]]:
+        """
+        Returns a list of (byte offset, masked PAN) tuples for the PANs in the
+        order they appear in the file.
+        """
+
+        return self._findings
+
+    # =========================================================================
+    # get_pan_count
+    # =========================================================================
+
+    def get_pan_count(self) -> int:
+        """
+        Returns the count of candidates that passed the LUHN check.
+        """
+
+        return self._pan_count
+
+    # =========================================================================
+    # get_path
+    # =========================================================================
+
+    def get_path(self) -> str:
+        """
+        Returns the path of the scanned file.
+        """
+
+        return self._path
+
+    # =========================================================================
+    # is_clean
+    # =========================================================================
+
+    def is_clean(self) -> bool:
+        """
+        Returns TRUE if the file holds no clear PANs.
+        """
+
+        return self._pan_count == 0
+
+
+###############################################################################
+# METHODS
+###############################################################################
+
+
+# =============================================================================
+# main
+# =============================================================================
+
+def main(argv: Optional[Sequence[str]] = None) -> int:
+    """
+    Scans the files named on the command line and prints a report for each
+    file. Returns 0 if no file holds a clear PAN, 1 otherwise.
+
+    :param argv: The command-line arguments, less the program name; if you
+        omit this parameter, the method uses ``sys.argv``.
+    """
+
+    parser = argparse.ArgumentParser(
+        prog='python -m kojak.core.utilities.pan_scanner',
+        description='Scans log files for clear primary account numbers.')
+    parser.add_argument('files', metavar='FILE', nargs='+')
+    parser.add_argument(
+        '--processes', type=int, default=1,
+        help='the count of worker processes (default: 1)')
+    parser.add_argument(
+        '--chunk-size', type=int, default=DEFAULT_CHUNK_SIZE,
+        help='the size in bytes of the chunks to read (default: %(default)s)')
+    parser.add_argument(
+        '--max-findings', type=int, default=DEFAULT_MAX_FINDINGS,
+        help='the count of PANs to report per file (default: %(default)s)')
+    parser.add_argument(
+        '--first', type=int, default=4,
+        help='the count of leading digits to show (default: %(default)s)')
+    parser.add_argument(
+        '--last', type=int, default=4,
+        help='the count of trailing digits to show (default: %(default)s)')
+    args = parser.parse_args(argv)
+
+    clean: bool = True
+    for report in scan_files(
+            args.files, args.processes, args.chunk_size,
+            AccountNumberMasker(args.first, args.last), args.max_findings):
+        for offset, masked in report.get_findings():
+            print("{}: clear PAN {} at byte offset {}".format(
+                report.get_path(), masked, offset))
+        print(report)
+        clean = clean and report.is_clean()
+
+    return 0 if clean else 1
+
+
+# =============================================================================
+# scan_file
+# =============================================================================
+
+def scan_file(
+        path: str, chunk_size: int = DEFAULT_CHUNK_SIZE,
+        masker: Optional[AccountNumberMasker] = None,
+        max_findings: Optional[int] = None) -> PanScanReport:
+    """
+    Scans a file for clear PANs and returns a report of the PANs, masked.
+    The method reads files whose names end with ".gz" through ``gzip``.
+
+    :param path: The path of the file to scan.
+    :param chunk_size: The size in bytes of the chunks to read.
+    :param masker: The masker for the reported PANs; if you omit this
+        parameter, the method uses a default AccountNumberMasker.
+    :param max_findings: The maximum count of PANs to list in the report, or
+        None to list every PAN.
+    """
+
+    masker = masker or AccountNumberMasker()
+    with _open(path) as file:
+        return _scan_stream(path, file, chunk_size, masker, max_findings)
+
+
+# =============================================================================
+# scan_files
+# =============================================================================
+
+def scan_files(
+        paths: Sequence[str], processes: int = 1,
+        chunk_size: int = DEFAULT_CHUNK_SIZE,
+        masker: Optional[AccountNumberMasker] = None,
+        max_findings: Optional[int] = None) -> List[PanScanReport]:
+    """
+    Scans files for clear PANs and returns a report for each file, in the
+    order of **paths**.
+
+    :param paths: The paths of the files to scan.
+    :param processes: The count of worker processes; if you specify more than
+        one, the method scans the files in a process pool, one file per task.
+    :param chunk_size: The size in bytes of the chunks to read.
+    :param masker: The masker for the reported PANs; if you omit this
+        parameter, the method uses a default AccountNumberMasker.
+    :param max_findings: The maximum count of PANs to list in each report, or
+        None to list every PAN.
+    """
+
+    count: int = len(paths)
+    if processes > 1 and count > 1:
+        with ProcessPoolExecutor(max_workers=processes) as executor:
+            return list(executor.map(
+                scan_file, paths, [chunk_size] * count, [masker] * count,
+                [max_findings] * count))
+
+    return [scan_file(_, chunk_size, masker, max_findings) for _ in paths]
+
+
+def _open(path: str) -> BinaryIO:
+    """
+    Opens a file for reading bytes, decompressing ".gz" files.
+
+    :param path: The path of the file.
+    """
+
+    if path.endswith('.gz'):
+        return gzip.open(path, 'rb')
+    return open(path, 'rb')
+
+
+def _scan_stream(
+        path: str, file: BinaryIO, chunk_size: int,
+        masker: AccountNumberMasker,
+        max_findings: Optional[int]) -> PanScanReport:
+    """
+    Scans an open file for clear PANs, a chunk at a time, and returns a
+    report of the PANs.
+
+    :param path: The path of the file, for the report.
+    :param file: The file, open for reading bytes.
+    :param chunk_size: The size in bytes of the chunks to read.
+    :param masker: The masker for the reported PANs.
+    :param max_findings: The maximum count of PANs to list, or None to list
+        every PAN.
+    """
+
+    byte_count: int = 0
+    candidate_count: int = 0
+    pan_count: int = 0
+    findings: List[Tuple[int, str]] = []
+
+    # Holds the bytes from the byte before the position where the scan
+    # resumes, so that the pattern's look-behind sees the real byte there.
+    carry: bytes = b''
+    carry_offset: int = 0
+    start: int = 0
+
+    while True:
+        chunk: bytes = file.read(chunk_size)
+        byte_count += len(chunk)
+        data: bytes = carry + chunk
+
+        # A match tried at or after the cut might need bytes of the next
+        # chunk, so the scan stops there unless this is the last chunk and
+        # resumes where a scan of the whole file would try next. This keeps
+        # the results the same for every chunk size, even inside a long run
+        # of digits and separators.
+        cut: int = len(data) - _LOOKAHEAD if chunk else len(data)
+        resume: int = max(start, cut)
+        for match in _CANDIDATE_PATTERN.finditer(data, start):
+            if match.start() >= cut:
+                break
+            resume = max(match.end(), cut)
+            candidate_count += 1
+            digits: bytes = match.group().translate(None, _SEPARATORS)
+            if verify_checksum(digits):
+                if max_findings is None or pan_count < max_findings:
+                    findings.append((
+                        carry_offset + match.start(),
+                        masker.mask_number(digits.decode('ascii'))))
+                pan_count += 1
+
+        if not chunk:
+            break
+        keep: int = max(resume - 1, 0)
+        carry = data[keep:]
+        carry_offset += keep
+        start = resume - keep
+
+    return PanScanReport(
+        path, byte_count, candidate_count, pan_count, findings)
+
+
+###############################################################################
+# MAIN
+###############################################################################
+
+if __name__ == '__main__':
+    sys.exit(main())
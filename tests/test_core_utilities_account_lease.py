@@ -0,0 +1,191 @@
+"""
+Created on October 17, 2026
+"""
+
+import os
+import re
+import tempfile
+import threading
+import unittest
+from concurrent.futures import ThreadPoolExecutor
+from unittest import mock
+
+from kojak.core.exceptions import HardException
+from kojak.core.utilities import account_lease as al
+from kojak.core.utilities import account_number as an
+
+PATCH_TIME = 'kojak.core.utilities.account_lease.time.time'
+
+
+###############################################################################
+# TEST AccountLeaseManager
+###############################################################################
+
+class TestAccountLeaseManager(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'leases.db')
+        self.accounts = tuple(
+            an.AccountNumber(_) for _ in ('1111', '2222', '3333'))
+        self.generator = an.AccountNumberGeneratorFixed(self.accounts)
+        self.manager = al.AccountLeaseManager(
+            self.generator, self.path, ttl=60, max_attempts=3)
+
+    def tearDown(self):
+        self.manager.close()
+        self.directory.cleanup()
+
+    def test_CONSTRUCTOR(self):
+
+        msg = 'You must provide a ttl > 0'
+        self.assertRaisesRegex(
+            AssertionError, '^' + re.escape(msg) + '$',
+            al.AccountLeaseManager, self.generator, self.path, 0)
+
+        # The manager opens the lease file on first use.
+        self.assertFalse(os.path.exists(self.path))
+        self.assertEqual(0, self.manager.get_lease_count())
+        self.assertTrue(os.path.exists(self.path))
+
+    def test__str__(self):
+
+        self.assertEqual(
+            "AccountLeaseManager: leases from AccountNumberGeneratorFixed: "
+            "3 numbers starting with '1111' in '{}'".format(self.path),
+            str(self.manager))
+
+    def test_checkout(self):
+
+        leases = [self.manager.checkout() for _ in range(3)]
+        self.assertEqual(
+            list(self.accounts), [_.get_account() for _ in leases])
+        self.assertEqual(3, self.manager.get_lease_count())
+        self.assertRaisesRegex(
+            HardException, 'No account was free in 3 draws',
+            self.manager.checkout)
+
+        # A released account returns to circulation.
+        self.assertTrue(leases[1].release())
+        self.assertFalse(leases[1].release())
+        self.assertIs(self.accounts[1], self.manager.checkout().get_account())
+
+    def test_checkout__ttl(self):
+
+        msg = 'You must provide a ttl > 0'
+        self.assertRaisesRegex(
+            AssertionError, '^' + re.escape(msg) + '$',
+            self.manager.checkout, 0)
+
+        lease = self.manager.checkout()
+        self.assertRaisesRegex(
+            AssertionError, '^' + re.escape(msg) + '$',
+            lease.renew, 0)
+        self.assertTrue(lease.renew(1))
+
+    def test_checkout__expiry(self):
+
+        with mock.patch(PATCH_TIME, return_value=1000.0):
+            lease = self.manager.checkout(ttl=10)
+            self.assertEqual(1010.0, lease.get_expires())
+            self.assertFalse(lease.is_expired())
+            self.assertTrue(lease.renew(20))
+            self.assertEqual(1020.0, lease.get_expires())
+
+        with mock.patch(PATCH_TIME, return_value=1020.0):
+            self.assertTrue(lease.is_expired())
+            self.assertFalse(lease.renew())
+            self.assertEqual(0, self.manager.get_lease_count())
+
+            # The expired account goes to the next worker, and the old lease
+            # can no longer release it.
+            leases = [self.manager.checkout() for _ in range(3)]
+            self.assertFalse(lease.release())
+            self.assertEqual(3, self.manager.get_lease_count())
+            self.assertEqual(0, self.manager.purge())
+
+        with mock.patch(PATCH_TIME, return_value=2000.0):
+            self.assertEqual(3, self.manager.purge())
+            self.assertFalse(leases[0].release())
+
+    def test_checkout__managers(self):
+
+        # Managers that share a lease file, as in separate processes, honor
+        # each other's leases.
+        with al.AccountLeaseManager(
+                an.AccountNumberGeneratorFixed(self.accounts), self.path,
+                max_attempts=3) as other:
+            with self.manager.checkout() as lease:
+                self.assertNotEqual(
+                    lease.get_account(), other.checkout().get_account())
+                self.assertEqual(2, other.get_lease_count())
+            self.assertEqual(1, other.get_lease_count())
+
+    @unittest.skipUnless(hasattr(os, 'fork'), 'The platform cannot fork')
+    def test_checkout__fork(self):
+
+        # A forked process opens its own connection and leaves the parent's
+        # open when it closes the manager.
+        lease = self.manager.checkout()
+        connection = self.manager._get_connection()
+        read, write = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            try:
+                own = self.manager._get_connection() is not connection
+                number = self.manager.checkout().get_account()
+                self.manager.close()
+                os.write(write, '{} {}'.format(
+                    own, number.get_account_number()).encode('ascii'))
+            finally:
+                os._exit(0)
+        os.close(write)
+        with os.fdopen(read) as file:
+            child = file.read().split()
+        os.waitpid(pid, 0)
+        self.assertEqual(['True', '2222'], child)
+        self.assertIs(connection, self.manager._get_connection())
+        self.assertEqual(2, self.manager.get_lease_count())
+        self.assertTrue(lease.release())
+
+    def test_checkout__threads(self):
+
+        manager = al.AccountLeaseManager(
+            an.AccountNumberGeneratorFixed(tuple(
+                an.AccountNumber(str(_)) for _ in range(1000, 1040))),
+            self.path, max_attempts=1000)
+        in_use = set()
+        lock = threading.Lock()
+
+        def work():
+            conflicts = 0
+            for _ in range(100):
+                with manager.checkout() as lease:
+                    number = lease.get_account().get_account_number()
+                    with lock:
+                        conflicts += number in in_use
+                        in_use.add(number)
+                    with lock:
+                        in_use.discard(number)
+            return conflicts
+
+        with ThreadPoolExecutor(16) as executor:
+            conflicts = sum(executor.map(lambda _: work(), range(16)))
+        manager.close()
+        self.assertEqual(0, conflicts)
+        self.assertEqual(0, self.manager.get_lease_count())
+
+
+###############################################################################
+# TEST AccountLease
+###############################################################################
+
+class TestAccountLease(unittest.TestCase):
+
+    def test__str__(self):
+
+        masker = an.AccountNumberMasker()
+        account = an.AccountNumber('4111111111111111', masker=masker)
+        lease = al.AccountLease(None, account, 'token', 0.0)
+        self.assertRegex(
+            str(lease), r"^AccountLease: '4111\*{8}1111' until \d{4}-")
@@ -5,15 +5,60 @@ Created on February 12, 2017
 """
 
 import copy
+import os
+import random
 import re
+import sys
 import unittest
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from unittest import mock
 
+from kojak.core.exceptions import HardException
 from kojak.core.utilities import account_number as an
+from kojak.core.utilities import luhn_algorithm as la
 
 PATCH_RANDOM = 'kojak.core.utilities.account_number.random'
 
 
+def run_forked(function):
+    """
+    Calls a function, which returns a list of strings, in a forked process
+    and returns the list.
+    """
+
+    read, write = os.pipe()
+    pid = os.fork()
+    if pid == 0:
+        try:
+            os.write(write, ' '.join(function()).encode('ascii'))
+        finally:
+            os._exit(0)
+
+    os.close(write)
+    with os.fdopen(read) as file:
+        strings = file.read().split()
+    os.waitpid(pid, 0)
+    return strings
+
+
+def run_threads(function, thread_count):
+    """
+    Calls a function from many threads at once, switching threads as often
+    as the interpreter allows, and returns the concatenated lists that the
+    calls return.
+    """
+
+    interval = sys.getswitchinterval()
+    sys.setswitchinterval(1e-6)
+    try:
+        with ThreadPoolExecutor(thread_count) as executor:
+            futures = [executor.submit(function) for _ in range(thread_count)]
+            return sum((_.result() for _ in futures), [])
+    finally:
+        sys.setswitchinterval(interval)
+
+
 ###############################################################################
 # TEST AccountNumber
 ###############################################################################
@@ -90,6 +135,26 @@ class TestAccountNumber(unittest.TestCase):
         x = an.AccountNumber(account_number='373412345678900')
         self.assertEqual("AccountNumber: account_number='373412345678900' bank_display_name='' bank_name='' cvv='900' cvv_bad='901' cvv_length=3 masker=None routing_number='' use_bad_cvv=False", str(x))
 
+    def test_CONSTRUCTOR__slots(self):
+        # Instances keep their attributes in slots rather than a __dict__,
+        # including instances of the check-digit subclasses.
+        for x in (an.AccountNumber('1'), an.AccountNumberLuhn('18'),
+                  an.AccountNumberVerhoeff('2360'), an.AccountNumberMasker()):
+            self.assertFalse(hasattr(x, '__dict__'))
+
+        # Shared strings are interned.
+        x = an.AccountNumber(
+            '1', bank_display_name=''.join(['Bank of ', 'Gallifrey']),
+            bank_name=''.join(['Da', 'Bank']),
+            routing_number=''.join(['222', '33345678']))
+        y = an.AccountNumber(
+            '2', bank_display_name=''.join(['Bank of ', 'Gallifrey']),
+            bank_name=''.join(['Da', 'Bank']),
+            routing_number=''.join(['222', '33345678']))
+        self.assertIs(x.get_bank_display_name(), y.get_bank_display_name())
+        self.assertIs(x.get_bank_name(), y.get_bank_name())
+        self.assertIs(x.get_routing_number(), y.get_routing_number())
+
     def test_CONSTRUCTOR__bank_display_name(self):
         x = an.AccountNumber('', bank_display_name='Bank of Gallifrey')
         self.assertEqual("AccountNumber: account_number='' bank_display_name='Bank of Gallifrey' bank_name='' cvv='' cvv_bad='' cvv_length=0 masker=None routing_number='' use_bad_cvv=False", str(x))
@@ -269,6 +334,44 @@ class TestAccountNumber(unittest.TestCase):
         x2 = an.AccountNumber(**temp_kwargs)
         self.assertNotEqual(x, x2)
 
+    def test___eq____lazy(self):
+
+        # Account numbers that differ in the account number compare unequal
+        # without deriving their CVVs.
+        x = an.AccountNumber.create_lazy('4111111111111111')
+        x2 = an.AccountNumber.create_lazy('4111111111111112')
+        self.assertNotEqual(x, x2)
+        self.assertIsNone(x._cvv)
+        self.assertIsNone(x2._cvv)
+
+        self.assertEqual(x, x)
+        self.assertIsNone(x._cvv)
+
+        self.assertEqual(an.AccountNumber.create_lazy('4111111111111111'), x)
+        self.assertEqual('111', x._cvv)
+
+    # =========================================================================
+    # METHOD - __hash__
+    # =========================================================================
+
+    def test___hash__(self):
+        x = an.AccountNumber(**self.kwargs)
+        self.assertEqual(hash(x), hash(an.AccountNumber(**self.kwargs)))
+        self.assertEqual(hash(x), hash(x.copy()))
+
+        # Account numbers that differ only in other fields share a hash but
+        # stay distinct in a set.
+        temp_kwargs = copy.copy(self.kwargs)
+        temp_kwargs['bank_name'] = 'some other bank'
+        x2 = an.AccountNumber(**temp_kwargs)
+        self.assertEqual(hash(x), hash(x2))
+        self.assertEqual(2, len({x, x2, x.copy(), x2.copy()}))
+
+        numbers = {an.AccountNumber.create_lazy(str(_ % 100))
+                   for _ in range(1000)}
+        self.assertEqual(100, len(numbers))
+        self.assertIn(an.AccountNumber('42', cvv='42'), numbers)
+
     # =========================================================================
     # METHOD - copy
     # =========================================================================
@@ -278,6 +381,53 @@ class TestAccountNumber(unittest.TestCase):
         x2 = x.copy()
         self.assertEqual(x, x2)
 
+    # =========================================================================
+    # METHOD - create_lazy
+    # =========================================================================
+
+    def test_create_lazy(self):
+
+        # A lazy account number equals the one that the constructor makes.
+        for account_number, cvv_length in (
+                ('373412345678900', -1), ('373412345678900', 4),
+                ('373412345678999', 3), ('12', -1), ('12', 5), ('1234', 0),
+                ('', -1)):
+            x = an.AccountNumber.create_lazy(
+                account_number, 'BDN', 'BN', cvv_length, self.masker, 'RN')
+            self.assertIs(an.AccountNumber, type(x))
+            self.assertIsNone(x._cvv)
+            expected = an.AccountNumber(
+                account_number, 'BDN', 'BN', cvv_length=cvv_length,
+                masker=self.masker, routing_number='RN')
+            self.assertEqual(expected.get_cvv_length(), x.get_cvv_length())
+            self.assertEqual(expected, x)
+            self.assertEqual(str(expected), str(x))
+
+        # The CVVs are derived on first use.
+        x = an.AccountNumber.create_lazy('373412345678900')
+        self.assertEqual('901', x.get_cvv_bad())
+        self.assertEqual('900', x._cvv)
+        x = an.AccountNumber.create_lazy('373412345678900')
+        x.use_bad_cvv(True)
+        self.assertEqual('901', x.get_cvv())
+        x = an.AccountNumber.create_lazy('373412345678900')
+        self.assertEqual(an.AccountNumber('373412345678900'), x.copy())
+
+        # A check-digit subclass applies its check digits.
+        x = an.AccountNumberLuhn.create_lazy('4588883200009191')
+        self.assertIs(an.AccountNumberLuhn, type(x))
+        self.assertEqual(an.AccountNumberLuhn('4588883200009190'), x)
+
+    @mock.patch('kojak.core.utilities.account_number._LOGGER')
+    def test_create_lazy__non_numeric(self, mock_logger):
+
+        x = an.AccountNumber.create_lazy('ABCDEF')
+        mock_logger.warn.assert_not_called()
+        self.assertEqual('DEF', x.get_cvv())
+        self.assertEqual('', x.get_cvv_bad())
+        mock_logger.warn.assert_called_once_with(
+            "Exception encountered trying to create the bad CVV for 'DEF'")
+
     # =========================================================================
     # METHOD - get_last_n
     # =========================================================================
@@ -451,6 +601,37 @@ class TestAccountNumberLuhn(unittest.TestCase):
         self.assertEqual("AccountNumberLuhn: account_number='373400000000001' bank_display_name='' bank_name='' cvv='001' cvv_bad='002' cvv_length=3 masker=None routing_number='' use_bad_cvv=False", str(x))
 
 
+###############################################################################
+# TEST AccountNumberCheckDigit
+###############################################################################
+
+class TestAccountNumberCheckDigit(unittest.TestCase):
+
+    # =========================================================================
+    # METHOD - CONSTRUCTOR
+    # =========================================================================
+
+    def test_CONSTRUCTOR(self):
+        self.assertEqual(
+            '373400000000001',
+            an.AccountNumberCheckDigit('373400000000000').get_account_number())
+        self.assertEqual(
+            '2363', an.AccountNumberVerhoeff('2360').get_account_number())
+        self.assertEqual(
+            '5724', an.AccountNumberDamm('5729').get_account_number())
+        self.assertEqual(
+            '12345676', an.AccountNumberMod97('12345600').get_account_number())
+
+    # =========================================================================
+    # METHOD - _create_with_checksum
+    # =========================================================================
+
+    def test__create_with_checksum(self):
+        x = an.AccountNumberVerhoeff._create_with_checksum('2363', cvv='123')
+        self.assertIs(an.AccountNumberVerhoeff, type(x))
+        self.assertEqual(an.AccountNumberVerhoeff('2360', cvv='123'), x)
+
+
 ###############################################################################
 # TEST AccountNumberMasker
 ###############################################################################
@@ -526,6 +707,26 @@ class TestAccountNumberMasker(unittest.TestCase):
         x2 = an.AccountNumberMasker(6, 3, '*')
         self.assertNotEqual(x, x2)
 
+    # =========================================================================
+    # METHOD - get_clear_digits
+    # =========================================================================
+
+    def test_get_clear_digits(self):
+        self.assertEqual((4, 4), an.AccountNumberMasker().get_clear_digits())
+        self.assertEqual(
+            (0, 3), an.AccountNumberMasker(-1, 3).get_clear_digits())
+
+    # =========================================================================
+    # METHOD - __hash__
+    # =========================================================================
+
+    def test___hash__(self):
+        x = an.AccountNumberMasker(6, 3, '#')
+        self.assertEqual(hash(x), hash(an.AccountNumberMasker(6, 3, '#')))
+        self.assertEqual(
+            2, len({x, an.AccountNumberMasker(6, 3, '#'),
+                    an.AccountNumberMasker()}))
+
     # =========================================================================
     # METHOD - mask_number
     # =========================================================================
@@ -609,6 +810,459 @@ class TestAccountNumberMasker(unittest.TestCase):
         self.assertEqual('1234********3456', x.mask_number('1234567890123456'))
 
 
+###############################################################################
+# TEST AccountNumberBatch
+###############################################################################
+
+class TestAccountNumberBatch(unittest.TestCase):
+
+    masker = an.AccountNumberMasker(6, 4)
+
+    def make_account_numbers(self):
+        account_numbers = [
+            an.AccountNumber('373412345678900', 'BankOfGallifrey', 'DaBank',
+                             masker=self.masker, routing_number='22233345678'),
+            an.AccountNumberLuhn('4588883200009199', cvv='1234'),
+            an.AccountNumber(''),
+            an.AccountNumberMod97('1234567800', 'Bank', cvv_length=4,
+                                  masker=an.AccountNumberMasker(0, 2)),
+        ]
+        account_numbers[1].use_bad_cvv(True)
+        return account_numbers
+
+    # =========================================================================
+    # METHOD - CONSTRUCTOR
+    # =========================================================================
+
+    def test_CONSTRUCTOR(self):
+        x = an.AccountNumberBatch()
+        self.assertEqual(0, len(x))
+        self.assertEqual([], x.to_list())
+        self.assertEqual('AccountNumberBatch: 0 account numbers', str(x))
+
+        account_numbers = self.make_account_numbers()
+        x = an.AccountNumberBatch(account_numbers)
+        self.assertEqual(4, len(x))
+        self.assertEqual('AccountNumberBatch: 4 account numbers', str(x))
+
+    # =========================================================================
+    # METHOD - __getitem__
+    # =========================================================================
+
+    def test___getitem__(self):
+        account_numbers = self.make_account_numbers()
+        x = an.AccountNumberBatch(account_numbers)
+        for i, account_number in enumerate(account_numbers):
+            self.assertEqual(str(account_number), str(x[i]))
+            self.assertIs(type(account_number), type(x[i]))
+        self.assertEqual(str(account_numbers[-1]), str(x[-1]))
+        self.assertIs(self.masker, x[0].get_masker())
+        with self.assertRaises(IndexError):
+            x[4]
+
+        # Changing an account number does not change the batch.
+        y = x[0]
+        y.set_routing_number('1')
+        self.assertEqual('22233345678', x[0].get_routing_number())
+
+    def test___getitem____maskers(self):
+
+        # Equal maskers share one table entry, but a masker subclass that
+        # compares equal keeps its own.
+        class Masker(an.AccountNumberMasker):
+            def mask_number(self, number):
+                return number
+
+        x = an.AccountNumberBatch([
+            an.AccountNumber('4111111111111111', masker=self.masker),
+            an.AccountNumber(
+                '4111111111111111', masker=an.AccountNumberMasker(6, 4)),
+            an.AccountNumber('4111111111111111', masker=Masker(6, 4)),
+        ])
+        self.assertEqual(2, len(x._maskers._values))
+        self.assertIs(x[0].get_masker(), x[1].get_masker())
+        self.assertIs(Masker, type(x[2].get_masker()))
+        self.assertEqual('4111111111111111', x[2].get_masked_number())
+
+    def test___getitem____slice(self):
+        account_numbers = self.make_account_numbers()
+        x = an.AccountNumberBatch(account_numbers)
+        for index in (slice(1, 3), slice(None, None, -2), slice(5, 9)):
+            y = x[index]
+            self.assertIsInstance(y, an.AccountNumberBatch)
+            self.assertEqual(
+                [str(_) for _ in account_numbers[index]],
+                [str(_) for _ in y])
+
+    # =========================================================================
+    # METHOD - __iter__
+    # =========================================================================
+
+    def test___iter__(self):
+        account_numbers = self.make_account_numbers()
+        x = an.AccountNumberBatch(account_numbers)
+        self.assertEqual(account_numbers, list(x))
+        self.assertEqual(account_numbers, x.to_list())
+
+    # =========================================================================
+    # METHOD - __setitem__
+    # =========================================================================
+
+    def test___setitem__(self):
+        account_numbers = self.make_account_numbers()
+        x = an.AccountNumberBatch(account_numbers)
+        y = an.AccountNumberLuhn(
+            '60110000000000000000', 'New Bank', cvv='98765',
+            routing_number='22233345678')
+        x[2] = y
+        self.assertEqual(str(y), str(x[2]))
+        self.assertEqual(
+            [str(_) for _ in account_numbers[:2] + [y] + account_numbers[3:]],
+            [str(_) for _ in x])
+
+    # =========================================================================
+    # METHOD - append
+    # =========================================================================
+
+    def test_append(self):
+        x = an.AccountNumberBatch()
+        for account_number in self.make_account_numbers():
+            x.append(account_number)
+        self.assertEqual(self.make_account_numbers(), x.to_list())
+
+    def test_append__distinct_values(self):
+        # The table columns widen their indexes past 0x10000 distinct values.
+        x = an.AccountNumberBatch()
+        for i in range(0x10000 + 10):
+            x.append(an.AccountNumber('4111', routing_number=str(i)))
+        self.assertEqual(0x10000 + 10, len(x))
+        self.assertEqual('65545', x[-1].get_routing_number())
+        self.assertEqual('0', x[0].get_routing_number())
+
+        column = an._TableColumn()
+        for i in range(0x10000):
+            column.append(i)
+        column.extend_repeated('x', 3)
+        self.assertEqual([0xFFFF, 'x', 'x', 'x'], column.get_all()[-4:])
+
+    def test_append__error(self):
+        # A failed append leaves every column as it was.
+        x = an.AccountNumberBatch(self.make_account_numbers())
+        expected = x.to_list()
+        account_number = an.AccountNumber('4111', routing_number='new')
+        account_number._cvv_length = 0x10000
+        self.assertRaises(OverflowError, x.append, account_number)
+        self.assertEqual(len(expected), len(x))
+        self.assertEqual(expected, x.to_list())
+        self.assertEqual(
+            [_.get_account_number() for _ in expected], x.get_account_numbers())
+        self.assertEqual(
+            [_.get_cvv() for _ in expected], x.get_cvvs())
+        x.append(an.AccountNumber('4111'))
+        self.assertEqual(len(expected) + 1, len(x))
+        self.assertEqual('4111', x[-1].get_account_number())
+
+    # =========================================================================
+    # METHOD - get_*
+    # =========================================================================
+
+    def test_get_columns(self):
+        account_numbers = self.make_account_numbers()
+        x = an.AccountNumberBatch(account_numbers)
+        self.assertEqual(
+            [_.get_account_number() for _ in account_numbers],
+            x.get_account_numbers())
+        self.assertEqual(
+            [_.get_bank_display_name() for _ in account_numbers],
+            x.get_bank_display_names())
+        self.assertEqual(
+            [_.get_bank_name() for _ in account_numbers], x.get_bank_names())
+        self.assertEqual(
+            [_.get_cvv() for _ in account_numbers], x.get_cvvs())
+        self.assertEqual(
+            [_.get_cvv_bad() for _ in account_numbers], x.get_cvvs_bad())
+        self.assertEqual(
+            [_.get_masked_number() for _ in account_numbers],
+            x.get_masked_numbers())
+        self.assertEqual(
+            [_.get_routing_number() for _ in account_numbers],
+            x.get_routing_numbers())
+
+
+###############################################################################
+# TEST AccountNumberIndex
+###############################################################################
+
+class TestAccountNumberIndex(unittest.TestCase):
+
+    masker = an.AccountNumberMasker()
+
+    account_numbers = (
+        an.AccountNumber('4588883200009190', masker=masker),
+        an.AccountNumber('4588111100009190', masker=masker),
+        an.AccountNumber('4111111111111111', masker=masker),
+        an.AccountNumber('45889190', masker=masker),
+    )
+
+    # =========================================================================
+    # METHOD - CONSTRUCTOR
+    # =========================================================================
+
+    def test_CONSTRUCTOR(self):
+
+        x = an.AccountNumberIndex(account_numbers=self.account_numbers)
+        self.assertEqual(4, len(x))
+        self.assertEqual(self.masker, x.get_masker())
+        self.assertEqual(
+            'AccountNumberIndex: 4 account numbers under 3 keys', str(x))
+        self.assertEqual(
+            'AccountNumberIndex: 0 account numbers under 0 keys',
+            str(an.AccountNumberIndex()))
+
+        class Masker(an.AccountNumberMasker):
+            def mask_number(self, number):
+                return '*' * (len(number) - 4) + number[-4:]
+
+        msg = 'You must provide a masker that overrides get_clear_digits() ' \
+            'if it overrides mask_number()'
+        self.assertRaisesRegex(
+            AssertionError, '^' + re.escape(msg) + '$',
+            an.AccountNumberIndex, Masker())
+
+    def test_CONSTRUCTOR__masker_subclass(self):
+
+        # A masker that overrides mask_number() keys the index by the digits
+        # that its get_clear_digits() reports.
+        class Masker(an.AccountNumberMasker):
+            def get_clear_digits(self):
+                return 0, 4
+
+            def mask_number(self, number):
+                return '*' * (len(number) - 4) + number[-4:]
+
+        masker = Masker()
+        account_numbers = [
+            an.AccountNumber(_.get_account_number(), masker=masker)
+            for _ in self.account_numbers]
+        x = an.AccountNumberIndex(masker, account_numbers)
+        self.assertEqual(
+            account_numbers[:2], x.find(account_numbers[0].get_masked_number()))
+        self.assertEqual(
+            [account_numbers[2]], x.find('************1111'))
+
+    # =========================================================================
+    # METHOD - find
+    # =========================================================================
+
+    def test_find(self):
+
+        x = an.AccountNumberIndex(self.masker)
+        x.extend(self.account_numbers[:2])
+        x.add(self.account_numbers[2])
+
+        self.assertEqual(
+            list(self.account_numbers[:2]), x.find('4588********9190'))
+        self.assertEqual(
+            list(self.account_numbers[:2]), x.find('4588XXXXXXXX9190'))
+        self.assertEqual(
+            [self.account_numbers[2]], x.find('4111********1111'))
+        self.assertEqual([], x.find('4588*********9190'))
+        self.assertEqual([], x.find('4588********9191'))
+
+        # A number too short to mask is its own key.
+        x.add(self.account_numbers[3])
+        self.assertEqual([self.account_numbers[3]], x.find('45889190'))
+
+        # Another masker keys the index by other clear digits.
+        x = an.AccountNumberIndex(
+            an.AccountNumberMasker(6, 4, '#'), self.account_numbers)
+        self.assertEqual(
+            [self.account_numbers[0]], x.find('458888######9190'))
+
+    def test_find__generator(self):
+
+        generator = an.AccountNumberGeneratorRandomLuhn(
+            16, None, None, 3, self.masker, None, ('4588',), seed=5)
+        x = an.AccountNumberIndex(self.masker)
+        x.extend(generator.get_new_numbers(1000, batch=True))
+        for account_number in generator.get_new_numbers(100):
+            x.add(account_number)
+            self.assertIn(
+                account_number, x.find(account_number.get_masked_number()))
+        self.assertEqual(1100, len(x))
+
+    # =========================================================================
+    # METHOD - remove
+    # =========================================================================
+
+    def test_remove(self):
+
+        x = an.AccountNumberIndex(self.masker, self.account_numbers)
+        self.assertTrue(x.remove(self.account_numbers[0].copy()))
+        self.assertEqual([self.account_numbers[1]], x.find('4588********9190'))
+        self.assertFalse(x.remove(self.account_numbers[0]))
+        self.assertTrue(x.remove(self.account_numbers[1]))
+        self.assertEqual([], x.find('4588********9190'))
+        self.assertEqual(2, len(x))
+        self.assertEqual(
+            'AccountNumberIndex: 2 account numbers under 2 keys', str(x))
+
+
+###############################################################################
+# TEST AccountNumberSet
+###############################################################################
+
+class TestAccountNumberSet(unittest.TestCase):
+
+    masker = an.AccountNumberMasker()
+
+    account_numbers = (
+        an.AccountNumber('4588883200009190', masker=masker),
+        an.AccountNumber('4588111100009190', masker=masker),
+        an.AccountNumber('4111111111111111', masker=masker),
+        an.AccountNumber('5500000000001111', masker=masker),
+    )
+
+    # =========================================================================
+    # METHOD - CONSTRUCTOR
+    # =========================================================================
+
+    def test_CONSTRUCTOR(self):
+
+        x = an.AccountNumberSet(self.account_numbers * 2)
+        self.assertEqual(4, len(x))
+        self.assertEqual(list(self.account_numbers), list(x))
+        self.assertEqual('AccountNumberSet: 4 account numbers', str(x))
+        self.assertEqual(
+            'AccountNumberSet: 0 account numbers', str(an.AccountNumberSet()))
+
+        msg = 'You must provide a last_n > 0'
+        self.assertRaisesRegex(
+            AssertionError, '^' + re.escape(msg) + '$',
+            an.AccountNumberSet, last_n=0)
+
+    # =========================================================================
+    # METHOD - __contains__
+    # =========================================================================
+
+    def test___contains__(self):
+
+        x = an.AccountNumberSet(self.account_numbers)
+        self.assertIn(self.account_numbers[0].copy(), x)
+        self.assertNotIn(an.AccountNumber('4588883200009191'), x)
+        self.assertNotIn('4588883200009190', x)
+
+        # The set keys account numbers by account number string, and keeps
+        # the first account number added under each.
+        y = an.AccountNumber('4588883200009190', 'BDN', cvv='999')
+        self.assertIn(y, x)
+        x.add(y)
+        self.assertIn(y, x)
+        self.assertEqual(4, len(x))
+        self.assertIs(self.account_numbers[0], x.get('4588883200009190'))
+        self.assertIsNone(x.get('4588883200009191'))
+
+        x.discard(y)
+        self.assertNotIn(self.account_numbers[0], x)
+        self.assertEqual(3, len(x))
+        self.assertEqual([self.account_numbers[1]], x.find_by_last_n('9190'))
+
+    # =========================================================================
+    # METHOD - discard
+    # =========================================================================
+
+    def test_discard(self):
+
+        x = an.AccountNumberSet(self.account_numbers)
+        x.discard(self.account_numbers[0].copy())
+        x.discard(self.account_numbers[0])
+        self.assertEqual(3, len(x))
+        self.assertEqual([self.account_numbers[1]], x.find_by_last_n('9190'))
+        self.assertEqual(
+            [self.account_numbers[1]],
+            x.find_by_masked_number('4588********9190'))
+
+        x.discard(self.account_numbers[1])
+        self.assertEqual([], x.find_by_last_n('9190'))
+        self.assertEqual([], x.find_by_masked_number('4588********9190'))
+        self.assertRaises(KeyError, x.remove, self.account_numbers[1])
+
+    # =========================================================================
+    # METHOD - find_by_last_n
+    # =========================================================================
+
+    def test_find_by_last_n(self):
+
+        x = an.AccountNumberSet(self.account_numbers)
+        self.assertEqual(
+            list(self.account_numbers[:2]), x.find_by_last_n('9190'))
+        self.assertEqual(
+            [self.account_numbers[2], self.account_numbers[3]],
+            x.find_by_last_n('1111'))
+        self.assertEqual([], x.find_by_last_n('0000'))
+
+        x = an.AccountNumberSet(self.account_numbers, last_n=6)
+        self.assertEqual(
+            [self.account_numbers[3]], x.find_by_last_n('001111'))
+
+    # =========================================================================
+    # METHOD - find_by_masked_number
+    # =========================================================================
+
+    def test_find_by_masked_number(self):
+
+        x = an.AccountNumberSet(self.account_numbers)
+        self.assertEqual(
+            list(self.account_numbers[:2]),
+            x.find_by_masked_number('4588********9190'))
+        self.assertEqual([], x.find_by_masked_number('4588********1111'))
+
+        x = an.AccountNumberSet(
+            self.account_numbers, masker=an.AccountNumberMasker(6, 4))
+        self.assertEqual(
+            [self.account_numbers[0]],
+            x.find_by_masked_number('458888******9190'))
+
+    # =========================================================================
+    # METHOD - set operations
+    # =========================================================================
+
+    def test_set_operations(self):
+
+        x = an.AccountNumberSet(self.account_numbers[:3])
+        y = an.AccountNumberSet(self.account_numbers[1:])
+        self.assertEqual(set(self.account_numbers), set(x | y))
+        self.assertEqual([self.account_numbers[0]], list(x - y))
+        self.assertEqual(list(self.account_numbers[1:3]), list(x & y))
+        self.assertIsInstance(x | y, an.AccountNumberSet)
+        self.assertEqual(
+            [self.account_numbers[2]], (x & y).find_by_last_n('1111'))
+
+        # The operations compare account number strings.
+        z = an.AccountNumberSet(
+            an.AccountNumber(_.get_account_number(), 'BDN')
+            for _ in self.account_numbers[:2])
+        self.assertEqual(
+            ['4588883200009190', '4588111100009190'],
+            [_.get_account_number() for _ in x & z])
+        self.assertEqual([self.account_numbers[2]], list(x - z))
+        self.assertLessEqual(z, x)
+
+        # The results keep the last_n and masker of the left operand.
+        masker = an.AccountNumberMasker(6, 4)
+        x = an.AccountNumberSet(self.account_numbers[:1], 2, masker)
+        for result in (x | an.AccountNumberSet(), x & x, x - z, x ^ z):
+            self.assertEqual(2, result._last_n)
+            self.assertIs(masker, result._by_masked_number.get_masker())
+        self.assertEqual(
+            [self.account_numbers[0]],
+            (x | an.AccountNumberSet()).find_by_last_n('90'))
+        self.assertEqual(
+            [self.account_numbers[0]],
+            (x | an.AccountNumberSet()).find_by_masked_number(
+                '458888******9190'))
+
+
 ###############################################################################
 # TEST AccountNumberGenerator
 ###############################################################################
@@ -657,7 +1311,7 @@ class TestAccountNumberGeneratorFixed(unittest.TestCase):
 
         x = an.AccountNumberGeneratorFixed(self.account_numbers)
         self.assertIs(x._numbers, self.account_numbers)
-        self.assertEqual(x._next_number, 0)
+        self.assertIs(self.account_numbers[0], x.get_new_number())
 
         msg = 'You must provide at least one account number'
         self.assertRaisesRegex(
@@ -700,6 +1354,33 @@ class TestAccountNumberGeneratorFixed(unittest.TestCase):
         account_number = x.get_new_number()
         self.assertIs(account_number, self.account_numbers[0])
 
+    def test_get_new_number__threads(self):
+
+        x = an.AccountNumberGeneratorFixed(self.account_numbers)
+
+        # Every thread takes a different slot, so the numbers come out
+        # exactly even.
+        numbers = run_threads(
+            lambda: [id(x.get_new_number()) for _ in range(1000)], 64)
+        self.assertEqual(
+            {id(_): 16000 for _ in self.account_numbers}, Counter(numbers))
+
+    def test_get_new_numbers(self):
+
+        x = an.AccountNumberGeneratorFixed(self.account_numbers)
+
+        account_numbers = x.get_new_numbers(5)
+        self.assertEqual(5, len(account_numbers))
+        for i, account_number in enumerate(account_numbers):
+            self.assertIs(account_number, self.account_numbers[i % 4])
+
+        account_numbers = x.get_new_numbers(2, batch=True)
+        self.assertIsInstance(account_numbers, an.AccountNumberBatch)
+        self.assertEqual(
+            list(self.account_numbers[1:3]), account_numbers.to_list())
+
+        self.assertEqual([], x.get_new_numbers(0))
+
 
 ###############################################################################
 # TEST AccountNumberGeneratorRandom
@@ -734,7 +1415,7 @@ class TestAccountNumberGeneratorRandom(unittest.TestCase):
         self.assertIs(x._masker, self.kwargs['masker'])
         self.assertEqual(x._routing_number, self.kwargs['routing_number'])
         self.assertIs(x._prefixes, self.kwargs['prefixes'])
-        self.assertEqual(x._next_prefix, 0)
+        self.assertEqual(x.get_counter(), 0)
 
         temp_kwargs = copy.copy(self.kwargs)
         temp_kwargs['length'] = 0
@@ -769,6 +1450,8 @@ class TestAccountNumberGeneratorRandom(unittest.TestCase):
     @mock.patch(PATCH_RANDOM)
     def test_get_new_number(self, mock_random):
 
+        # The generator draws from its private random.Random.
+        mock_random.Random.return_value = mock_random
         mock_random.randint.side_effect = [_ % 10 for _ in range(200)]
 
         x = an.AccountNumberGeneratorRandom(**self.kwargs)
@@ -792,6 +1475,8 @@ class TestAccountNumberGeneratorRandom(unittest.TestCase):
     @mock.patch(PATCH_RANDOM)
     def test__get_next_number(self, mock_random):
 
+        # The generator draws from its private random.Random.
+        mock_random.Random.return_value = mock_random
         mock_random.randint.side_effect = [_ % 10 for _ in range(200)]
 
         x = an.AccountNumberGeneratorRandom(**self.kwargs)
@@ -808,6 +1493,288 @@ class TestAccountNumberGeneratorRandom(unittest.TestCase):
         account_number = x._get_next_number()
         self.assertEqual(account_number, '1234567890123456')
 
+    @mock.patch(PATCH_RANDOM)
+    def test_get_new_numbers(self, mock_random):
+
+        # The generator draws from its private random.Random.
+        mock_random.Random.return_value = mock_random
+        mock_random.randrange.return_value = 0
+
+        x = an.AccountNumberGeneratorRandom(**self.kwargs)
+        x.get_new_number()
+
+        account_numbers = x.get_new_numbers(4)
+        self.assertEqual(
+            [an.AccountNumber('2200000000000000', 'BDN', 'BN', '000', '001', 3, self.masker, 'RN', False),
+             an.AccountNumber('3330000000000000', 'BDN', 'BN', '000', '001', 3, self.masker, 'RN', False),
+             an.AccountNumber('1000000000000000', 'BDN', 'BN', '000', '001', 3, self.masker, 'RN', False),
+             an.AccountNumber('2200000000000000', 'BDN', 'BN', '000', '001', 3, self.masker, 'RN', False)],
+            account_numbers)
+        self.assertEqual(5, x.get_counter())
+
+    @unittest.skipUnless(hasattr(os, 'fork'), 'The platform cannot fork')
+    def test_get_new_numbers__fork(self):
+
+        def get_numbers():
+            return [_.get_account_number()
+                    for _ in x.get_new_numbers(5) + y.get_new_numbers(5)]
+
+        # A forked process reseeds a generator that no caller seeded, and
+        # its spawned children, so it draws other account numbers than its
+        # parent.
+        x = an.AccountNumberGeneratorRandom(**self.kwargs)
+        y = x.spawn(1)[0]
+        child = run_forked(get_numbers)
+        parent = get_numbers()
+        self.assertEqual(10, len(child))
+        self.assertNotEqual(parent[:5], child[:5])
+        self.assertNotEqual(parent[5:], child[5:])
+
+        # A seeded generator repeats its account numbers.
+        temp_kwargs = copy.copy(self.kwargs)
+        temp_kwargs['seed'] = 5
+        x = an.AccountNumberGeneratorRandom(**temp_kwargs)
+        y = x.spawn(1)[0]
+        self.assertEqual(run_forked(get_numbers), get_numbers())
+
+    def test_get_new_numbers__threads(self):
+
+        x = an.AccountNumberGeneratorRandom(**self.kwargs)
+
+        def get_prefixes():
+            numbers = [x.get_new_number() for _ in range(100)]
+            for _ in range(100):
+                numbers += x.get_new_numbers(8)
+            return [_.get_account_number()[0] for _ in numbers]
+
+        self.assertEqual(
+            {'1': 19200, '2': 19200, '3': 19200},
+            Counter(run_threads(get_prefixes, 64)))
+        self.assertEqual(57600, x.get_counter())
+
+        temp_kwargs = copy.copy(self.kwargs)
+        temp_kwargs['unique'] = True
+        x = an.AccountNumberGeneratorRandom(**temp_kwargs)
+        numbers = run_threads(
+            lambda: [_.get_account_number() for _ in x.get_new_numbers(300)],
+            64)
+        self.assertEqual(19200, len(set(numbers)))
+
+    def test_get_new_numbers__batch(self):
+
+        x = an.AccountNumberGeneratorRandom(**self.kwargs)
+        y = an.AccountNumberGeneratorRandom(**self.kwargs)
+        for count in (0, 1, 2, 3, 100):
+            x._random.seed(count)
+            account_numbers = x.get_new_numbers(count)
+            y._random.seed(count)
+            batch = y.get_new_numbers(count, batch=True)
+            self.assertIsInstance(batch, an.AccountNumberBatch)
+            self.assertEqual(
+                [str(_) for _ in account_numbers], [str(_) for _ in batch])
+            self.assertEqual(x.get_counter(), y.get_counter())
+            for account_number in account_numbers:
+                self.assertEqual(16, len(account_number.get_account_number()))
+
+    def test_get_new_number__unique(self):
+
+        temp_kwargs = copy.copy(self.kwargs)
+        temp_kwargs.update(length=4, prefixes=('1', '22'), unique=True, seed=5)
+        x = an.AccountNumberGeneratorRandom(**temp_kwargs)
+
+        # Prefix '22' has 100 account numbers and prefix '1' has 1000, so
+        # round-robin selection runs out after 201 account numbers.
+        numbers = [x.get_new_number().get_account_number() for _ in range(201)]
+        self.assertEqual(201, len(set(numbers)))
+        self.assertEqual(['1', '2'] * 100 + ['1'], [_[0] for _ in numbers])
+        self.assertTrue(all(_.startswith('22') for _ in numbers[1::2]))
+        self.assertEqual(201, x.get_counter())
+        self.assertRaisesRegex(
+            HardException, "All 100 account numbers that start with '22'",
+            x.get_new_number)
+
+        # The same seed yields the same account numbers, and a generator
+        # resumes from a counter.
+        y = an.AccountNumberGeneratorRandom(**temp_kwargs)
+        y.set_counter(150)
+        self.assertEqual(
+            numbers[150:160],
+            [_.get_account_number() for _ in y.get_new_numbers(10)])
+
+        temp_kwargs['seed'] = 6
+        y = an.AccountNumberGeneratorRandom(**temp_kwargs)
+        self.assertNotEqual(
+            numbers[:10],
+            [y.get_new_number().get_account_number() for _ in range(10)])
+
+        msg = 'The generator is not in unique mode'
+        self.assertRaisesRegex(
+            AssertionError, '^' + re.escape(msg) + '$',
+            an.AccountNumberGeneratorRandom(**self.kwargs).set_counter, 1)
+
+    def test_get_new_number__unique_overlap(self):
+
+        # Prefixes that repeat or start one another would draw from the same
+        # account numbers.
+        temp_kwargs = copy.copy(self.kwargs)
+        temp_kwargs.update(length=3, unique=True, seed=1)
+        for prefixes, first, second in (
+                (('4', '4'), '4', '4'),
+                (('45', '4'), '4', '45'),
+                (('1', '45', '2', '456'), '45', '456')):
+            temp_kwargs['prefixes'] = prefixes
+            msg = "You must provide prefixes that do not overlap in unique " \
+                "mode: '{}' and '{}'".format(first, second)
+            self.assertRaisesRegex(
+                AssertionError, '^' + re.escape(msg) + '$',
+                an.AccountNumberGeneratorRandom, **temp_kwargs)
+
+        # Outside unique mode prefixes may overlap.
+        temp_kwargs.update(prefixes=('4', '45'), unique=False)
+        an.AccountNumberGeneratorRandom(**temp_kwargs)
+
+        # Prefixes that do not overlap yield every account number once.
+        temp_kwargs.update(prefixes=('4', '5', '6'), unique=True)
+        x = an.AccountNumberGeneratorRandom(**temp_kwargs)
+        self.assertEqual(
+            300, len({_.get_account_number() for _ in x.get_new_numbers(300)}))
+
+    def test_get_new_number__seed(self):
+
+        temp_kwargs = copy.copy(self.kwargs)
+        temp_kwargs['seed'] = 5
+        x = an.AccountNumberGeneratorRandom(**temp_kwargs)
+        y = an.AccountNumberGeneratorRandom(**temp_kwargs)
+
+        # The private random number generator ignores the random module.
+        numbers = [x.get_new_number().get_account_number() for _ in range(5)]
+        random.seed(1)
+        self.assertEqual(
+            numbers,
+            [y.get_new_number().get_account_number() for _ in range(5)])
+        self.assertEqual(
+            [_.get_account_number() for _ in x.get_new_numbers(20)],
+            [_.get_account_number() for _ in y.get_new_numbers(20)])
+
+        temp_kwargs['seed'] = 6
+        y = an.AccountNumberGeneratorRandom(**temp_kwargs)
+        self.assertNotEqual(
+            numbers,
+            [y.get_new_number().get_account_number() for _ in range(5)])
+
+    def test_spawn(self):
+
+        temp_kwargs = copy.copy(self.kwargs)
+        temp_kwargs['seed'] = 5
+        x = an.AccountNumberGeneratorRandom(**temp_kwargs)
+        children = x.spawn(3)
+        self.assertEqual(3, len(children))
+        self.assertTrue(all(
+            type(_) is an.AccountNumberGeneratorRandom for _ in children))
+
+        # A seeded generator spawns the same children every time, and each
+        # child draws its own sequence.
+        numbers = [
+            [_.get_account_number() for _ in child.get_new_numbers(10)]
+            for child in children]
+        y = an.AccountNumberGeneratorRandom(**temp_kwargs)
+        self.assertEqual(
+            numbers,
+            [[_.get_account_number() for _ in child.get_new_numbers(10)]
+             for child in y.spawn(3)])
+        self.assertEqual(30, len(set(sum(numbers, []))))
+
+        msg = 'You must provide a count > 0'
+        self.assertRaisesRegex(
+            AssertionError, '^' + re.escape(msg) + '$', x.spawn, 0)
+
+    def test_spawn__unique(self):
+
+        temp_kwargs = copy.copy(self.kwargs)
+        temp_kwargs.update(length=4, prefixes=('1', '22'), unique=True, seed=5)
+        x = an.AccountNumberGeneratorRandom(**temp_kwargs)
+        expected = [x.get_new_number().get_account_number() for _ in range(201)]
+
+        # The children split the counters that the parent has not used, so
+        # together they return the parent's sequence.
+        x = an.AccountNumberGeneratorRandom(**temp_kwargs)
+        numbers = [x.get_new_number().get_account_number() for _ in range(21)]
+        children = x.spawn(4)
+        self.assertEqual([21, 66, 111, 156], [_.get_counter() for _ in children])
+        self.assertRaisesRegex(
+            HardException, 'The generator has used every counter', x.get_new_number)
+        for child in children:
+            numbers += [_.get_account_number() for _ in child.get_new_numbers(45)]
+            self.assertRaisesRegex(
+                HardException, 'The generator has used every counter',
+                child.get_new_number)
+        self.assertEqual(expected, numbers)
+
+        # A child can spawn grandchildren within its own range.
+        x = an.AccountNumberGeneratorRandom(**temp_kwargs)
+        grandchildren = x.spawn(2)[1].spawn(2)
+        self.assertEqual([100, 150], [_.get_counter() for _ in grandchildren])
+        self.assertEqual(
+            expected[150:201],
+            [_.get_account_number() for _ in grandchildren[1].get_new_numbers(51)])
+
+    def test_set_weights(self):
+
+        temp_kwargs = copy.copy(self.kwargs)
+        temp_kwargs.update(seed=5, weights=(70, 28, 2))
+        x = an.AccountNumberGeneratorRandom(**temp_kwargs)
+        self.assertEqual((0.7, 0.28, 0.02), x.get_weights())
+        self.assertEqual(
+            "AccountNumberGeneratorRandom: 3 prefixes weighted '1' 70.0%, "
+            "'22' 28.0%, '333' 2.0%", str(x))
+
+        # One at a time and in bulk, the prefixes follow the weights.
+        numbers = [x.get_new_number() for _ in range(10000)]
+        numbers += x.get_new_numbers(40000)
+        counts = Counter(_.get_account_number()[0] for _ in numbers)
+        self.assertAlmostEqual(0.70, counts['1'] / 50000, places=2)
+        self.assertAlmostEqual(0.28, counts['2'] / 50000, places=2)
+        self.assertAlmostEqual(0.02, counts['3'] / 50000, places=2)
+        self.assertTrue(all(
+            _.get_account_number().startswith(
+                self.prefixes[int(_.get_account_number()[0]) - 1])
+            for _ in numbers))
+        self.assertEqual(0, x.get_counter())
+
+        # The weights change at runtime, and None restores round robin.
+        x.set_weights((0, 1, 0))
+        self.assertEqual(
+            {'22'}, {_.get_account_number()[:2] for _ in x.get_new_numbers(50)})
+        x.set_weights(None)
+        self.assertIsNone(x.get_weights())
+        self.assertEqual(
+            ['1', '2', '3'],
+            [_.get_account_number()[0] for _ in x.get_new_numbers(3)])
+
+        msg = 'You must provide one weight per prefix'
+        self.assertRaisesRegex(
+            AssertionError, '^' + re.escape(msg) + '$', x.set_weights, (1, 2))
+
+        temp_kwargs['unique'] = True
+        msg = 'You cannot weight the prefixes of a unique generator'
+        self.assertRaisesRegex(
+            AssertionError, '^' + re.escape(msg) + '$',
+            an.AccountNumberGeneratorRandom, **temp_kwargs)
+
+    def test__get_random_digits(self):
+
+        x = an.AccountNumberGeneratorRandom(**self.kwargs)
+        for count, length in ((0, 5), (3, 0), (1000, 1), (250, 19), (3, 500)):
+            strings = x._get_random_digits(count, length)
+            self.assertEqual(count, len(strings))
+            self.assertTrue(all(len(_) == length for _ in strings))
+            self.assertTrue(all(_.isdigit() for _ in strings if _))
+
+        # Every digit turns up in every position.
+        strings = x._get_random_digits(1000, 4)
+        for i in range(4):
+            self.assertEqual(10, len(set(_[i] for _ in strings)))
+
 
 ###############################################################################
 # TEST AccountNumberGeneratorRandomLuhn
@@ -831,8 +1798,12 @@ class TestAccountNumberGeneratorRandomLuhn(unittest.TestCase):
     @mock.patch(PATCH_RANDOM)
     def test_get_new_number(self, mock_random):
 
+        # The generator draws from its private random.Random.
+        mock_random.Random.return_value = mock_random
         mock_random.randint.side_effect = [_ % 10 for _ in range(200)]
 
+        # The generator draws only the digits between the prefix and the
+        # checksum digit.
         x = an.AccountNumberGeneratorRandomLuhn(**self.kwargs)
 
         # In our 'extected' account numbers we use a '#' as a placeholder
@@ -844,13 +1815,151 @@ class TestAccountNumberGeneratorRandomLuhn(unittest.TestCase):
         self.assertEqual(account_number, expected)
 
         account_number = x.get_new_number()
-        expected = an.AccountNumberLuhn('225678901234567#', 'BDN', 'BN', '679', '680', 3, self.masker, 'RN', False)
+        expected = an.AccountNumberLuhn('224567890123456#', 'BDN', 'BN', '561', '562', 3, self.masker, 'RN', False)
         self.assertEqual(account_number, expected)
 
         account_number = x.get_new_number()
-        expected = an.AccountNumberLuhn('333901234567890#', 'BDN', 'BN', '909', '910', 3, self.masker, 'RN', False)
+        expected = an.AccountNumberLuhn('333789012345678#', 'BDN', 'BN', '784', '785', 3, self.masker, 'RN', False)
         self.assertEqual(account_number, expected)
 
         account_number = x.get_new_number()
-        expected = an.AccountNumberLuhn('123456789012345#', 'BDN', 'BN', '452', '453', 3, self.masker, 'RN', False)
+        expected = an.AccountNumberLuhn('190123456789012#', 'BDN', 'BN', '127', '128', 3, self.masker, 'RN', False)
         self.assertEqual(account_number, expected)
+
+        # The generator keeps its own prefix checksums out of the shared
+        # prefix cache.
+        la.clear_prefix_cache()
+        x.get_new_number()
+        self.assertNotIn('22', la._prefix_cache)
+
+    @mock.patch(PATCH_RANDOM)
+    def test_get_new_number__long_prefix(self, mock_random):
+
+        mock_random.Random.return_value = mock_random
+        temp_kwargs = copy.copy(self.kwargs)
+        temp_kwargs['prefixes'] = ('4588883200009199',)
+        x = an.AccountNumberGeneratorRandomLuhn(**temp_kwargs)
+
+        account_number = x.get_new_number()
+        self.assertEqual('4588883200009190', account_number.get_account_number())
+        self.assertIsInstance(account_number, an.AccountNumberLuhn)
+        mock_random.randint.assert_not_called()
+
+    def test_get_new_numbers__weights(self):
+
+        temp_kwargs = copy.copy(self.kwargs)
+        temp_kwargs['weights'] = (1, 0, 1)
+        x = an.AccountNumberGeneratorRandomLuhn(**temp_kwargs)
+        numbers = [x.get_new_number() for _ in range(50)]
+        numbers += x.get_new_numbers(50)
+        self.assertEqual(
+            {'1', '3'}, {_.get_account_number()[0] for _ in numbers})
+        self.assertTrue(all(
+            la.verify_checksum(_.get_account_number()) for _ in numbers))
+
+    def test__get_next_number(self):
+
+        x = an.AccountNumberGeneratorRandomLuhn(**self.kwargs)
+        for _ in range(30):
+            number = x._get_next_number()
+            self.assertEqual(16, len(number))
+            self.assertTrue(la.verify_checksum(number))
+
+    @mock.patch(PATCH_RANDOM)
+    def test_get_new_numbers(self, mock_random):
+
+        # The generator draws from its private random.Random.
+        mock_random.Random.return_value = mock_random
+        mock_random.randrange.return_value = 0
+
+        x = an.AccountNumberGeneratorRandomLuhn(**self.kwargs)
+
+        account_numbers = x.get_new_numbers(4)
+        self.assertEqual(
+            [an.AccountNumberLuhn('100000000000000#', 'BDN', 'BN', '008', '009', 3, self.masker, 'RN', False),
+             an.AccountNumberLuhn('220000000000000#', 'BDN', 'BN', '004', '005', 3, self.masker, 'RN', False),
+             an.AccountNumberLuhn('333000000000000#', 'BDN', 'BN', '005', '006', 3, self.masker, 'RN', False),
+             an.AccountNumberLuhn('100000000000000#', 'BDN', 'BN', '008', '009', 3, self.masker, 'RN', False)],
+            account_numbers)
+        for account_number in account_numbers:
+            self.assertIs(an.AccountNumberLuhn, type(account_number))
+
+        temp_kwargs = copy.copy(self.kwargs)
+        temp_kwargs['prefixes'] = ('4588883200009199',)
+        x = an.AccountNumberGeneratorRandomLuhn(**temp_kwargs)
+        self.assertEqual(
+            ['4588883200009190'] * 2,
+            x.get_new_numbers(2, batch=True).get_account_numbers())
+
+    def test_get_new_number__unique(self):
+
+        temp_kwargs = copy.copy(self.kwargs)
+        temp_kwargs.update(
+            length=5, prefixes=('3', '601', '4588883200009199'), unique=True,
+            seed=5)
+        x = an.AccountNumberGeneratorRandomLuhn(**temp_kwargs)
+
+        numbers = [_.get_account_number() for _ in x.get_new_numbers(3)]
+        self.assertEqual('4588883200009190', numbers[2])
+        x.get_new_numbers(2)
+        self.assertRaises(HardException, x.get_new_number)
+
+        temp_kwargs['prefixes'] = ('4', '601')
+        x = an.AccountNumberGeneratorRandomLuhn(**temp_kwargs)
+        numbers = [x.get_new_number().get_account_number() for _ in range(20)]
+        self.assertEqual(20, len(set(numbers)))
+        self.assertTrue(all(map(la.verify_checksum, numbers)))
+        self.assertTrue(all(len(_) == 5 for _ in numbers))
+        self.assertTrue(all(_.startswith('601') for _ in numbers[1::2]))
+        x.get_new_number()
+        self.assertRaises(HardException, x.get_new_number)
+
+        # The checksum digit replaces the last digit of a prefix that fills
+        # the length, so such prefixes overlap if they differ only there.
+        temp_kwargs['prefixes'] = ('45881', '45882')
+        msg = "You must provide prefixes that do not overlap in unique " \
+            "mode: '45881' and '45882'"
+        self.assertRaisesRegex(
+            AssertionError, '^' + re.escape(msg) + '$',
+            an.AccountNumberGeneratorRandomLuhn, **temp_kwargs)
+
+    def test_get_new_numbers__batch(self):
+
+        x = an.AccountNumberGeneratorRandomLuhn(**self.kwargs)
+        y = an.AccountNumberGeneratorRandomLuhn(**self.kwargs)
+        for count in (0, 1, 5, 100):
+            x._random.seed(count)
+            account_numbers = x.get_new_numbers(count)
+            y._random.seed(count)
+            batch = y.get_new_numbers(count, batch=True)
+            self.assertEqual(
+                [str(_) for _ in account_numbers], [str(_) for _ in batch])
+            for account_number in account_numbers:
+                self.assertTrue(
+                    la.verify_checksum(account_number.get_account_number()))
+
+
+###############################################################################
+# TEST _Counter
+###############################################################################
+
+class TestCounter(unittest.TestCase):
+
+    def test_take(self):
+
+        x = an._Counter(7)
+        self.assertEqual(7, x.peek())
+        self.assertEqual(7, x.take())
+        self.assertEqual(8, x.take(5))
+        self.assertEqual(13, x.peek())
+        self.assertEqual(13, x.take())
+        self.assertEqual(14, x.peek())
+
+    def test_take__threads(self):
+
+        # Once the threads finish, the counter knows its next value exactly.
+        x = an._Counter()
+        values = run_threads(
+            lambda: [x.take(_ % 3 + 1) for _ in range(1000)], 32)
+        self.assertEqual(32000, len(set(values)))
+        self.assertEqual(32 * (334 * 1 + 333 * 2 + 333 * 3), x.peek())
@@ -0,0 +1,44 @@
+"""
+Created on October 17, 2026
+"""
+
+import io
+import unittest
+from contextlib import redirect_stdout
+
+from kojak.core.utilities import account_number as an
+from kojak.core.utilities import account_number_benchmark as anb
+
+
+###############################################################################
+# TEST MODULE
+###############################################################################
+
+class Test(unittest.TestCase):
+
+    # =========================================================================
+    # METHOD - main
+    # =========================================================================
+
+    def test_main(self):
+        with redirect_stdout(io.StringIO()) as output:
+            self.assertEqual(0, anb.main(['--count', '100']))
+        self.assertEqual(
+            ['AccountNumber', 'AccountNumberMasker'],
+            [_.split()[0] for _ in output.getvalue().splitlines()])
+
+    # =========================================================================
+    # METHOD - run_benchmarks
+    # =========================================================================
+
+    def test_run_benchmarks(self):
+        results = anb.run_benchmarks(1000)
+        for sizes in results.values():
+            self.assertLess(sizes['slots'], sizes['dict'])
+
+    def test__get_unslotted_class(self):
+        cls = anb._get_unslotted_class(an.AccountNumberMasker)
+        x = cls(6, 4, '#')
+        self.assertEqual({'_first_m': 6, '_last_n': 4, '_mask_character': '#'},
+                         vars(x))
+        self.assertEqual('123456######3456', x.mask_number('1234567890123456'))
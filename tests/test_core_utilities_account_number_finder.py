@@ -0,0 +1,108 @@
+"""
+Created on October 17, 2026
+"""
+
+import gzip
+import os
+import tempfile
+import unittest
+
+from kojak.core.utilities import account_number as an
+from kojak.core.utilities.account_number_finder import AccountNumberFinder
+
+MASKER = an.AccountNumberMasker()
+
+ACCOUNTS = (
+    an.AccountNumber('4588883200009190', masker=MASKER),
+    an.AccountNumber('4588111100009190', masker=MASKER),
+    an.AccountNumber('4111111111111111', masker=an.AccountNumberMasker(
+        6, 4, 'X')),
+    an.AccountNumber('378282246310005'),
+)
+
+LINES = [
+    'card=4588883200009190 ok\n',
+    'card=4588********9190 masked\n',
+    'card=411111XXXXXX1111 and 378282246310005\n',
+    'card=94111111111111111 is not 4111111111111111\n',
+]
+
+
+###############################################################################
+# TEST AccountNumberFinder
+###############################################################################
+
+class TestAccountNumberFinder(unittest.TestCase):
+
+    # =========================================================================
+    # METHOD - CONSTRUCTOR
+    # =========================================================================
+
+    def test_CONSTRUCTOR(self):
+        x = AccountNumberFinder(ACCOUNTS)
+        self.assertEqual(4, len(x))
+        self.assertEqual(
+            'AccountNumberFinder: 4 account numbers in 6 forms', str(x))
+        self.assertEqual([], AccountNumberFinder([]).find(LINES[0]))
+
+    # =========================================================================
+    # METHOD - find
+    # =========================================================================
+
+    def test_find(self):
+        x = AccountNumberFinder(ACCOUNTS)
+        self.assertEqual([(5, ACCOUNTS[0], False)], x.find(LINES[0]))
+
+        # A masked form may stand for more than one account number.
+        self.assertEqual(
+            [(5, ACCOUNTS[0], True), (5, ACCOUNTS[1], True)],
+            x.find(LINES[1]))
+        self.assertEqual(
+            [(5, ACCOUNTS[2], True), (26, ACCOUNTS[3], False)],
+            x.find(LINES[2]))
+
+        # An occurrence may not touch another digit.
+        self.assertEqual([(30, ACCOUNTS[2], False)], x.find(LINES[3]))
+
+    def test_find__mask_characters(self):
+        x = AccountNumberFinder(ACCOUNTS[:1])
+
+        # An occurrence may touch mask characters.
+        self.assertEqual(
+            [(4, ACCOUNTS[0], True), (21, ACCOUNTS[0], False)],
+            x.find('****4588********9190*4588883200009190'))
+
+    # =========================================================================
+    # METHOD - find_in_lines
+    # =========================================================================
+
+    def test_find_in_lines(self):
+        x = AccountNumberFinder(ACCOUNTS)
+        self.assertEqual(
+            [(1, 5, ACCOUNTS[0], False),
+             (2, 5, ACCOUNTS[0], True),
+             (2, 5, ACCOUNTS[1], True),
+             (3, 5, ACCOUNTS[2], True),
+             (3, 26, ACCOUNTS[3], False),
+             (4, 30, ACCOUNTS[2], False)],
+            list(x.find_in_lines(LINES)))
+
+    def test_find_in_file(self):
+        x = AccountNumberFinder(ACCOUNTS)
+        with tempfile.TemporaryDirectory() as directory:
+            for name, opener in (('log.txt', open), ('log.txt.gz', gzip.open)):
+                path = os.path.join(directory, name)
+                with opener(path, 'wb') as file:
+                    file.write(''.join(LINES).encode() + b'\xff\n')
+                self.assertEqual(
+                    list(x.find_in_lines(LINES)), list(x.find_in_file(path)))
+
+    # =========================================================================
+    # METHOD - find_missing
+    # =========================================================================
+
+    def test_find_missing(self):
+        x = AccountNumberFinder(ACCOUNTS)
+        self.assertEqual([], x.find_missing(LINES))
+        self.assertEqual(
+            [ACCOUNTS[1], ACCOUNTS[3]], x.find_missing(LINES[:1] + LINES[3:]))
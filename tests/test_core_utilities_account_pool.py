@@ -0,0 +1,245 @@
+"""
+Created on October 17, 2026
+"""
+
+import os
+import re
+import tempfile
+import unittest
+from collections import Counter
+
+from kojak.core.exceptions import HardException
+from kojak.core.utilities import account_number as an
+from kojak.core.utilities import account_pool as ap
+
+MASKER = an.AccountNumberMasker()
+
+ACCOUNTS = (
+    an.AccountNumber('4588883200009190', 'BDN', 'BN', cvv='123',
+                     masker=MASKER, routing_number='021000021'),
+    an.AccountNumber('4111111111111111', 'BDN', 'BN', cvv='4567',
+                     cvv_bad='0000', masker=MASKER, use_bad_cvv=True),
+    an.AccountNumber('1234567890123456789', 'BDN', 'BN', masker=MASKER),
+)
+
+
+###############################################################################
+# TEST AccountPool
+###############################################################################
+
+class TestAccountPool(unittest.TestCase):
+
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp()
+        os.close(handle)
+        with ap.AccountPoolWriter(self.path, 'BDN', 'BN') as writer:
+            self.assertEqual(3, writer.write_all(ACCOUNTS))
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_CONSTRUCTOR(self):
+
+        with ap.AccountPool(self.path, MASKER) as pool:
+            self.assertEqual(3, len(pool))
+            self.assertEqual('BDN', pool.get_bank_display_name())
+            self.assertEqual('BN', pool.get_bank_name())
+
+        # The records follow a 33-byte header.
+        self.assertEqual(33 + 3 * 38, os.path.getsize(self.path))
+
+    def test_CONSTRUCTOR__bad_file(self):
+
+        with open(self.path, 'r+b') as file:
+            file.write(b'NOTAPOOL')
+        self.assertRaisesRegex(
+            HardException, 'is not an account pool file',
+            ap.AccountPool, self.path)
+
+        with open(self.path, 'r+b') as file:
+            file.write(ap.POOL_MAGIC)
+            file.seek(0, os.SEEK_END)
+            file.truncate(file.tell() - 1)
+        self.assertRaisesRegex(
+            HardException, re.escape('holds 146 bytes but 3 records need 147'),
+            ap.AccountPool, self.path)
+
+    def test_CONSTRUCTOR__empty_file(self):
+
+        open(self.path, 'wb').close()
+        self.assertRaisesRegex(
+            HardException, 'is not an account pool file',
+            ap.AccountPool, self.path)
+
+    def test_CONSTRUCTOR__truncated_header(self):
+
+        with open(self.path, 'r+b') as file:
+            file.truncate(30)
+        self.assertRaisesRegex(
+            HardException,
+            re.escape('has a header of 33 bytes in a file of 30'),
+            ap.AccountPool, self.path)
+
+        # The second bank name claims more bytes than the header holds.
+        with open(self.path, 'r+b') as file:
+            file.truncate(33)
+            file.seek(29)
+            file.write(b'\xff\x00')
+        self.assertRaisesRegex(
+            HardException, 'is not an account pool file or is truncated',
+            ap.AccountPool, self.path)
+
+        # The first bank name is not UTF-8.
+        with open(self.path, 'r+b') as file:
+            file.seek(26)
+            file.write(b'\xff')
+            file.seek(29)
+            file.write(b'\x02\x00')
+        self.assertRaisesRegex(
+            HardException, 'is not an account pool file or is truncated',
+            ap.AccountPool, self.path)
+
+    def test__getitem__(self):
+
+        with ap.AccountPool(self.path, MASKER) as pool:
+            self.assertEqual(list(ACCOUNTS), list(pool))
+            self.assertEqual(ACCOUNTS[2], pool[-1])
+            self.assertEqual('0000', pool[1].get_cvv())
+            self.assertEqual(4, pool[1].get_cvv_length())
+            self.assertIs(MASKER, pool[0].get_masker())
+            self.assertRaises(IndexError, pool.__getitem__, 3)
+
+        with ap.AccountPool(self.path, cls=an.AccountNumberLuhn) as pool:
+            self.assertIs(an.AccountNumberLuhn, type(pool[0]))
+            self.assertEqual('4588883200009190', pool[0].get_account_number())
+
+    def test__str__(self):
+
+        with ap.AccountPool(self.path) as pool:
+            self.assertEqual(
+                "AccountPool: 3 accounts in '{}'".format(self.path), str(pool))
+
+
+###############################################################################
+# TEST AccountPoolWriter
+###############################################################################
+
+class TestAccountPoolWriter(unittest.TestCase):
+
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp()
+        os.close(handle)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_write(self):
+
+        with ap.AccountPoolWriter(self.path, 'BDN', 'BN', 16, 3) as writer:
+            writer.write(ACCOUNTS[0])
+            self.assertRaisesRegex(
+                HardException,
+                re.escape("The CVV of account '4588********9190' does not fit "
+                          "a field of width 3"),
+                writer.write, an.AccountNumber(
+                    '4588883200009190', 'BDN', 'BN', cvv='1234',
+                    masker=MASKER))
+            self.assertRaisesRegex(
+                HardException,
+                re.escape("Account '4588********9190' does not belong to "
+                          "bank 'BDN'"),
+                writer.write, an.AccountNumber(
+                    '4588883200009190', 'X', 'BN', masker=MASKER))
+            self.assertEqual(1, writer.get_count())
+
+        with ap.AccountPool(self.path, MASKER) as pool:
+            self.assertEqual(1, len(pool))
+            self.assertEqual('021000021', pool[0].get_routing_number())
+
+    def test_write__empty(self):
+
+        ap.AccountPoolWriter(self.path).close()
+        with ap.AccountPool(self.path) as pool:
+            self.assertEqual(0, len(pool))
+            self.assertEqual('', pool.get_bank_name())
+
+    def test_CONSTRUCTOR(self):
+
+        msg = 'You must provide an account_number_width from 1 to 255'
+        self.assertRaisesRegex(
+            AssertionError, '^' + re.escape(msg) + '$',
+            ap.AccountPoolWriter, self.path, account_number_width=0)
+
+
+###############################################################################
+# TEST AccountNumberGeneratorPool
+###############################################################################
+
+class TestAccountNumberGeneratorPool(unittest.TestCase):
+
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp()
+        os.close(handle)
+        with ap.AccountPoolWriter(self.path, 'BDN', 'BN') as writer:
+            writer.write_all(ACCOUNTS)
+        self.pool = ap.AccountPool(self.path, MASKER)
+
+    def tearDown(self):
+        self.pool.close()
+        os.remove(self.path)
+
+    def test_CONSTRUCTOR(self):
+
+        with ap.AccountPoolWriter(self.path):
+            pass
+        with ap.AccountPool(self.path) as pool:
+            msg = 'You must provide a pool with at least one account'
+            self.assertRaisesRegex(
+                AssertionError, '^' + re.escape(msg) + '$',
+                ap.AccountNumberGeneratorPool, pool)
+
+    def test__str__(self):
+
+        x = ap.AccountNumberGeneratorPool(self.pool)
+        self.assertEqual(
+            "AccountNumberGeneratorPool: round robin over AccountPool: "
+            "3 accounts in '{}'".format(self.path), str(x))
+
+    def test_get_new_number(self):
+
+        x = ap.AccountNumberGeneratorPool(self.pool)
+        self.assertEqual(
+            list(ACCOUNTS) * 2, [x.get_new_number() for _ in range(6)])
+
+    def test_get_new_number__randomize(self):
+
+        x = ap.AccountNumberGeneratorPool(self.pool, randomize=True, seed=5)
+        y = ap.AccountNumberGeneratorPool(self.pool, randomize=True, seed=5)
+        numbers = [x.get_new_number().get_account_number()
+                   for _ in range(300)]
+        self.assertEqual(
+            numbers, [_.get_account_number() for _ in y.get_new_numbers(300)])
+        self.assertEqual(
+            {_.get_account_number() for _ in ACCOUNTS}, set(Counter(numbers)))
+
+    @unittest.skipUnless(hasattr(os, 'fork'), 'The platform cannot fork')
+    def test_get_new_number__fork(self):
+
+        # A forked process reseeds a generator that no caller seeded.
+        x = ap.AccountNumberGeneratorPool(self.pool, randomize=True)
+        read, write = os.pipe()
+        pid = os.fork()
+        if pid == 0:
+            try:
+                os.write(write, ' '.join(
+                    _.get_account_number()
+                    for _ in x.get_new_numbers(30)).encode('ascii'))
+            finally:
+                os._exit(0)
+        os.close(write)
+        with os.fdopen(read) as file:
+            child = file.read().split()
+        os.waitpid(pid, 0)
+        self.assertEqual(30, len(child))
+        self.assertNotEqual(
+            [_.get_account_number() for _ in x.get_new_numbers(30)], child)
@@ -0,0 +1,76 @@
+"""
+Created on October 17, 2026
+"""
+
+import random
+import re
+import unittest
+from collections import Counter
+
+from kojak.core.utilities.alias_table import AliasTable
+
+
+def get_probabilities(table):
+    """
+    Returns the probability of each index that an alias table implies,
+    rounded to 9 places.
+    """
+
+    probabilities = list(table._probabilities)
+    for index, alias in enumerate(table._aliases):
+        if alias != index:
+            probabilities[alias] += 1 - table._probabilities[index]
+    return [round(_ / len(table), 9) for _ in probabilities]
+
+
+###############################################################################
+# TEST AliasTable
+###############################################################################
+
+class TestAliasTable(unittest.TestCase):
+
+    # =========================================================================
+    # METHOD - CONSTRUCTOR
+    # =========================================================================
+
+    def test_CONSTRUCTOR(self):
+        x = AliasTable([7, 2, 1])
+        self.assertEqual(3, len(x))
+        self.assertEqual((0.7, 0.2, 0.1), x.get_weights())
+        self.assertEqual('AliasTable: 70.0%, 20.0%, 10.0%', str(x))
+
+        # The columns give each index its weight.
+        for weights in ([7, 2, 1], [1, 1, 1, 1], [0, 5, 0, 1, 3], [1]):
+            self.assertEqual(
+                [round(_ / sum(weights), 9) for _ in weights],
+                get_probabilities(AliasTable(weights)))
+
+        for weights, msg in (
+                ([], 'You must provide at least one weight'),
+                ([1, -1], 'You must provide weights >= 0'),
+                ([0, 0], 'You must provide at least one weight > 0')):
+            self.assertRaisesRegex(
+                AssertionError, '^' + re.escape(msg) + '$',
+                AliasTable, weights)
+
+    # =========================================================================
+    # METHOD - sample
+    # =========================================================================
+
+    def test_sample(self):
+        x = AliasTable([70, 28, 2, 0])
+        generator = random.Random(5)
+        counts = Counter(x.sample(generator) for _ in range(100000))
+        self.assertEqual(0, counts[3])
+        for index, weight in enumerate((0.70, 0.28, 0.02)):
+            self.assertAlmostEqual(weight, counts[index] / 100000, places=2)
+
+        self.assertEqual([0] * 5, [AliasTable([1]).sample(generator)
+                                   for _ in range(5)])
+
+    def test_sample_many(self):
+        x = AliasTable([70, 28, 2, 0])
+        indexes = x.sample_many(random.Random(5), 1000)
+        generator = random.Random(5)
+        self.assertEqual(indexes, [x.sample(generator) for _ in range(1000)])
+        self.assertEqual([], x.sample_many(generator, 0))
@@ -0,0 +1,170 @@
+"""
+Created on October 17, 2026
+"""
+
+import random
+import unittest
+
+from kojak.core.utilities import check_digit as cd
+from kojak.core.utilities import luhn_algorithm as la
+
+ENGINES = (cd.LUHN, cd.VERHOEFF, cd.DAMM, cd.MOD97_10)
+
+
+###############################################################################
+# TEST MODULE
+###############################################################################
+
+class Test(unittest.TestCase):
+
+    # Number strings of mixed lengths, including the empty string, for
+    # comparing the batch methods against the scalar methods.
+    random_number_strings = [
+        ''.join(random.choice('0123456789')
+                for _ in range(random.randint(0, 24)))
+        for _ in range(500)]
+
+    # =========================================================================
+    # METHOD - add_checksum
+    # =========================================================================
+
+    def test_add_checksum(self):
+        self.assertEqual('4588883200009190', cd.LUHN.add_checksum('458888320000919'))
+        self.assertEqual('2363', cd.VERHOEFF.add_checksum('236'))
+        self.assertEqual('12340', cd.VERHOEFF.add_checksum('1234'))
+        self.assertEqual('5724', cd.DAMM.add_checksum('572'))
+        self.assertEqual('12345676', cd.MOD97_10.add_checksum('123456'))
+
+        # IBAN GB82 WEST 1234 5698 7654 32, rearranged and converted to digits.
+        self.assertEqual(
+            '3214282912345698765432161182',
+            cd.MOD97_10.add_checksum('32142829123456987654321611'))
+
+        for engine in ENGINES:
+            self.assertEqual(
+                engine.get_check_digit(''), engine.add_checksum(None))
+            with self.assertRaises(ValueError):
+                engine.add_checksum('12a4')
+
+    def test_add_checksum_batch(self):
+        for engine in ENGINES:
+            self.assertEqual(
+                [engine.add_checksum(_) for _ in self.random_number_strings],
+                engine.add_checksum_batch(self.random_number_strings))
+            self.assertEqual([], engine.add_checksum_batch([]))
+            self.assertEqual(
+                [engine.add_checksum(None)],
+                engine.add_checksum_batch([None]))
+            with self.assertRaises(ValueError):
+                engine.add_checksum_batch(['1234', '12a4'])
+
+    def test_add_checksum_stream(self):
+        for engine in ENGINES:
+            self.assertEqual(
+                engine.add_checksum_batch(self.random_number_strings),
+                list(engine.add_checksum_stream(
+                    iter(self.random_number_strings), batch_size=7)))
+
+    # =========================================================================
+    # METHOD - get_check_digit
+    # =========================================================================
+
+    def test_get_check_digit(self):
+        for number_string in ('', '7', '79927398713', '4588883200009190'):
+            self.assertEqual(
+                str(la.get_check_digit(number_string)),
+                cd.LUHN.get_check_digit(number_string))
+        self.assertEqual('3', cd.VERHOEFF.get_check_digit('236'))
+        self.assertEqual('4', cd.DAMM.get_check_digit('572'))
+        self.assertEqual('76', cd.MOD97_10.get_check_digit('123456'))
+        self.assertEqual('98', cd.MOD97_10.get_check_digit(''))
+        self.assertEqual('04', cd.MOD97_10.get_check_digit('96'))
+
+    def test_get_check_digit_batch(self):
+        for engine in ENGINES:
+            self.assertEqual(
+                [engine.get_check_digit(_) for _ in self.random_number_strings],
+                engine.get_check_digit_batch(self.random_number_strings))
+
+            # Every number string of a batch has the same length.
+            number_strings = [_.zfill(16) for _ in self.random_number_strings]
+            self.assertEqual(
+                [engine.get_check_digit(_) for _ in number_strings],
+                engine.get_check_digit_batch(number_strings))
+
+    def test_get_check_digit_batch__luhn(self):
+        self.assertEqual(
+            [str(_) for _ in la.get_check_digit_batch(
+                self.random_number_strings)],
+            cd.LUHN.get_check_digit_batch(self.random_number_strings))
+
+    # =========================================================================
+    # METHOD - get_check_length
+    # =========================================================================
+
+    def test_get_check_length(self):
+        self.assertEqual(1, cd.LUHN.get_check_length())
+        self.assertEqual(1, cd.VERHOEFF.get_check_length())
+        self.assertEqual(1, cd.DAMM.get_check_length())
+        self.assertEqual(2, cd.MOD97_10.get_check_length())
+
+    # =========================================================================
+    # METHOD - set_checksum
+    # =========================================================================
+
+    def test_set_checksum(self):
+        self.assertEqual('4588883200009190', cd.LUHN.set_checksum('4588883200009199'))
+        self.assertEqual('2363', cd.VERHOEFF.set_checksum('2369'))
+        self.assertEqual('5724', cd.DAMM.set_checksum('5720'))
+        self.assertEqual('12345676', cd.MOD97_10.set_checksum('12345600'))
+        self.assertEqual('98', cd.MOD97_10.set_checksum('1'))
+        self.assertEqual('0', cd.DAMM.set_checksum(''))
+
+    # =========================================================================
+    # METHOD - verify_checksum
+    # =========================================================================
+
+    def test_verify_checksum(self):
+        for engine in ENGINES:
+            for number_string in self.random_number_strings:
+                self.assertTrue(
+                    engine.verify_checksum(engine.add_checksum(number_string)))
+
+        # Every engine catches every single-digit error.
+        for engine in ENGINES:
+            number_string = engine.add_checksum('4588883200009190')
+            for i, digit in enumerate(number_string):
+                for other in '0123456789'.replace(digit, ''):
+                    self.assertFalse(engine.verify_checksum(
+                        number_string[:i] + other + number_string[i + 1:]))
+
+        # Verhoeff and Damm catch every adjacent transposition.
+        for engine in (cd.VERHOEFF, cd.DAMM):
+            number_string = engine.add_checksum('0123456789')
+            for i in range(len(number_string) - 1):
+                self.assertFalse(engine.verify_checksum(
+                    number_string[:i] + number_string[i + 1]
+                    + number_string[i] + number_string[i + 2:]))
+
+        with self.assertRaises(ValueError):
+            cd.VERHOEFF.verify_checksum('2a63')
+
+    def test_verify_checksum_batch(self):
+        for engine in ENGINES:
+            self.assertEqual(
+                [engine.verify_checksum(_) for _ in self.random_number_strings],
+                engine.verify_checksum_batch(self.random_number_strings))
+            self.assertEqual(
+                [True] * len(self.random_number_strings),
+                engine.verify_checksum_batch(
+                    engine.add_checksum_batch(self.random_number_strings)))
+            self.assertEqual(
+                [engine.verify_checksum(None)],
+                engine.verify_checksum_batch([None]))
+
+    def test_verify_checksum_stream(self):
+        for engine in ENGINES:
+            self.assertEqual(
+                engine.verify_checksum_batch(self.random_number_strings),
+                list(engine.verify_checksum_stream(
+                    self.random_number_strings, batch_size=64)))
@@ -0,0 +1,57 @@
+"""
+Created on October 17, 2026
+"""
+
+import re
+import unittest
+
+from kojak.core.utilities.feistel_permutation import FeistelPermutation
+
+
+###############################################################################
+# TEST FeistelPermutation
+###############################################################################
+
+class TestFeistelPermutation(unittest.TestCase):
+
+    # =========================================================================
+    # METHOD - CONSTRUCTOR
+    # =========================================================================
+
+    def test_CONSTRUCTOR(self):
+        x = FeistelPermutation(1000, 42)
+        self.assertEqual(1000, len(x))
+        self.assertEqual('FeistelPermutation: size=1000', str(x))
+
+        msg = 'You must provide a size > 0'
+        self.assertRaisesRegex(
+            AssertionError, '^' + re.escape(msg) + '$',
+            FeistelPermutation, 0, 42)
+
+    # =========================================================================
+    # METHOD - __getitem__
+    # =========================================================================
+
+    def test___getitem__(self):
+        # Every size yields a permutation of its range.
+        for size in (1, 2, 3, 4, 5, 10, 16, 17, 100, 1000, 4097):
+            x = FeistelPermutation(size, 7)
+            self.assertEqual(list(range(size)), sorted(x[_] for _ in range(size)))
+
+        # The key selects the permutation, and the same key always selects
+        # the same permutation.
+        x = [FeistelPermutation(1000, 1)[_] for _ in range(1000)]
+        y = [FeistelPermutation(1000, 2)[_] for _ in range(1000)]
+        self.assertNotEqual(x, y)
+        self.assertEqual(x, [FeistelPermutation(1000, 1)[_] for _ in range(1000)])
+        self.assertNotEqual(list(range(1000)), x)
+
+        # Large sizes work too.
+        x = FeistelPermutation(10 ** 18, 3)
+        values = [x[_] for _ in range(1000)]
+        self.assertEqual(1000, len(set(values)))
+        self.assertTrue(all(0 <= _ < 10 ** 18 for _ in values))
+
+        x = FeistelPermutation(10, 7)
+        self.assertRaises(IndexError, x.__getitem__, 10)
+        self.assertRaises(IndexError, x.__getitem__, -1)
@@ -15,6 +15,10 @@ from kojak.core.utilities import luhn_algorithm as la
 
 class Test(unittest.TestCase):
 
+    def tearDown(self):
+        la.clear_prefix_cache()
+        la.set_prefix_cache_size(la.DEFAULT_PREFIX_CACHE_SIZE)
+
     # =========================================================================
     # METHOD - add_checksum
     # =========================================================================
@@ -78,6 +82,53 @@ class Test(unittest.TestCase):
     def test_add_prefix__value_error(self):
         self.assertRaises(ValueError, la.add_prefix, 'hello')
 
+    # =========================================================================
+    # METHOD - add_checksum with registered prefixes
+    # =========================================================================
+
+    def test_add_checksum__registered_prefix(self):
+        la.register_prefix('6006')
+        la.register_prefix('60064938')
+        self.assertEqual('6006493865249902504', la.add_checksum('600649386524990250'))
+        self.assertEqual('6006493865249902512', la.add_checksum('600649386524990251'))
+        self.assertEqual('60064938652499029', la.add_checksum('6006493865249902'))
+        self.assertEqual('600649388', la.add_checksum('60064938'))
+        self.assertEqual('60061', la.add_checksum('6006'))
+        self.assertEqual('6007', la.add_checksum('600'))
+        self.assertEqual('6006493865249902504', la.set_checksum('6006493865249902509'))
+        self.assertRaises(ValueError, la.add_checksum, '6006hello')
+
+    # =========================================================================
+    # METHOD - add_prefix_batch
+    # =========================================================================
+
+    def test_add_prefix_batch(self):
+        numbers = [None, '', '12345', '123456', '4588883200009190', '0']
+        for prefix in (None, '', '7', '77', '600649'):
+            self.assertEqual(
+                [la.add_prefix(prefix, _) for _ in numbers],
+                list(la.add_prefix_batch(prefix, numbers)))
+
+        # The results stream out of any iterable.
+        results = la.add_prefix_batch('77', iter(['12345', '123456']))
+        self.assertEqual('77412345', next(results))
+        self.assertEqual('778123456', next(results))
+        self.assertRaises(StopIteration, next, results)
+
+    def test_add_prefix_batch__value_error(self):
+        self.assertRaises(ValueError, la.add_prefix_batch, 'hello', ['12345'])
+
+    # =========================================================================
+    # METHOD - clear_prefix_cache
+    # =========================================================================
+
+    def test_clear_prefix_cache(self):
+        la.register_prefix('6006')
+        la.clear_prefix_cache()
+        self.assertEqual({}, dict(la._prefix_cache))
+        self.assertEqual((), la._prefix_cache_probes)
+        self.assertEqual('6006493865249902504', la.add_checksum('600649386524990250'))
+
     # =========================================================================
     # METHOD - get_check_digit
     # =========================================================================
@@ -108,9 +159,45 @@ class Test(unittest.TestCase):
         self.assertEqual(0, la.get_check_digit('81'))
         self.assertEqual(9, la.get_check_digit('91'))
 
+    def test_get_check_digit__buffer(self):
+        self.assertEqual(0, la.get_check_digit(b''))
+        self.assertEqual(8, la.get_check_digit(b'1'))
+        self.assertEqual(9, la.get_check_digit(bytearray(b'91')))
+        self.assertEqual(4, la.get_check_digit(memoryview(b'600649386524990250')))
+
+        buffer = b'PAN=600649386524990250;'
+        self.assertEqual(4, la.get_check_digit(buffer, 4, 18))
+        self.assertEqual(4, la.get_check_digit(buffer.decode(), 4, 18))
+
     def test_get_check_digit__value_error(self):
         self.assertRaises(ValueError, la.get_check_digit, 'hello')
 
+    # =========================================================================
+    # METHOD - get_check_digit_batch
+    # =========================================================================
+
+    def test_get_check_digit_batch(self):
+        self.assertEqual([], la.get_check_digit_batch([]))
+        self.assertEqual([0, 0], la.get_check_digit_batch([None, '']))
+
+        numbers = ['0', '1', '2', '3', '4', '5', '6', '7', '8', '9']
+        self.assertEqual(
+            [0, 8, 6, 4, 2, 9, 7, 5, 3, 1], la.get_check_digit_batch(numbers))
+
+        # Mixed lengths, including lengths that need more than one reduction.
+        numbers = [
+            '01', '91', '', '600649386524990250', '7', '1234567890' * 6]
+        self.assertEqual(
+            [la.get_check_digit(_) for _ in numbers],
+            la.get_check_digit_batch(numbers))
+
+        # Any iterable will do.
+        self.assertEqual([8, 7], la.get_check_digit_batch(iter(('01', '11'))))
+
+    def test_get_check_digit_batch__value_error(self):
+        self.assertRaises(ValueError, la.get_check_digit_batch, ['1', 'hello'])
+        self.assertRaises(ValueError, la.get_check_digit_batch, ['12', '-1'])
+
     # =========================================================================
     # METHOD - get_checksum
     # =========================================================================
@@ -141,8 +228,203 @@ class Test(unittest.TestCase):
         self.assertEqual(0, la.get_checksum('81'))
         self.assertEqual(1, la.get_checksum('91'))
 
+    def test_get_checksum__table_driven(self):
+        # The table-driven method must agree with the digit-by-digit method
+        # for every length, including number strings that span chunks.
+        for length in range(1, 80):
+            number = ''.join(str((_ * 7 + length) % 10) for _ in range(length))
+            for double_down in (True, False):
+                self.assertEqual(
+                    la._get_checksum_by_digit(number, double_down),
+                    la._get_checksum(number, double_down), number)
+
+        # Non-ASCII digits take the digit-by-digit path.
+        self.assertEqual(2, la.get_checksum('\u0661'))
+
+    def test_get_checksum__buffer(self):
+        self.assertEqual(0, la.get_checksum(b''))
+        self.assertEqual(9, la.get_checksum(b'9'))
+        self.assertEqual(1, la.get_checksum(bytearray(b'91')))
+        self.assertEqual(1, la.get_checksum(memoryview(b'91')))
+
+        buffer = bytearray(b'xx91yy')
+        self.assertEqual(1, la.get_checksum(buffer, 2, 2))
+        self.assertEqual(1, la.get_checksum(memoryview(buffer), 2, 2))
+        self.assertEqual(9, la.get_checksum(buffer[:3], 2))
+        self.assertEqual(1, la.get_checksum('xx91yy', 2, 2))
+        self.assertEqual(9, la.get_checksum('xx9', 2))
+        self.assertEqual(0, la.get_checksum(buffer, 2, 0))
+
     def test_get_checksum__value_error(self):
         self.assertRaises(ValueError, la.get_checksum, 'hello')
+        self.assertRaises(ValueError, la.get_checksum, b'hello')
+        self.assertRaises(ValueError, la.get_checksum, b'xx91yy', 1, 2)
+
+    # =========================================================================
+    # METHOD - get_correction_candidates
+    # =========================================================================
+
+    def test_get_correction_candidates(self):
+        self.assertEqual([], la.get_correction_candidates(''))
+        self.assertEqual(['0'], la.get_correction_candidates('5'))
+        self.assertEqual([], la.get_correction_candidates('0'))
+
+        self.assertEqual(['00', '18'], la.get_correction_candidates('10'))
+
+        # Substitutions come first, then transpositions.
+        candidates = la.get_correction_candidates('4588883200009191')
+        self.assertEqual(17, len(candidates))
+        self.assertEqual('8588883200009191', candidates[0])
+        self.assertEqual('4588883200009190', candidates[15])
+        self.assertEqual('4588882300009191', candidates[16])
+
+        # Compare against a trial-and-error search.
+        for number in ('4588883200009191', '601100000000000', '1234567890'):
+            expected = []
+            for i in range(len(number)):
+                for digit in '0123456789':
+                    candidate = number[:i] + digit + number[i+1:]
+                    if digit != number[i] and la.verify_checksum(candidate):
+                        expected.append(candidate)
+            for i in range(len(number) - 1):
+                candidate = number[:i] + number[i+1] + number[i] + number[i+2:]
+                if number[i] != number[i+1] and la.verify_checksum(candidate):
+                    expected.append(candidate)
+            self.assertEqual(expected, la.get_correction_candidates(number))
+
+    def test_get_correction_candidates__known_numbers(self):
+        known = {'4588883200009190', '4111111111111111'}
+        self.assertEqual(['4588883200009190'],
+                         la.get_correction_candidates('4588883200009191', known))
+        self.assertEqual(['4588883200009190'],
+                         la.get_correction_candidates('4588883200009910', known))
+        self.assertEqual([], la.get_correction_candidates('4588883200009191', set()))
+
+    def test_get_correction_candidates__value_error(self):
+        self.assertRaises(ValueError, la.get_correction_candidates, 'hello')
+
+    # =========================================================================
+    # METHOD - get_next_valid_number
+    # =========================================================================
+
+    def test_get_next_valid_number(self):
+        self.assertIsNone(la.get_next_valid_number(''))
+
+        self.assertIsNone(la.get_next_valid_number('0'))
+        self.assertIsNone(la.get_next_valid_number('9'))
+
+        self.assertEqual('18', la.get_next_valid_number('00'))
+        self.assertEqual('18', la.get_next_valid_number('17'))
+        self.assertEqual('26', la.get_next_valid_number('18'))
+        self.assertEqual('0026', la.get_next_valid_number('0020'))
+        self.assertEqual('4588883200009208',
+                         la.get_next_valid_number('4588883200009190'))
+        self.assertIsNone(la.get_next_valid_number('91'))
+        self.assertIsNone(la.get_next_valid_number('9999'))
+
+        # Compare against a trial-and-error search for every 3-digit string.
+        valid = [str(_).zfill(3) for _ in range(1000)
+                 if la.verify_checksum(str(_).zfill(3))]
+        for i in range(1000):
+            number = str(i).zfill(3)
+            expected = [_ for _ in valid if _ > number]
+            self.assertEqual(expected[0] if expected else None,
+                             la.get_next_valid_number(number))
+
+    def test_get_next_valid_number__value_error(self):
+        self.assertRaises(ValueError, la.get_next_valid_number, 'hello')
+
+    # =========================================================================
+    # METHOD - get_prefix_accumulator
+    # =========================================================================
+
+    def test_get_prefix_accumulator(self):
+        x = la.get_prefix_accumulator('4588')
+        self.assertEqual(['4588'], list(la._prefix_cache))
+        x.append('88320000919')
+        self.assertEqual(0, x.get_check_digit())
+
+        # The cached accumulator is unchanged.
+        y = la.get_prefix_accumulator('4588')
+        self.assertEqual(4, len(y))
+        self.assertEqual(la.get_check_digit('4588'), y.get_check_digit())
+
+        self.assertRaises(ValueError, la.get_prefix_accumulator, 'hello')
+
+    # =========================================================================
+    # METHOD - get_previous_valid_number
+    # =========================================================================
+
+    def test_get_previous_valid_number(self):
+        self.assertIsNone(la.get_previous_valid_number(''))
+
+        self.assertIsNone(la.get_previous_valid_number('0'))
+        self.assertEqual('0', la.get_previous_valid_number('9'))
+
+        self.assertIsNone(la.get_previous_valid_number('00'))
+        self.assertEqual('00', la.get_previous_valid_number('17'))
+        self.assertEqual('00', la.get_previous_valid_number('18'))
+        self.assertEqual('0018', la.get_previous_valid_number('0020'))
+        self.assertEqual('4588883200009182',
+                         la.get_previous_valid_number('4588883200009190'))
+
+        # Compare against a trial-and-error search for every 3-digit string.
+        valid = [str(_).zfill(3) for _ in range(1000)
+                 if la.verify_checksum(str(_).zfill(3))]
+        for i in range(1000):
+            number = str(i).zfill(3)
+            expected = [_ for _ in valid if _ < number]
+            self.assertEqual(expected[-1] if expected else None,
+                             la.get_previous_valid_number(number))
+
+    def test_get_previous_valid_number__value_error(self):
+        self.assertRaises(ValueError, la.get_previous_valid_number, 'hello')
+
+    # =========================================================================
+    # METHOD - iterate_valid_numbers
+    # =========================================================================
+
+    def test_iterate_valid_numbers(self):
+        self.assertEqual([], list(la.iterate_valid_numbers('', '')))
+        self.assertEqual(['0'], list(la.iterate_valid_numbers('0', '9')))
+        self.assertEqual([], list(la.iterate_valid_numbers('1', '9')))
+        self.assertEqual(['18', '26', '34'],
+                         list(la.iterate_valid_numbers('18', '34')))
+        self.assertEqual(['18', '26', '34'],
+                         list(la.iterate_valid_numbers('11', '41')))
+        self.assertEqual([], list(la.iterate_valid_numbers('34', '18')))
+
+        # Compare against a trial-and-error search over 4-digit ranges.
+        valid = [str(_).zfill(4) for _ in range(10000)
+                 if la.verify_checksum(str(_).zfill(4))]
+        for first, last in (('0000', '9999'), ('0123', '0124'),
+                            ('0127', '0990'), ('4567', '4588')):
+            self.assertEqual([_ for _ in valid if first <= _ <= last],
+                             list(la.iterate_valid_numbers(first, last)))
+
+        # The generator is lazy, so an enormous range costs nothing.
+        numbers = la.iterate_valid_numbers('4588880000000000', '4588889999999999')
+        self.assertEqual('4588880000000007', next(numbers))
+        self.assertEqual('4588880000000015', next(numbers))
+
+    def test_iterate_valid_numbers__value_error(self):
+        self.assertRaises(ValueError, la.iterate_valid_numbers, '12', '123')
+        self.assertRaises(ValueError, la.iterate_valid_numbers, 'he', '99')
+
+    # =========================================================================
+    # METHOD - register_prefix
+    # =========================================================================
+
+    def test_register_prefix(self):
+        x = la.register_prefix('4588')
+        self.assertIs(x, la.register_prefix('4588'))
+        la.register_prefix('45')
+        la.register_prefix('77')
+        self.assertEqual(['4588', '45', '77'], list(la._prefix_cache))
+        self.assertEqual((4, 2), la._prefix_cache_probes)
+
+        self.assertRaises(ValueError, la.register_prefix, 'hello')
+        self.assertNotIn('hello', la._prefix_cache)
 
     # =========================================================================
     # METHOD - set_checksum
@@ -177,6 +459,28 @@ class Test(unittest.TestCase):
     def test_set_checksum__value_error(self):
         self.assertRaises(ValueError, la.set_checksum, 'hello')
 
+    # =========================================================================
+    # METHOD - set_prefix_cache_size
+    # =========================================================================
+
+    def test_set_prefix_cache_size(self):
+        la.set_prefix_cache_size(2)
+        la.register_prefix('4588')
+        la.register_prefix('45')
+        la.register_prefix('4588')
+        la.register_prefix('601')
+        self.assertEqual(['4588', '601'], list(la._prefix_cache))
+        self.assertEqual((4, 3), la._prefix_cache_probes)
+
+        # Using a prefix makes it the most recently used.
+        la.add_checksum('45881')
+        la.register_prefix('77')
+        self.assertEqual(['4588', '77'], list(la._prefix_cache))
+
+        la.set_prefix_cache_size(0)
+        self.assertEqual([], list(la._prefix_cache))
+        self.assertEqual((), la._prefix_cache_probes)
+
     # =========================================================================
     # METHOD - verify_checksum
     # =========================================================================
@@ -211,5 +515,161 @@ class Test(unittest.TestCase):
         self.assertFalse(la.verify_checksum('10'))
         self.assertFalse(la.verify_checksum('118'))
 
+    def test_verify_checksum__buffer(self):
+        self.assertTrue(la.verify_checksum(b''))
+        self.assertTrue(la.verify_checksum(b'4588883200009190'))
+        self.assertTrue(la.verify_checksum(bytearray(b'919')))
+        self.assertFalse(la.verify_checksum(memoryview(b'118')))
+
+        buffer = memoryview(b'0000004588883200009190;118;')
+        self.assertTrue(la.verify_checksum(buffer, 6, 16))
+        self.assertFalse(la.verify_checksum(buffer, 23, 3))
+
     def test_verify_checksum__value_error(self):
         self.assertRaises(ValueError, la.verify_checksum, 'hello')
+        self.assertRaises(ValueError, la.verify_checksum, bytearray(b'hello'))
+
+    # =========================================================================
+    # METHOD - verify_checksum_batch
+    # =========================================================================
+
+    def test_verify_checksum_batch(self):
+        self.assertEqual([], la.verify_checksum_batch([]))
+        self.assertEqual([True, True], la.verify_checksum_batch([None, '']))
+
+        numbers = ['00', '18', '26', '34', '42', '59', '67', '75', '83', '91']
+        self.assertEqual([True] * 10, la.verify_checksum_batch(numbers))
+
+        numbers = ['018', '10', '919', '118', '6006493865249902504', '0']
+        self.assertEqual(
+            [True, False, True, False, True, True],
+            la.verify_checksum_batch(numbers))
+
+        numbers = [la.add_checksum(str(_) * 30) for _ in range(10)]
+        self.assertEqual([True] * 10, la.verify_checksum_batch(numbers))
+
+    def test_verify_checksum_batch__value_error(self):
+        self.assertRaises(ValueError, la.verify_checksum_batch, ['00', 'hello'])
+
+
+###############################################################################
+# TEST LuhnAccumulator
+###############################################################################
+
+class TestLuhnAccumulator(unittest.TestCase):
+
+    # =========================================================================
+    # METHOD - CONSTRUCTOR
+    # =========================================================================
+
+    def test_CONSTRUCTOR(self):
+        x = la.LuhnAccumulator()
+        self.assertEqual(0, len(x))
+        self.assertEqual(0, x.get_check_digit())
+        self.assertTrue(x.is_valid())
+
+        x = la.LuhnAccumulator('600649386524990250')
+        self.assertEqual(18, len(x))
+        self.assertEqual(4, x.get_check_digit())
+        self.assertEqual(6, x.get_checksum())
+        self.assertFalse(x.is_valid())
+
+        self.assertRaises(ValueError, la.LuhnAccumulator, 'hello')
+
+    def test__str__(self):
+        x = la.LuhnAccumulator('91')
+        self.assertEqual(
+            'LuhnAccumulator: length=2 check_digit=9 valid=True', str(x))
+
+    # =========================================================================
+    # METHOD - add_prefix
+    # =========================================================================
+
+    def test_add_prefix(self):
+        for prefix, number in (
+                ('7', '12345'), ('77', '12345'), ('7', '123456'),
+                ('77', '123456'), ('77', '4588883200009190')):
+            x = la.LuhnAccumulator(number)
+            digit = x.add_prefix(prefix)
+            expected = la.add_prefix(prefix, number)
+            self.assertEqual(expected, prefix + str(digit) + number)
+            self.assertEqual(len(expected), len(x))
+            self.assertEqual(la.verify_checksum(expected), x.is_valid())
+            self.assertEqual(la.get_check_digit(expected), x.get_check_digit())
+
+        x = la.LuhnAccumulator('12345')
+        self.assertIsNone(x.add_prefix(''))
+        self.assertIsNone(x.add_prefix(None))
+        self.assertEqual(5, len(x))
+
+    # =========================================================================
+    # METHOD - append / append_digit
+    # =========================================================================
+
+    def test_append(self):
+        x = la.LuhnAccumulator('6006')
+        x.append('49386')
+        x.append('524990250')
+        self.assertEqual(la.get_check_digit('600649386524990250'),
+                         x.get_check_digit())
+
+        self.assertRaises(ValueError, x.append, 'hello')
+
+    def test_append_digit(self):
+        number = '600649386524990250'
+        x = la.LuhnAccumulator()
+        for i, digit in enumerate(number):
+            x.append_digit(int(digit))
+            self.assertEqual(i + 1, len(x))
+            self.assertEqual(la.get_check_digit(number[:i + 1]),
+                             x.get_check_digit())
+            self.assertEqual(la.verify_checksum(number[:i + 1]), x.is_valid())
+
+        x.append_digit(4)
+        self.assertTrue(x.is_valid())
+
+    # =========================================================================
+    # METHOD - get_plain_checksum
+    # =========================================================================
+
+    def test_get_plain_checksum(self):
+        for number in ('', '7', '91', '600649386524990250', '4588883200009190'):
+            x = la.LuhnAccumulator(number)
+            self.assertEqual(
+                la.get_checksum(number + '0'), x.get_plain_checksum(), number)
+            self.assertEqual(x.is_valid(), x.get_plain_checksum() == 0)
+
+    # =========================================================================
+    # METHOD - copy
+    # =========================================================================
+
+    def test_copy(self):
+        x = la.LuhnAccumulator('4588')
+        y = x.copy()
+        y.append('88320000919')
+        self.assertEqual(4, len(x))
+        self.assertEqual(la.get_check_digit('4588'), x.get_check_digit())
+        self.assertEqual(0, y.get_check_digit())
+
+    # =========================================================================
+    # METHOD - prepend / prepend_digit
+    # =========================================================================
+
+    def test_prepend(self):
+        x = la.LuhnAccumulator('009190')
+        x.prepend('8883200')
+        x.prepend('458')
+        self.assertTrue(x.is_valid())
+        self.assertEqual(la.get_check_digit('4588883200009190'),
+                         x.get_check_digit())
+
+        self.assertRaises(ValueError, x.prepend, 'hello')
+
+    def test_prepend_digit(self):
+        number = '4588883200009190'
+        x = la.LuhnAccumulator()
+        for digit in reversed(number):
+            x.prepend_digit(int(digit))
+        self.assertEqual(16, len(x))
+        self.assertTrue(x.is_valid())
+        self.assertEqual(la.get_check_digit(number), x.get_check_digit())
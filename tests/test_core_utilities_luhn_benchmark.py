@@ -0,0 +1,102 @@
+"""
+Created on October 17, 2026
+"""
+
+import io
+import json
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+from kojak.core.utilities import luhn_algorithm as la
+from kojak.core.utilities import luhn_benchmark as lb
+
+
+def make_results(*times):
+    return {'results': [
+        {'benchmark': name, 'length': 16, 'batch_size': 1,
+         'ns_per_number': ns}
+        for name, ns in times]}
+
+
+###############################################################################
+# TEST MODULE
+###############################################################################
+
+class Test(unittest.TestCase):
+
+    # =========================================================================
+    # METHOD - compare_results
+    # =========================================================================
+
+    def test_compare_results(self):
+        baseline = make_results(
+            ('get_checksum', 100.0), ('add_prefix', 100.0),
+            ('set_checksum', 100.0))
+        results = make_results(
+            ('get_checksum', 109.0), ('add_prefix', 120.0),
+            ('verify_checksum', 500.0))
+        self.assertEqual(
+            [('add_prefix', 16, 1, 100.0, 120.0)],
+            lb.compare_results(results, baseline))
+        self.assertEqual(
+            [('get_checksum', 16, 1, 100.0, 109.0),
+             ('add_prefix', 16, 1, 100.0, 120.0)],
+            lb.compare_results(results, baseline, threshold=0.05))
+        self.assertEqual(
+            [], lb.compare_results(
+                results, baseline, thresholds={'add_prefix': 0.25}))
+
+    # =========================================================================
+    # METHOD - main
+    # =========================================================================
+
+    def test_main(self):
+        handle, path = tempfile.mkstemp()
+        os.close(handle)
+        try:
+            argv = ['--benchmarks', 'get_checksum,add_prefix',
+                    '--lengths', '8-9,19', '--batch-sizes', '2',
+                    '--repeat', '1', '--min-time', '0']
+            with redirect_stdout(io.StringIO()) as output:
+                self.assertEqual(0, lb.main(argv + ['--output', path]))
+            self.assertEqual(6, len(output.getvalue().splitlines()))
+            with open(path) as file:
+                self.assertEqual(6, len(json.load(file)['results']))
+
+            # Make the baseline impossibly fast so that every benchmark
+            # regresses.
+            with open(path) as file:
+                baseline = json.load(file)
+            for result in baseline['results']:
+                result['ns_per_number'] = 0.001
+            with open(path, 'w') as file:
+                json.dump(baseline, file)
+            with redirect_stdout(io.StringIO()) as output:
+                self.assertEqual(1, lb.main(argv + ['--baseline', path]))
+            self.assertEqual(6, output.getvalue().count('REGRESSION'))
+        finally:
+            os.remove(path)
+
+    # =========================================================================
+    # METHOD - run_benchmarks
+    # =========================================================================
+
+    def test_run_benchmarks(self):
+        results = lb.run_benchmarks(
+            lengths=[8, 19], batch_sizes=[1, 3], repeat=2, min_time=0)
+        self.assertEqual(
+            2 * 2 * len(lb.BENCHMARKS), len(results['results']))
+        self.assertEqual(
+            {'benchmark': 'get_checksum', 'length': 8, 'batch_size': 1},
+            {k: v for k, v in results['results'][0].items()
+             if k != 'ns_per_number'})
+        for result in results['results']:
+            self.assertGreater(result['ns_per_number'], 0)
+
+    def test__get_number_strings(self):
+        number_strings = lb._get_number_strings(19, 5)
+        self.assertEqual(number_strings, lb._get_number_strings(19, 5))
+        self.assertEqual([19] * 5, [len(_) for _ in number_strings])
+        self.assertTrue(all(map(la.verify_checksum, number_strings)))
@@ -0,0 +1,101 @@
+"""
+Created on October 17, 2026
+"""
+
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+from kojak.core.utilities import luhn_file_validator as lfv
+
+# Line 1 is valid, line 2 fails the LUHN check, line 3 is blank, line 4 has
+# a non-digit character, and line 5 is valid with a CRLF line ending.
+CONTENTS = b'4588883200009190\n4588883200009191\n\n45888832000091X0\n018\r\n91'
+
+
+###############################################################################
+# TEST MODULE
+###############################################################################
+
+class Test(unittest.TestCase):
+
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp()
+        with os.fdopen(handle, 'wb') as file:
+            file.write(CONTENTS)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    # =========================================================================
+    # METHOD - main
+    # =========================================================================
+
+    def test_main(self):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            self.assertEqual(1, lfv.main([self.path, '--max-invalid', '1']))
+        self.assertEqual(
+            '{0}:2: invalid account number at byte offset 17\n'
+            '{0}: 6 lines, 3 valid, 2 invalid, 1 blank\n'.format(self.path),
+            output.getvalue())
+
+        with open(self.path, 'wb') as file:
+            file.write(b'018\n')
+        output = io.StringIO()
+        with redirect_stdout(output):
+            self.assertEqual(0, lfv.main([self.path]))
+        self.assertEqual(
+            '{}: 1 line, 1 valid, 0 invalid, 0 blank\n'.format(self.path),
+            output.getvalue())
+
+    # =========================================================================
+    # METHOD - validate_file
+    # =========================================================================
+
+    def test_validate_file(self):
+        report = lfv.validate_file(self.path)
+        self.assertEqual(self.path, report.get_path())
+        self.assertEqual(6, report.get_line_count())
+        self.assertEqual(3, report.get_valid_count())
+        self.assertEqual(2, report.get_invalid_count())
+        self.assertEqual(1, report.get_blank_count())
+        self.assertEqual([(2, 17), (4, 35)], report.get_invalid_lines())
+        self.assertFalse(report.is_valid())
+
+    def test_validate_file__chunks(self):
+        # Chunks of every size must cover every line exactly once.
+        for chunk_size in range(1, len(CONTENTS) + 2):
+            ranges = lfv._get_chunk_ranges(self.path, len(CONTENTS), chunk_size)
+            self.assertEqual(0, ranges[0][0])
+            self.assertEqual(len(CONTENTS), ranges[-1][1])
+            results = [lfv._validate_range(self.path, start, end, None)
+                       for start, end in ranges]
+            self.assertEqual(6, sum(_[0] for _ in results))
+            self.assertEqual(1, sum(_[1] for _ in results))
+            self.assertEqual(2, sum(_[2] for _ in results))
+
+    def test_validate_file__empty(self):
+        with open(self.path, 'wb'):
+            pass
+        report = lfv.validate_file(self.path, processes=2)
+        self.assertEqual(0, report.get_line_count())
+        self.assertTrue(report.is_valid())
+
+    def test_validate_file__max_invalid(self):
+        report = lfv.validate_file(self.path, max_invalid=1)
+        self.assertEqual(2, report.get_invalid_count())
+        self.assertEqual([(2, 17)], report.get_invalid_lines())
+
+        report = lfv.validate_file(self.path, max_invalid=0)
+        self.assertEqual(2, report.get_invalid_count())
+        self.assertEqual([], report.get_invalid_lines())
+
+    def test_validate_file__processes(self):
+        report = lfv.validate_file(self.path, processes=2, chunk_size=8)
+        self.assertEqual(6, report.get_line_count())
+        self.assertEqual(2, report.get_invalid_count())
+        self.assertEqual(1, report.get_blank_count())
+        self.assertEqual([(2, 17), (4, 35)], report.get_invalid_lines())
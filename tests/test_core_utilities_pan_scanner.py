@@ -0,0 +1,133 @@
+"""
+Created on October 17, 2026
+"""
+
+import gzip
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stdout
+
+from kojak.core.utilities import pan_scanner as ps
+from kojak.core.utilities.account_number import AccountNumberMasker
+
+# Lines 1, 2 and 5 hold PANs, line 3 holds a candidate that fails the LUHN
+# check, and line 4 holds a digit run that is too long to be a PAN.
+CONTENTS = \
+    b'order 4588883200009190 ok\n' \
+    b'card 4588 8832 0000 9190\n' \
+    b'id 4588883200009191\n' \
+    b'ts 20261017123456789012345\n' \
+    b'x4111-1111-1111-1111'
+
+FINDINGS = [
+    (6, '4588********9190'),
+    (31, '4588********9190'),
+    (99, '4111********1111'),
+]
+
+
+###############################################################################
+# TEST MODULE
+###############################################################################
+
+class Test(unittest.TestCase):
+
+    def setUp(self):
+        handle, self.path = tempfile.mkstemp()
+        with os.fdopen(handle, 'wb') as file:
+            file.write(CONTENTS)
+        self.gz_path = self.path + '.gz'
+        with gzip.open(self.gz_path, 'wb') as file:
+            file.write(CONTENTS)
+
+    def tearDown(self):
+        os.remove(self.path)
+        os.remove(self.gz_path)
+
+    # =========================================================================
+    # METHOD - main
+    # =========================================================================
+
+    def test_main(self):
+        output = io.StringIO()
+        with redirect_stdout(output):
+            self.assertEqual(
+                1, ps.main([self.path, '--max-findings', '1', '--first', '6']))
+        self.assertEqual(
+            '{0}: clear PAN 458888******9190 at byte offset 6\n'
+            '{0}: 118 bytes scanned, 4 candidates, 3 PANs\n'.format(self.path),
+            output.getvalue())
+
+        with open(self.path, 'wb') as file:
+            file.write(b'id 4588883200009191\n')
+        output = io.StringIO()
+        with redirect_stdout(output):
+            self.assertEqual(0, ps.main([self.path]))
+        self.assertEqual(
+            '{}: 20 bytes scanned, 1 candidate, 0 PANs\n'.format(self.path),
+            output.getvalue())
+
+    # =========================================================================
+    # METHOD - scan_file
+    # =========================================================================
+
+    def test_scan_file(self):
+        report = ps.scan_file(self.path)
+        self.assertEqual(self.path, report.get_path())
+        self.assertEqual(len(CONTENTS), report.get_byte_count())
+        self.assertEqual(4, report.get_candidate_count())
+        self.assertEqual(3, report.get_pan_count())
+        self.assertEqual(FINDINGS, report.get_findings())
+        self.assertFalse(report.is_clean())
+
+    def test_scan_file__chunk_size(self):
+        # Chunks of every size must find every PAN exactly once.
+        for chunk_size in range(1, len(CONTENTS) + 2):
+            report = ps.scan_file(self.path, chunk_size)
+            self.assertEqual(4, report.get_candidate_count())
+            self.assertEqual(FINDINGS, report.get_findings())
+
+    def test_scan_file__long_run(self):
+        # A run of digits and separators far longer than a chunk yields the
+        # same candidates whatever the chunk boundaries cut.
+        with open(self.path, 'wb') as file:
+            file.write(b'x ' + b'1234-5678-9012-345 ' * 300
+                       + b'4588 8832 0000 9190 4111 ' * 200 + b'x')
+        expected = ps.scan_file(self.path)
+        self.assertEqual(490, expected.get_candidate_count())
+        self.assertEqual(50, expected.get_pan_count())
+        for chunk_size in (1, 37, 38, 39, 100, 4095, 4096, 4097, 5000, 5003):
+            report = ps.scan_file(self.path, chunk_size)
+            self.assertEqual(
+                expected.get_candidate_count(), report.get_candidate_count(),
+                chunk_size)
+            self.assertEqual(
+                expected.get_findings(), report.get_findings(), chunk_size)
+
+    def test_scan_file__gz(self):
+        report = ps.scan_file(self.gz_path, chunk_size=10)
+        self.assertEqual(len(CONTENTS), report.get_byte_count())
+        self.assertEqual(FINDINGS, report.get_findings())
+
+    def test_scan_file__masker(self):
+        report = ps.scan_file(self.path, masker=AccountNumberMasker(0, 4, '#'))
+        self.assertEqual('############9190', report.get_findings()[0][1])
+
+    def test_scan_file__max_findings(self):
+        report = ps.scan_file(self.path, max_findings=2)
+        self.assertEqual(3, report.get_pan_count())
+        self.assertEqual(FINDINGS[:2], report.get_findings())
+
+    # =========================================================================
+    # METHOD - scan_files
+    # =========================================================================
+
+    def test_scan_files(self):
+        for processes in (1, 2):
+            reports = ps.scan_files([self.path, self.gz_path], processes)
+            self.assertEqual(
+                [self.path, self.gz_path], [_.get_path() for _ in reports])
+            self.assertEqual(
+                [FINDINGS, FINDINGS], [_.get_findings() for _ in reports])